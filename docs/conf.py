@@ -78,6 +78,7 @@ exclude_patterns = ['_build']
 
 intersphinx_mapping = {
     'dask': ('https://docs.dask.org/en/stable/', None),
+    'distributed': ('https://distributed.dask.org/en/stable/', None),
     'graphviz': ('https://graphviz.readthedocs.io/en/stable/', None),
     'jupyter': ('https://docs.jupyter.org/en/latest/', None),
     'mlflow': ('https://mlflow.org/docs/latest/', None),
@@ -85,6 +86,7 @@ intersphinx_mapping = {
     'openschema': ('https://openschema.readthedocs.io/en/latest/', None),
     'pandas': ('https://pandas.pydata.org/pandas-docs/stable/', None),
     'pip': ('https://pip.pypa.io/en/stable/', None),
+    'pyarrow': ('https://arrow.apache.org/docs/', None),
     'python': ('https://docs.python.org/3', None),
     'setuptools': ('https://setuptools.pypa.io/en/latest/', None),
     'sklearn': ('https://scikit-learn.org/stable/', None),
@@ -19,6 +19,7 @@
 ForML application model rollout strategy.
 """
 import abc
+import time
 import typing
 
 from forml.io import asset as assetmod
@@ -33,6 +34,12 @@ class Selector(abc.ABC):
     :class:`application.Generic <forml.application.Generic>` descriptors.
     """
 
+    _CACHED: frozenset[str] = frozenset({'_registry', '_instance'})
+    """Attributes holding the selection cached for the particular (process-local) registry instance."""
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        return {k: None if k in self._CACHED else v for k, v in self.__dict__.items()}
+
     @abc.abstractmethod
     def select(self, registry: 'asset.Directory', context: typing.Any, stats: 'runtime.Stats') -> 'asset.Instance':
         """Select the model instance to be used for serving the request.
@@ -70,10 +77,12 @@ class Explicit(Selector):
         self._project: typing.Union[str, 'asset.Project.Key'] = project
         self._release: typing.Union[str, 'asset.Release.Key'] = release
         self._generation: typing.Union[str, int, 'asset.Generation.Key'] = generation
+        self._registry: typing.Optional['asset.Directory'] = None
         self._instance: typing.Optional['asset.Instance'] = None
 
     def select(self, registry: 'asset.Directory', context: typing.Any, stats: 'runtime.Stats') -> 'asset.Instance':
-        if not self._instance:
+        if not self._instance or registry is not self._registry:
+            self._registry = registry
             self._instance = assetmod.Instance(
                 registry=registry,
                 project=self._project,
@@ -87,25 +96,34 @@ class Latest(Selector):
     """Model selection strategy choosing an instance of the most recent model release/generation.
 
     Attention:
-        Currently, the instance is cached indefinitely and so updates to the registry are not
-        dynamically reflected.
+        Unless the ``refresh`` interval is specified, the instance is cached indefinitely and so
+        updates to the registry are not dynamically reflected.
 
     Args:
         project: Project reference to choose the most recent generation from.
         release: Optional release to choose the most recent generation from.
+        refresh: Optional interval (in seconds) of re-resolving the most recent generation to pick
+                 up any newly published models.
     """
 
     def __init__(
         self,
         project: typing.Union[str, 'asset.Project.Key'],
         release: typing.Optional[typing.Union[str, 'asset.Release.Key']] = None,
+        refresh: typing.Optional[float] = None,
     ):
         self._project: typing.Union[str, 'asset.Project.Key'] = project
         self._release: typing.Optional[typing.Union[str, 'asset.Release.Key']] = release
+        self._refresh: typing.Optional[float] = refresh
+        self._registry: typing.Optional['asset.Directory'] = None
         self._instance: typing.Optional['asset.Instance'] = None
+        self._expires: float = 0
 
     def select(self, registry: 'asset.Directory', context: typing.Any, stats: 'runtime.Stats') -> 'asset.Instance':
+        if registry is not self._registry or self._refresh is not None and time.monotonic() >= self._expires:
+            self._instance = None
         if not self._instance:
+            self._registry = registry
             release = self._release
             generation = None
             if not release:
@@ -124,4 +142,6 @@ class Latest(Selector):
                 release=release,  # pylint: disable=undefined-loop-variable
                 generation=generation,
             )
+            if self._refresh is not None:
+                self._expires = time.monotonic() + self._refresh
         return self._instance
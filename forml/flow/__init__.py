@@ -19,8 +19,10 @@
 ForML flow logic.
 """
 
+from ._code.cache import Cache
 from ._code.compiler import compile  # pylint: disable=redefined-builtin
-from ._code.target import Instruction, Symbol
+from ._code.optimizer import optimize
+from ._code.target import Instruction, Instrument, Symbol
 from ._code.target.system import Committer, Dumper, Getter, Loader
 from ._code.target.user import Apply, Functor, Preset, Train
 from ._exception import TopologyError
@@ -35,6 +37,7 @@ __all__ = [
     'Actor',
     'Apply',
     'Builder',
+    'Cache',
     'Committer',
     'compile',
     'Composable',
@@ -45,11 +48,13 @@ __all__ = [
     'Future',
     'Getter',
     'Instruction',
+    'Instrument',
     'Labels',
     'Loader',
     'name',
     'Node',
     'Operator',
+    'optimize',
     'Origin',
     'Preset',
     'Publishable',
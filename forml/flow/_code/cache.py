@@ -0,0 +1,348 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Content-addressed instruction output caching.
+"""
+import hashlib
+import logging
+import os
+import pathlib
+import pickle
+import tempfile
+import typing
+import weakref
+
+import cloudpickle
+
+import forml
+
+from . import target
+from .target import user
+
+if typing.TYPE_CHECKING:
+    from forml import flow
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Lineage:
+    """Process-local registry of the cache keys of the values produced by the cached functors.
+
+    It allows the downstream functors to derive their keys from the keys of their upstream nodes
+    (forming a Merkle tree) instead of hashing the full payload of each of their inputs. Only the
+    values entering the DAG from the non-cached instructions (i.e. the source data or the actor
+    states) get their payload actually hashed (and registered as well so it is done just once).
+
+    The values are tracked using weak references (values not supporting weak references are
+    simply hashed every time).
+    """
+
+    def __init__(self):
+        self._keys: dict[int, tuple[weakref.ref, str]] = {}
+
+    def __getitem__(self, value: typing.Any) -> str:
+        entry = self._keys.get(id(value))
+        if entry is None or entry[0]() is not value:
+            raise KeyError(value)
+        return entry[1]
+
+    def __setitem__(self, value: typing.Any, key: str) -> None:
+        vid = id(value)
+
+        def drop(ref: weakref.ref) -> None:
+            """Callback for removing the entry of a collected value."""
+            entry = self._keys.get(vid)
+            if entry is not None and entry[0] is ref:
+                self._keys.pop(vid, None)
+
+        try:
+            self._keys[vid] = weakref.ref(value, drop), key
+        except TypeError:  # not weakly referencable
+            pass
+
+    def register(self, value: typing.Any, key: str) -> None:
+        """Register the given functor output under its key.
+
+        The items of the tuple outputs are registered individually as well (under keys derived from
+        their position) so that the keys are also available for the values passed on by the
+        :class:`system.Getter <forml.flow.Getter>` instructions.
+
+        Args:
+            value: Functor output to be registered.
+            key: Cache key of the output.
+        """
+        self[value] = key
+        if isinstance(value, tuple):
+            for index, item in enumerate(value):
+                self[item] = hashlib.blake2b(f'{key}:{index}'.encode(), digest_size=20).hexdigest()
+
+    def resolve(self, value: typing.Any) -> str:
+        """Get the key of the given value.
+
+        Values not produced by any of the cached functors get their payload fingerprinted (and
+        registered).
+
+        Args:
+            value: Value to be resolved.
+
+        Returns:
+            Key of the value.
+        """
+        try:
+            return self[value]
+        except KeyError:
+            digest = hashlib.blake2b(digest_size=20)
+            Cache.fingerprint(value, digest)
+            key = digest.hexdigest()
+            self[value] = key
+            return key
+
+
+LINEAGE = Lineage()
+
+
+class Cache:
+    """Size-bounded on-disk store of the functor outputs addressed by the hash of their content.
+
+    The key of each entry is a Merkle-style digest combining the functor specification (the actor
+    builder including its parameters and the action) with the keys of its input values. The key of
+    an input produced by another cached functor is just the key of that functor output, while all
+    the other inputs (the source data or the actor states passed to the functors as arguments) get
+    keyed by the fingerprint of their actual content. The payload hashing is therefore limited to
+    the DAG inputs.
+
+    Once the total size of the stored entries exceeds the limit, the least recently used ones get
+    evicted.
+
+    Attention:
+        The key doesn't cover the actual actor implementation - changing the actor code without
+        changing its name or parameters leads to the stale outputs being reused (the cache needs to
+        be cleared explicitly in such case). Also, only deterministic actors not mutating their
+        inputs in-place should be subject to caching.
+
+    Args:
+        path: Directory to store the cache entries in (gets created if not existing).
+        size: Maximum total size (in bytes) of the stored entries.
+    """
+    SIZE = 1 << 30
+    """Default cache size limit."""
+
+    SUFFIX = '.bin'
+    """File suffix of the cache entries."""
+
+    def __init__(self, path: typing.Union[str, pathlib.Path], size: int = SIZE):
+        if size < 1:
+            raise forml.InvalidError(f'Invalid cache size: {size}')
+        self._path: pathlib.Path = pathlib.Path(path).absolute()
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._size: int = size
+
+    def __repr__(self):
+        return f'Cache[{self._path}]'
+
+    def __len__(self):
+        return sum(1 for _ in self._path.glob(f'*{self.SUFFIX}'))
+
+    @staticmethod
+    def fingerprint(value: typing.Any, digest: 'hashlib._Hash') -> None:
+        """Update the digest with the content of the given value.
+
+        Pickle protocol 5 is used to avoid copying the (potentially large) out-of-band buffers which
+        are fed into the digest directly.
+
+        Args:
+            value: Value to be fingerprinted.
+            digest: Digest to be updated.
+        """
+        buffers: list[pickle.PickleBuffer] = []
+        digest.update(cloudpickle.dumps(value, protocol=5, buffer_callback=buffers.append))
+        for buffer in buffers:
+            digest.update(buffer.raw())
+
+    @classmethod
+    def spec(cls, functor: 'flow.Functor') -> str:
+        """Calculate the digest of the given functor specification.
+
+        Args:
+            functor: Functor to be fingerprinted.
+
+        Returns:
+            Hex digest of the functor specification.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        builder = functor.builder
+        cls.fingerprint((builder.actor, builder.args, dict(builder.kwargs), functor.action), digest)
+        return digest.hexdigest()
+
+    @staticmethod
+    def key(spec: str, *args: typing.Any) -> str:
+        """Calculate the Merkle key for the given functor specification and its input arguments.
+
+        Args:
+            spec: Digest of the functor specification.
+            args: Actual input arguments of the functor.
+
+        Returns:
+            Hex digest serving as the cache key.
+        """
+        digest = hashlib.blake2b(spec.encode(), digest_size=20)
+        for arg in args:
+            digest.update(LINEAGE.resolve(arg).encode())
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> pathlib.Path:
+        """Get the path of the entry under the given key."""
+        return self._path / f'{key}{self.SUFFIX}'
+
+    def __contains__(self, key: str) -> bool:
+        return self._entry(key).exists()
+
+    def __getitem__(self, key: str) -> typing.Any:
+        path = self._entry(key)
+        try:
+            with path.open('rb') as file:
+                value = pickle.load(file)
+            os.utime(path)  # tracking the LRU order using the modification times
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError) as err:
+            raise KeyError(key) from err
+        return value
+
+    def __setitem__(self, key: str, value: typing.Any) -> None:
+        # writing into a temp file first so that concurrent readers never see partial entry
+        with tempfile.NamedTemporaryFile(dir=self._path, suffix='.tmp', delete=False) as file:
+            cloudpickle.dump(value, file)
+        os.replace(file.name, self._entry(key))
+        self.evict()
+
+    def evict(self) -> None:
+        """Drop the least recently used entries exceeding the size limit."""
+        entries = []
+        for path in self._path.glob(f'*{self.SUFFIX}'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # concurrently evicted
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(s for _, s, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self._size:
+                break
+            LOGGER.debug('Evicting cache entry %s (%d bytes)', path.name, size)
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Drop all the entries."""
+        for path in self._path.glob(f'*{self.SUFFIX}'):
+            path.unlink(missing_ok=True)
+
+
+class Cached(user.Action):
+    """Composite action serving the output of the wrapped action from the cache if available.
+
+    Args:
+        action: Action to be wrapped.
+        cache: Cache store instance.
+        spec: Digest of the functor specification.
+    """
+
+    def __init__(self, action: user.Action, cache: Cache, spec: str):
+        self._action: user.Action = action
+        self._cache: Cache = cache
+        self._spec: str = spec
+
+    def __repr__(self):
+        return f'cached.{self._action}'
+
+    def __call__(self, actor: 'flow.Actor', *args: typing.Any) -> typing.Any:
+        return self._serve(lambda: self._action(actor, *args), args)
+
+    def bind(self, actor: 'flow.Actor') -> typing.Callable[..., typing.Any]:
+        action = self._action.bind(actor)
+
+        def cached(*args: typing.Any) -> typing.Any:
+            """Lean cached action."""
+            return self._serve(lambda: action(*args), args)
+
+        return cached
+
+    def reduce(self, actor: 'flow.Actor', *args: typing.Any) -> tuple[user.Action, typing.Sequence[typing.Any]]:
+        action, direct = self._action.reduce(actor, *args)
+        if action is self._action:
+            return self, args
+        # the presets consumed by the reduction need to stay involved in the key
+        return Cached(action, self._cache, self._cache.key(self._spec, *args[: len(args) - len(direct)])), direct
+
+    def __contains__(self, action: type[user.Action]) -> bool:
+        return super().__contains__(action) or self._action.__contains__(action)
+
+    def _serve(self, call: typing.Callable[[], typing.Any], args: typing.Sequence[typing.Any]) -> typing.Any:
+        """Get the result from the cache or from the actual call (storing it in the cache).
+
+        Args:
+            call: Actual action call.
+            args: Action arguments used for the key calculation.
+
+        Returns:
+            Action result.
+        """
+        key = self._cache.key(self._spec, *args)
+        try:
+            result = self._cache[key]
+        except KeyError:
+            result = call()
+            self._cache[key] = result
+        else:
+            LOGGER.debug('%s served from cache (%s)', self._action, key)
+        LINEAGE.register(result, key)
+        return result
+
+
+def wrap(symbols: typing.Iterable['flow.Symbol'], cache: Cache) -> typing.Iterable['flow.Symbol']:
+    """Replace all the cacheable functors within the symbol table with functors of the same actors
+    and their actions wrapped by the :class:`Cached` action.
+
+    The I/O actors (the feed readers and the sink writers) are excluded as their output depends
+    on the external systems.
+
+    Args:
+        symbols: Source symbol table.
+        cache: Cache store instance.
+
+    Returns:
+        Symbol table with the cacheable functors wrapped.
+    """
+    from forml.io._input import extract  # pylint: disable=import-outside-toplevel
+    from forml.io._output import commit  # pylint: disable=import-outside-toplevel
+
+    def cacheable(instruction: 'flow.Instruction') -> bool:
+        """Check the instruction is eligible for caching."""
+        if not isinstance(instruction, user.Functor):
+            return False
+        actor = instruction.builder.actor
+        return not (isinstance(actor, type) and issubclass(actor, (extract.Driver, commit.Driver)))
+
+    symbols = tuple(symbols)
+    mapping: dict['flow.Instruction', 'flow.Instruction'] = {
+        i: user.Functor(i.builder, Cached(i.action, cache, cache.spec(i))) for i, _ in symbols if cacheable(i)
+    }
+    return tuple(
+        target.Symbol(mapping.get(s.instruction, s.instruction), [mapping.get(a, a) for a in s.arguments])
+        for s in symbols
+    )
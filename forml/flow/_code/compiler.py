@@ -28,7 +28,8 @@ import uuid
 
 from .. import _exception
 from .._graph import atomic, span
-from . import target
+from . import cache as cachemod
+from . import optimizer, target
 from .target import system, user
 
 if typing.TYPE_CHECKING:
@@ -265,7 +266,12 @@ class Table(span.Visitor, typing.Iterable):
 
 
 def compile(  # pylint: disable=redefined-builtin
-    segment: 'flow.Segment', assets: typing.Optional['asset.State'] = None
+    segment: 'flow.Segment',
+    assets: typing.Optional['asset.State'] = None,
+    cache: typing.Optional['flow.Cache'] = None,
+    optimize: bool = False,
+    instrument: typing.Optional['flow.Instrument'] = None,
+    lean: bool = False,
 ) -> typing.Collection['flow.Symbol']:
     """Generate the portable low-level runtime symbol table representing the given flow topology
     segment augmented with all the necessary system instructions.
@@ -273,10 +279,28 @@ def compile(  # pylint: disable=redefined-builtin
     Args:
         segment: Flow topology segment to generate the symbol table for.
         assets: Runtime state asset accessors for all the involved persistent workers.
+        cache: Optional cache store to be consulted by the functors for reusing their outputs
+               produced previously on identical inputs.
+        optimize: Whether to merge the duplicate pure instructions and prune the ones not
+                  contributing to any of the outputs (see :func:`flow.optimize
+                  <forml.flow.optimize>` for obtaining the actual optimization report).
+        instrument: Optional instrumentation hook to be attached to all the instructions.
+        lean: Make the instructions skip their per-call debug logging and timing (unless
+              instrumented).
 
     Returns:
         The portable runtime symbol table.
     """
     table = Table(assets)
     segment.accept(table)
-    return tuple(table)
+    symbols = tuple(table)
+    if optimize:
+        symbols, report = optimizer.optimize(symbols)
+        if report:
+            LOGGER.info('Symbol table optimization %s', report)
+    if cache is not None:
+        symbols = cachemod.wrap(symbols, cache)
+    for instruction, _ in symbols:
+        instruction.instrument = instrument
+        instruction.lean = lean
+    return symbols
@@ -0,0 +1,129 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Runtime symbol table optimization.
+"""
+import collections
+import logging
+import typing
+
+import cloudpickle
+
+from . import target
+from .target import system, user
+
+if typing.TYPE_CHECKING:
+    from forml import flow
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Report(typing.NamedTuple):
+    """Summary of the symbol table optimization."""
+
+    merged: tuple[tuple['flow.Instruction', 'flow.Instruction'], ...] = ()
+    """Pairs of the duplicate instructions removed in favor of their retained equivalents."""
+    pruned: tuple['flow.Instruction', ...] = ()
+    """Instructions removed as not contributing to any of the outputs."""
+
+    def __bool__(self):
+        return bool(self.merged or self.pruned)
+
+    def __str__(self):
+        return f'merged {len(self.merged)} and pruned {len(self.pruned)} instructions'
+
+
+def signature(instruction: 'flow.Instruction') -> typing.Optional[typing.Hashable]:
+    """Get the signature of the given instruction for its common-subexpression matching.
+
+    Only the instructions with no internal state and no side effects are eligible - these are the
+    getters and the stateless (neither trained nor state-preset) functors of the actors explicitly
+    declared as :attr:`pure <forml.flow.Actor.PURE>`.
+
+    Args:
+        instruction: Instruction to get the signature for.
+
+    Returns:
+        Hashable signature or None if not eligible for merging.
+    """
+    if isinstance(instruction, system.Getter):
+        return system.Getter, instruction.index
+    if not isinstance(instruction, user.Functor):
+        return None
+    builder, action = instruction
+    if not builder.actor.PURE or user.Train in action or user.SetState in action:
+        return None
+    return cloudpickle.dumps((builder.actor, builder.args, dict(builder.kwargs), action))
+
+
+def optimize(symbols: typing.Iterable['flow.Symbol']) -> tuple[tuple['flow.Symbol', ...], Report]:
+    """Optimize the symbol table by:
+
+    #. Merging the identical pure instructions applied to identical arguments
+       (common-subexpression elimination).
+    #. Pruning the instructions not contributing to any of the leaves other than the stub getters
+       (dead branch elimination).
+
+    Args:
+        symbols: Source symbol table.
+
+    Returns:
+        Tuple of the optimized symbol table and the optimization report.
+    """
+    upstream: dict['flow.Instruction', tuple['flow.Instruction', ...]] = dict(symbols)
+    downstream: dict['flow.Instruction', set['flow.Instruction']] = collections.defaultdict(set)
+    for instruction, args in upstream.items():
+        for arg in args:
+            downstream[arg].add(instruction)
+
+    waiting = {i: len(set(a)) for i, a in upstream.items()}
+    ready = collections.deque(i for i, w in waiting.items() if not w)
+    alias: dict['flow.Instruction', 'flow.Instruction'] = {}
+    seen: dict[tuple[typing.Hashable, tuple[int, ...]], 'flow.Instruction'] = {}
+    merged: list[tuple['flow.Instruction', 'flow.Instruction']] = []
+    while ready:
+        instruction = ready.popleft()
+        for consumer in downstream[instruction]:
+            waiting[consumer] -= 1
+            if not waiting[consumer]:
+                ready.append(consumer)
+        args = upstream[instruction] = tuple(alias.get(a, a) for a in upstream[instruction])
+        if (sign := signature(instruction)) is None:
+            continue
+        key = sign, tuple(id(a) for a in args)
+        if (retained := seen.setdefault(key, instruction)) is not instruction:
+            LOGGER.debug('Merging duplicate %s into %s', instruction, retained)
+            alias[instruction] = retained
+            merged.append((instruction, retained))
+    assert not any(waiting.values()), 'Not acyclic'
+
+    for instruction in alias:
+        del upstream[instruction]
+    consumed = {a for args in upstream.values() for a in args}
+    live: set['flow.Instruction'] = set()
+    pending = [i for i in upstream if i not in consumed and not isinstance(i, system.Getter)]
+    while pending:
+        if (instruction := pending.pop()) in live or instruction not in upstream:
+            continue
+        live.add(instruction)
+        pending.extend(upstream[instruction])
+    pruned = tuple(i for i in upstream if i not in live)
+    for instruction in pruned:
+        LOGGER.debug('Pruning dead instruction %s', instruction)
+    return tuple(target.Symbol(i, a) for i, a in upstream.items() if i in live), Report(tuple(merged), pruned)
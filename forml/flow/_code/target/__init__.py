@@ -21,6 +21,10 @@ Code instructions.
 import abc
 import collections
 import logging
+import os
+import resource
+import sys
+import threading
 import time
 import typing
 
@@ -32,9 +36,95 @@ if typing.TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 
+class Instrument(abc.ABC):
+    """Pluggable instruction execution instrumentation.
+
+    Instrument attached to an instruction receives a sample of each of its (successful) executions.
+    Given the instructions might be shipped to a remote worker, the instrument must be serializable.
+    """
+
+    class Sample(typing.NamedTuple):
+        """Single instruction execution measurement."""
+
+        name: str
+        """Instruction name."""
+        start: float
+        """Execution start as the epoch timestamp (in seconds)."""
+        wall: float
+        """Elapsed wall time (in seconds)."""
+        cpu: float
+        """CPU time (in seconds) consumed by the executing thread."""
+        input: int
+        """Estimated size (in bytes) of the input arguments."""
+        output: int
+        """Estimated size (in bytes) of the output value."""
+        memory: int
+        """Increase (in bytes) of the process peak resident set size."""
+        pid: int
+        """Executing process ID."""
+        tid: int
+        """Executing thread ID."""
+
+    NAMELEN = 128
+    """Maximum length of the instruction name within the samples."""
+
+    SAMPLES = 100
+    """Number of collection items to be inspected when estimating the collection size."""
+
+    @abc.abstractmethod
+    def record(self, sample: 'flow.Instrument.Sample') -> None:
+        """Receive the given execution sample.
+
+        Args:
+            sample: Instruction execution measurement.
+        """
+
+    @classmethod
+    def sizeof(cls, value: typing.Any) -> int:
+        """Estimate the memory size of the given value.
+
+        Array-like values report their buffer sizes, the sizes of large collections get extrapolated
+        from a limited number of their items.
+
+        Args:
+            value: Value to be measured.
+
+        Returns:
+            Estimated size in bytes.
+        """
+        if isinstance(nbytes := getattr(value, 'nbytes', None), int):  # numpy, pyarrow
+            return nbytes
+        if isinstance(value, (bytes, bytearray, str)):
+            return len(value)
+        if hasattr(value, 'memory_usage'):  # pandas
+            usage = value.memory_usage(index=True)
+            return int(usage if isinstance(usage, int) else usage.sum())
+        if isinstance(value, typing.Mapping):
+            value = tuple(value.values())
+        if isinstance(value, (list, tuple)) and value:
+            sample = value[: cls.SAMPLES]
+            return sys.getsizeof(value) + sum(cls.sizeof(v) for v in sample) * len(value) // len(sample)
+        return sys.getsizeof(value)
+
+    @staticmethod
+    def peak() -> int:
+        """Get the current peak resident set size of this process.
+
+        Returns:
+            Peak RSS in bytes.
+        """
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
 class Instruction(metaclass=abc.ABCMeta):
     """Executable part of the compiled symbol responsible for performing the processing activity."""
 
+    instrument: typing.Optional[Instrument] = None
+    """Optional instrumentation hook receiving the execution samples."""
+
+    lean: bool = False
+    """Flag for skipping the per-call logging and timing (unless instrumented)."""
+
     @abc.abstractmethod
     def execute(self, *args: typing.Any) -> typing.Any:
         """Actual instruction functionality.
@@ -49,8 +139,30 @@ class Instruction(metaclass=abc.ABCMeta):
     def __repr__(self):
         return self.__class__.__name__
 
+    @staticmethod
+    def quiet() -> bool:
+        """Check none of the per-call debug logging of the instructions (including their actor
+        actions) would actually be emitted so that they can be executed in the lean mode.
+
+        Returns:
+            True if the DEBUG level is disabled for the instruction loggers.
+        """
+        from . import user  # pylint: disable=import-outside-toplevel
+
+        return not (LOGGER.isEnabledFor(logging.DEBUG) or user.LOGGER.isEnabledFor(logging.DEBUG))
+
     def __call__(self, *args: typing.Any) -> typing.Any:
+        instrument = self.instrument
+        if self.lean and instrument is None:
+            try:
+                return self.execute(*args)
+            except Exception as err:
+                LOGGER.exception('Instruction %s failed', self)
+                raise err
         LOGGER.debug('%s invoked (%d args)', self, len(args))
+        if instrument is not None:
+            peak = instrument.peak()
+            cpu = time.thread_time()
         start = time.time()
         try:
             result = self.execute(*args)
@@ -59,7 +171,22 @@ class Instruction(metaclass=abc.ABCMeta):
                 'Instruction %s failed when processing arguments: %s', self, ', '.join(f'{str(a):.1024s}' for a in args)
             )
             raise err
-        LOGGER.debug('%s completed (%.2fms)', self, (time.time() - start) * 1000)
+        elapsed = time.time() - start
+        LOGGER.debug('%s completed (%.2fms)', self, elapsed * 1000)
+        if instrument is not None:
+            instrument.record(
+                Instrument.Sample(
+                    f'{self!r:.{instrument.NAMELEN}s}',
+                    start,
+                    elapsed,
+                    time.thread_time() - cpu,
+                    instrument.sizeof(args),
+                    instrument.sizeof(result),
+                    instrument.peak() - peak,
+                    os.getpid(),
+                    threading.get_ident(),
+                )
+            )
         return result
 
 
@@ -40,6 +40,18 @@ class Loader(target.Instruction):
         self._assets: 'asset.State' = assets
         self._key: typing.Union[int, uuid.UUID] = key
 
+    @property
+    def sid(self) -> typing.Optional[uuid.UUID]:
+        """Absolute ID of the state to be loaded (stable across the compilations of the same generation).
+
+        Returns:
+            Absolute state ID or None if there is no state to be loaded.
+        """
+        try:
+            return self._assets.sid(self._key)
+        except forml.MissingError:
+            return None
+
     def execute(self) -> typing.Optional[bytes]:  # pylint: disable=arguments-differ
         """Instruction functionality.
 
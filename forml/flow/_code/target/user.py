@@ -44,6 +44,18 @@ class Action(abc.ABC):
     def __repr__(self):
         return self.__class__.__name__.lower()
 
+    def bind(self, actor: 'flow.Actor') -> typing.Callable[..., typing.Any]:
+        """Bind this action to the given actor returning a lean callable performing the action
+        without any of the logging.
+
+        Args:
+            actor: Actor subject.
+
+        Returns:
+            Callable accepting the action arguments.
+        """
+        return functools.partial(self, actor)
+
     def functor(self, builder: 'flow.Builder') -> 'Functor':
         """Helper method for creating functor instance for this action.
 
@@ -104,6 +116,15 @@ class Preset(typing.Generic[Value], Action, metaclass=abc.ABCMeta):
             self.set(actor, value)
         return self._action.reduce(actor, *args)
 
+    def bind(self, actor: 'flow.Actor') -> typing.Callable[..., typing.Any]:
+        def preset(value: Value, *args: typing.Any) -> typing.Any:
+            """Lean preset action."""
+            if value:
+                self.set(actor, value)
+            return self._action.bind(actor)(*args)
+
+        return preset
+
     def __contains__(self, action: type[Action]) -> bool:
         return super().__contains__(action) or self._action.__contains__(action)
 
@@ -150,6 +171,9 @@ class Apply(Action):
         LOGGER.debug('%s result: %.1024s...', actor, result)
         return result
 
+    def bind(self, actor: 'flow.Actor') -> typing.Callable[..., typing.Any]:
+        return actor.apply
+
 
 class Train(Action):
     """Trainer functor action."""
@@ -201,4 +225,6 @@ class Functor(collections.namedtuple('Functor', 'builder, action'), target.Instr
         return self.builder()
 
     def execute(self, *args) -> typing.Any:
+        if self.lean:
+            return self.action.bind(self._actor)(*args)
         return self.action(self._actor, *args)
@@ -84,6 +84,11 @@ class Actor(typing.Generic[Features, Labels, Result], metaclass=abc.ABCMeta):
     output type ``flow.Result``.
     """
 
+    PURE: bool = False
+    """Flag declaring the *apply* mode of the actor as a pure function (deterministic and with no
+    side effects) making it eligible for merging with its duplicates during the :func:`symbol
+    table optimization <forml.flow.optimize>`."""
+
     def __repr__(self):
         return name(self.__class__, **self.get_params())
 
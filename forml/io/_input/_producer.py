@@ -52,6 +52,19 @@ class Reader(typing.Generic[parsmod.Source, parsmod.Feature, laymod.Native], met
       be returned but potentially incomplete in terms of the expected schema; in which case
       the reader is supposed to just complete the partial data to match the ``query`` schema.
 
+    Alternatively, the data can be extracted incrementally as a sequence of bounded chunks using the
+    :meth:`chunks` method.
+
+    When constructed with the ``batch`` parameter, the extraction mode fetches the data using the
+    (incremental) :meth:`stream` method in batches of the given number of rows assembling them into
+    preallocated typed column buffers so that the peak memory stays near the final dataset size.
+
+    Args:
+        sources: Source mappings to be used by the parser.
+        features: Feature mappings to be used by the parser.
+        batch: Optional number of rows to be fetched at once in the (streaming) extraction mode.
+        kwargs: Optional reader keyword arguments passed to the :meth:`read`/:meth:`stream` methods.
+
     Todo:
         Implement the augmentation mode.
     """
@@ -60,10 +73,14 @@ class Reader(typing.Generic[parsmod.Source, parsmod.Feature, laymod.Native], met
         self,
         sources: typing.Mapping['dsl.Source', 'parser.Source'],
         features: typing.Mapping['dsl.Feature', 'parser.Feature'],
+        batch: typing.Optional[int] = None,
         **kwargs: typing.Any,
     ):
+        if batch is not None and batch < 1:
+            raise forml.InvalidError(f'Invalid batch size: {batch}')
         self._sources: typing.Mapping['dsl.Source', 'parser.Source'] = sources
         self._features: typing.Mapping['dsl.Feature', 'parser.Feature'] = features
+        self._batch: typing.Optional[int] = batch
         self._kwargs: typing.Mapping[str, typing.Any] = kwargs
 
     def __repr__(self):
@@ -87,12 +104,49 @@ class Reader(typing.Generic[parsmod.Source, parsmod.Feature, laymod.Native], met
                 raise forml.MissingError('Augmentation not supported - please provide all features')
             return entry.data.take_columns(indices) if indices else entry.data
 
+        result = self._parse(statement)
+        if self._batch:
+            LOGGER.debug('Starting streaming ETL read (%d rows per batch) using: %s', self._batch, result)
+            buffer = laymod.Columnar.Builder(statement.schema)
+            for batch in self.stream(result, self._batch, **self._kwargs):
+                buffer.append(self.format(statement.schema, batch))
+            return buffer.build()
+        LOGGER.debug('Starting ETL read using: %s', result)
+        return self.format(statement.schema, self.read(result, **self._kwargs))
+
+    def chunks(self, statement: 'dsl.Statement', size: int) -> typing.Iterator['layout.Tabular']:
+        """Chunked reader entrypoint.
+
+        Instead of loading the entire dataset at once, the data is extracted in a sequence of
+        bounded row batches (see the :meth:`stream` method).
+
+        Args:
+            statement: The query DSL specifying the extracted data.
+            size: Maximum number of rows per chunk.
+
+        Returns:
+            Iterator of the data chunks extracted according to the query.
+        """
+        if size < 1:
+            raise forml.InvalidError(f'Invalid chunk size: {size}')
+        result = self._parse(statement)
+        LOGGER.debug('Starting chunked ETL read (%d rows per chunk) using: %s', size, result)
+        for chunk in self.stream(result, size, **self._kwargs):
+            yield self.format(statement.schema, chunk)
+
+    def _parse(self, statement: 'dsl.Statement') -> 'parser.Source':
+        """Parse the given statement into the storage-native syntax.
+
+        Args:
+            statement: The query DSL to be parsed.
+
+        Returns:
+            Read instructions in the storage-native syntax.
+        """
         LOGGER.debug('Parsing ETL query')
         with self.parser(self._sources, self._features) as visitor:
             statement.accept(visitor)
-            result = visitor.fetch()
-        LOGGER.debug('Starting ETL read using: %s', result)
-        return self.format(statement.schema, self.read(result, **self._kwargs))
+            return visitor.fetch()
 
     @functools.lru_cache
     def _match_entry(
@@ -163,6 +217,10 @@ class Reader(typing.Generic[parsmod.Source, parsmod.Feature, laymod.Native], met
     ) -> 'layout.Tabular':
         """Convert the storage-native data into the required ``layout.Tabular`` format.
 
+        The default implementation expects the data in the ``layout.RowMajor`` form and turns it into
+        the dense layout. Readers can override it to produce the :class:`columnar layout
+        <forml.io.layout.Columnar>` with the column dtypes driven by the schema field kinds.
+
         Args:
             schema: Data schema.
             data: Input data.
@@ -184,3 +242,28 @@ class Reader(typing.Generic[parsmod.Source, parsmod.Feature, laymod.Native], met
         Returns:
             Raw data provided by the reader.
         """
+
+    @classmethod
+    def stream(cls, statement: 'parser.Source', size: int, **kwargs: typing.Any) -> typing.Iterator['layout.Native']:
+        """Perform the read operation using the given storage-native statement yielding the data in
+        chunks of up to the given number of rows.
+
+        The default implementation simply slices the full output of the :meth:`read` method (hence
+        not limiting the memory footprint and warning about it) - readers capable of fetching the
+        data incrementally are expected to override it.
+
+        Args:
+            statement: Read instructions in the storage-native syntax.
+            size: Maximum number of rows per chunk.
+            kwargs: Optional reader keyword arguments (as given to the constructor).
+
+        Returns:
+            Iterator of raw data chunks provided by the reader.
+        """
+        LOGGER.warning(
+            '%s not supporting incremental reading - loading the full data before slicing it into chunks', cls.__name__
+        )
+        data = cls.read(statement, **kwargs)
+        for start in range(0, len(data), size):
+            end = start + size
+            yield data[start:end]
@@ -160,6 +160,26 @@ class Driver(typing.Generic[Output], flow.Actor[typing.Optional[laymod.Entry], N
         """
         return self._producer(self._statement(), entry)
 
+    def chunks(self, size: int) -> typing.Iterator['layout.Entry']:
+        """Read the data in a sequence of bounded chunks each wrapped as an entry suitable for
+        feeding back into the :meth:`apply` method.
+
+        Args:
+            size: Maximum number of rows per chunk.
+
+        Returns:
+            Iterator of entries holding the individual chunks.
+
+        Raises:
+            forml.MissingError: If the producer doesn't support the chunked reading.
+        """
+        chunks = getattr(self._producer, 'chunks', None)
+        if not chunks:
+            raise forml.MissingError(f'Chunked reading not supported by {self._producer}')
+        statement = self._statement()
+        for chunk in chunks(statement, size):
+            yield laymod.Entry(statement.schema, chunk)
+
 
 class TableDriver(Driver[laymod.Tabular]):
     """Actor that returns the data in the layout.Tabular format."""
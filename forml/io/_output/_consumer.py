@@ -76,6 +76,11 @@ class Writer(typing.Generic[laymod.Native], metaclass=abc.ABCMeta):
     def write(cls, data: 'layout.Native', **kwargs: typing.Any) -> None:
         """Perform the write operation with the given media-native data.
 
+        Attention:
+            In the :meth:`chunked apply mode <forml.runtime.Runner.apply>`, the method gets called
+            repeatedly (once per each chunk) within the same run. Implementations must therefore
+            append the data to any previously written chunks rather than replacing them.
+
         Args:
             data: Output data in the media-native format.
             kwargs: Optional writer keyword arguments (as given to the constructor).
@@ -76,6 +76,20 @@ class State:
         except ValueError as err:
             raise forml.UnexpectedError(f'Unknown node ({gid})') from err
 
+    def sid(self, gid: uuid.UUID) -> typing.Optional[uuid.UUID]:
+        """Get the absolute state ID of the given node within the current generation.
+
+        Args:
+            gid: The node group id.
+
+        Returns:
+            Absolute state ID or None if the generation has no states (not trained yet).
+        """
+        tag = self._generation.tag
+        if not tag.training:
+            return None
+        return tag.states[self.offset(gid)]
+
     def load(self, gid: uuid.UUID) -> bytes:
         """Load the state based on its state ID, ordering index or node group id.
 
@@ -133,12 +147,24 @@ class Instance:
             registry = level.Directory(_persistent.Registry())
         self._generation: 'asset.Generation' = registry.get(project).get(release).get(generation)
 
+    def __repr__(self):
+        return repr(self._generation)
+
     def __hash__(self):
         return hash(self._generation)
 
     def __eq__(self, other):
         return isinstance(other, self.__class__) and other._generation == self._generation
 
+    @property
+    def generation(self) -> 'asset.Generation':
+        """Get the generation level of this instance.
+
+        Returns:
+            Generation level.
+        """
+        return self._generation
+
     @property
     def project(self) -> 'project.Components':  # noqa: F811
         """Get the project components.
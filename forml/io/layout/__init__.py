@@ -22,7 +22,7 @@ import typing
 
 from ._codec import Decoder, Encoder, Encoding, get_decoder, get_encoder
 from ._external import Entry, Outcome, Request, Response
-from ._internal import Dense, Tabular
+from ._internal import Columnar, Dense, Tabular
 
 #: Sequence of items (n-dimensional but only the top one needs to be accessible).
 Array = typing.Sequence[typing.Any]
@@ -37,6 +37,7 @@ Native = typing.TypeVar('Native')
 __all__ = [
     'Array',
     'ColumnMajor',
+    'Columnar',
     'Decoder',
     'Dense',
     'Encoder',
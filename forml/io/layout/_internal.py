@@ -22,6 +22,10 @@ import abc
 import typing
 
 import numpy
+import pandas
+
+import forml
+from forml.io import dsl
 
 if typing.TYPE_CHECKING:
     from forml.io import layout
@@ -134,3 +138,342 @@ class Dense(Tabular):
 
     def take_columns(self, indices: typing.Sequence[int]) -> 'layout.Dense':
         return self.from_columns(self._rows.T.take(indices, axis=0))
+
+
+class Columnar(Tabular):
+    """Tabular implementation backed by a sequence of individually typed one-dimensional numpy arrays
+    (one per each column).
+
+    Unlike the ``Dense`` layout, the columns retain their native dtypes (only the truly mixed-type
+    or nested columns fall back to the ``object`` dtype), slicing the columns is zero-copy and the
+    row-oriented representation gets materialized lazily (and cached) only upon the first
+    :meth:`to_rows` call.
+
+    When constructed with an explicit ``dsl.Source.Schema``, the column dtypes are driven by the
+    schema field kinds instead of being inferred from the (boxed) values.
+    """
+
+    NUMERIC = frozenset('iuf')
+    """Numpy dtype kinds potentially stackable into a single (promoted) typed row array."""
+
+    class Builder:
+        """Incremental assembler of a Columnar table from a sequence of (row-wise) chunks.
+
+        The chunk columns get copied into preallocated typed buffers growing geometrically (in-place
+        where possible) so that the peak memory footprint stays close to the size of the final table
+        (instead of holding all the chunks plus their concatenation).
+
+        The builder is single-use - once the table is built (handing over the buffers), no more
+        chunks can be appended.
+        """
+
+        GROWTH = 1.5
+        """Buffer capacity growth factor."""
+
+        def __init__(self, schema: typing.Optional['dsl.Source.Schema'] = None):
+            self._schema: typing.Optional['dsl.Source.Schema'] = schema
+            self._buffers: list[numpy.ndarray] = []
+            self._size: int = 0
+            self._finished: bool = False
+
+        def __len__(self):
+            return self._size
+
+        def _check(self) -> None:
+            """Make sure the builder is not finished yet.
+
+            Raises:
+                forml.InvalidError: If the builder is already finished.
+            """
+            if self._finished:
+                raise forml.InvalidError('Builder already finished')
+
+        def _reserve(self, size: int) -> None:
+            """Make sure the buffers can accommodate the given number of rows.
+
+            Args:
+                size: Total number of rows to be accommodated.
+            """
+            capacity = len(self._buffers[0])
+            if size > capacity:
+                capacity = max(size, int(capacity * self.GROWTH))
+                for buffer in self._buffers:
+                    buffer.resize(capacity, refcheck=False)
+
+        def append(self, chunk: 'layout.Tabular') -> 'layout.Columnar.Builder':
+            """Append the given chunk to the buffers.
+
+            Args:
+                chunk: Table chunk to be appended (all chunks need to have the same number of columns).
+
+            Returns:
+                Self instance for chaining.
+
+            Raises:
+                forml.InvalidError: If the chunk width doesn't match or the builder is already finished.
+            """
+            self._check()
+            columns = chunk.to_columns()
+            if not len(columns):
+                return self
+            rows = len(columns[0])
+            if not self._buffers:
+                self._buffers = [numpy.empty(rows, dtype=numpy.asarray(c).dtype) for c in columns]
+            elif len(columns) != len(self._buffers):
+                raise forml.InvalidError(f'Chunk width mismatch: {len(columns)} != {len(self._buffers)}')
+            self._reserve(self._size + rows)
+            for index, column in enumerate(columns):
+                column = numpy.asarray(column)
+                buffer = self._buffers[index]
+                if not numpy.can_cast(column.dtype, buffer.dtype, casting='safe'):  # promoting the buffer
+                    buffer = self._buffers[index] = buffer.astype(numpy.result_type(buffer.dtype, column.dtype))
+                buffer[self._size : self._size + rows] = column
+            self._size += rows
+            return self
+
+        def build(self) -> 'layout.Columnar':
+            """Finalize the table trimming the buffers to the actual size.
+
+            Returns:
+                Columnar instance made of the appended chunks.
+
+            Raises:
+                forml.InvalidError: If the builder is already finished.
+            """
+            self._check()
+            self._finished = True  # the buffers are owned by the table from now on
+            if not self._buffers:
+                return Columnar.from_columns([[] for _ in self._schema or []], self._schema)
+            for buffer in self._buffers:
+                buffer.resize(self._size, refcheck=False)
+            return Columnar(self._buffers)
+
+    def __init__(self, columns: typing.Iterable[numpy.ndarray]):
+        self._columns: tuple[numpy.ndarray, ...] = tuple(columns)
+        self._rows: typing.Optional[numpy.ndarray] = None
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, self.__class__)
+            and len(self._columns) == len(other._columns)
+            and all(numpy.array_equal(s, o) for s, o in zip(self._columns, other._columns))
+        )
+
+    def __hash__(self):
+        return hash(tuple(len(c) for c in self._columns))
+
+    def __reduce__(self):
+        return self.__class__, (self._columns,)  # not shipping the cached rows
+
+    @staticmethod
+    def _cast(column: numpy.ndarray, kind: 'dsl.Any') -> numpy.ndarray:
+        """Helper for coercing the column to the native dtype corresponding to the given DSL kind.
+
+        Columns already of a matching dtype are returned untouched (no copy) as well as columns of
+        kinds without any native numpy counterpart (strings, decimals, compound kinds) or values
+        failing the conversion. Integer and boolean columns are only converted if lossless (integral
+        values or just bools or 0/1 numbers respectively).
+
+        Args:
+            column: One-dimensional column array.
+            kind: DSL kind of the column.
+
+        Returns:
+            Column array of the kind-native dtype.
+        """
+        try:
+            if dsl.Date.match(kind):
+                if column.dtype.kind != 'M':
+                    return pandas.to_datetime(column).to_numpy()
+            elif dsl.Float.match(kind):
+                if column.dtype.kind != 'f':
+                    return column.astype(float)
+            elif dsl.Integer.match(kind):
+                missing = pandas.isna(column)
+                if column.dtype.kind not in 'iu' and not (missing.any() and column.dtype.kind == 'f'):
+                    converted = column.astype(float if missing.any() else int)
+                    present = converted[~missing]
+                    if numpy.array_equal(present, column[~missing]) and (present % 1 == 0).all():
+                        return converted
+            elif dsl.Boolean.match(kind):
+                if column.dtype.kind != 'b' and Columnar._binary(column):
+                    return column.astype(bool)
+        except (TypeError, ValueError, OverflowError):
+            pass
+        return column
+
+    @staticmethod
+    def _binary(column: numpy.ndarray) -> bool:
+        """Helper for checking the column contains just bools or 0/1 numbers (and no missing values).
+
+        Args:
+            column: One-dimensional column array.
+
+        Returns:
+            True if losslessly convertible to bools.
+        """
+        if column.dtype.kind in 'iuf':
+            return bool(((column == 0) | (column == 1)).all())
+        if column.dtype.kind == 'O':
+            return all(isinstance(v, (bool, int, float, numpy.bool_, numpy.number)) and v in (0, 1) for v in column)
+        return False
+
+    @classmethod
+    def _to_column(cls, data: 'layout.Array', kind: typing.Optional['dsl.Any'] = None) -> numpy.ndarray:
+        """Helper for creating a typed column array.
+
+        Args:
+            data: Input column values.
+            kind: Optional DSL kind of the column to drive the dtype conversion (inferred otherwise).
+
+        Returns:
+            One-dimensional array of the native dtype.
+        """
+        if not isinstance(data, numpy.ndarray) or data.ndim != 1:
+            data = numpy.array(list(data), dtype=object)
+        if kind is not None:
+            return cls._cast(data, kind)
+        if data.dtype != object:
+            return data
+        return pandas.Series(data, dtype=object).infer_objects().to_numpy()
+
+    @staticmethod
+    def _kinds(schema: typing.Optional['dsl.Source.Schema']) -> typing.Iterator[typing.Optional['dsl.Any']]:
+        """Helper for generating the column kinds of the given (optional) schema.
+
+        Args:
+            schema: Optional schema to take the kinds from.
+
+        Returns:
+            Iterator of the schema field kinds followed by an endless sequence of Nones.
+        """
+        if schema is not None:
+            yield from (f.kind for f in schema)  # pylint: disable=not-an-iterable
+        while True:
+            yield None
+
+    @classmethod
+    def from_columns(
+        cls, columns: 'layout.ColumnMajor', schema: typing.Optional['dsl.Source.Schema'] = None
+    ) -> 'layout.Columnar':
+        """Helper for creating Tabular from sequence of columns.
+
+        Args:
+            columns: Sequence of columns to use.
+            schema: Optional schema whose field kinds drive the column dtypes (inferred otherwise).
+
+        Returns:
+            Columnar instance representing the columnar data.
+        """
+        if schema is None and isinstance(columns, numpy.ndarray) and columns.ndim == 2 and columns.dtype != object:
+            return cls(iter(columns))  # zero-copy row views of the transposed array
+        return cls(cls._to_column(c, k) for c, k in zip(columns, cls._kinds(schema)))
+
+    @classmethod
+    def from_rows(
+        cls, rows: 'layout.RowMajor', schema: typing.Optional['dsl.Source.Schema'] = None
+    ) -> 'layout.Columnar':
+        """Helper for creating Tabular from sequence of rows.
+
+        Args:
+            rows: Sequence of rows to use.
+            schema: Optional schema whose field kinds drive the column dtypes (inferred otherwise).
+
+        Returns:
+            Columnar instance representing the row data.
+        """
+        if isinstance(rows, numpy.ndarray) and rows.ndim == 2 and rows.dtype != object:
+            views = tuple(rows.T)  # zero-copy column views
+            table = cls(cls._to_column(c, k) for c, k in zip(views, cls._kinds(schema)))
+            if all(c is v for c, v in zip(table._columns, views)):
+                table._rows = rows
+            return table
+        if len(rows) and (isinstance(rows[0], str) or not isinstance(rows[0], (typing.Sequence, numpy.ndarray))):
+            # vector of scalars representing a single column
+            return cls([cls._to_column(rows, next(cls._kinds(schema)))])
+        return cls(cls._to_column(c, k) for c, k in zip(zip(*rows), cls._kinds(schema)))
+
+    @classmethod
+    def from_frame(
+        cls, frame: pandas.DataFrame, schema: typing.Optional['dsl.Source.Schema'] = None
+    ) -> 'layout.Columnar':
+        """Helper for creating Tabular from a Pandas DataFrame without any boxing of the values.
+
+        Args:
+            frame: Source DataFrame.
+            schema: Optional schema whose field kinds are used to coerce the columns not already
+                    having the matching dtype (i.e. the ``object`` columns).
+
+        Returns:
+            Columnar instance representing the frame data.
+        """
+        return cls(
+            cls._cast(frame.iloc[:, i].to_numpy(), k) if k is not None else frame.iloc[:, i].to_numpy()
+            for i, k in zip(range(frame.shape[1]), cls._kinds(schema))
+        )
+
+    def to_frame(self, columns: typing.Optional[typing.Sequence[str]] = None) -> pandas.DataFrame:
+        """Get the dataset as a Pandas DataFrame retaining the native column dtypes.
+
+        Args:
+            columns: Optional column names.
+
+        Returns:
+            DataFrame representation.
+        """
+        frame = pandas.DataFrame(dict(enumerate(self._columns)))
+        if columns is not None:
+            frame.columns = columns
+        return frame
+
+    def to_columns(self) -> 'layout.ColumnMajor':
+        return self._columns
+
+    def to_rows(self) -> 'layout.RowMajor':
+        if self._rows is None:
+            if not self._columns:
+                self._rows = numpy.empty((0, 0), dtype=object)
+            elif self._stackable({c.dtype for c in self._columns}):
+                self._rows = numpy.column_stack(self._columns)
+            else:  # boxing only for the mixed types
+                self._rows = numpy.empty((len(self._columns[0]), len(self._columns)), dtype=object)
+                for index, column in enumerate(self._columns):
+                    if column.dtype.kind in 'mM':  # boxing as pandas Timestamps/Timedeltas rather than raw ints
+                        column = pandas.Series(column, copy=False).to_numpy(dtype=object)
+                    self._rows[:, index] = column
+        return self._rows
+
+    @classmethod
+    def _stackable(cls, dtypes: typing.Collection[numpy.dtype]) -> bool:
+        """Check the columns of the given dtypes can be stacked into a single typed array without
+        any loss of precision.
+
+        That is either all of the same dtype or all numeric with the promoted dtype of the same
+        kind or - in case of integers promoted to a float - with its mantissa wide enough to hold
+        the integers exactly (unlike ``int64`` or ``uint64`` promoted to ``float64``).
+
+        Args:
+            dtypes: Set of the column dtypes.
+
+        Returns:
+            True if stackable.
+        """
+        if len(dtypes) == 1:
+            return True
+        if any(d.kind not in cls.NUMERIC for d in dtypes):
+            return False
+        result = numpy.result_type(*dtypes)
+
+        def lossless(dtype: numpy.dtype) -> bool:
+            """Check the given dtype is exactly representable by the result dtype."""
+            if result.kind != 'f' or dtype.kind == 'f':
+                return result.kind == dtype.kind or numpy.can_cast(dtype, result, casting='safe')
+            return dtype.itemsize * 8 - (dtype.kind == 'i') <= numpy.finfo(result).nmant + 1
+
+        return all(lossless(d) for d in dtypes)
+
+    def take_rows(self, indices: typing.Sequence[int]) -> 'layout.Columnar':
+        return self.__class__(c.take(indices) for c in self._columns)
+
+    def take_columns(self, indices: typing.Sequence[int]) -> 'layout.Columnar':
+        return self.__class__(self._columns[i] for i in indices)
@@ -28,6 +28,7 @@ import pandas
 from pandas.core import generic as pdtype
 
 from forml import flow
+from forml.io import layout
 from forml.pipeline import wrap
 
 LOGGER = logging.getLogger(__name__)
@@ -54,6 +55,10 @@ def pandas_read(data: typing.Any, columns: typing.Optional[typing.Sequence[str]]
 
     if isinstance(data, pdtype.NDFrame):
         return data
+    if isinstance(data, layout.Columnar):
+        return data.to_frame(columns)
+    if isinstance(data, layout.Tabular):
+        data = data.to_rows()
     if isinstance(data, numpy.ndarray):
         return from_vector() if data.ndim == 1 else from_rows()
     if isinstance(data, (tuple, list)):
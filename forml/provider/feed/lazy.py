@@ -18,9 +18,11 @@
 Lazy origin pulling feed implementation.
 """
 import abc
+import collections
 import functools
 import itertools
 import logging
+import types
 import typing
 
 import pandas
@@ -30,6 +32,7 @@ from sqlalchemy.engine import interfaces
 
 import forml
 from forml.io import dsl, layout
+from forml.io.dsl import function
 from forml.provider.feed import alchemy
 
 LOGGER = logging.getLogger(__name__)
@@ -104,6 +107,49 @@ class _Columns(dsl.Source.Visitor, dsl.Feature.Visitor):
         super().visit_query(source)
 
 
+class _Predicates(dsl.Source.Visitor):
+    """Visitor for extracting the push-down row filters of the involved tables.
+
+    A filter is only extracted for tables all of whose occurrences within the statement are direct
+    sources of queries with a prefilter (in which case the table predicate is a disjunction of these
+    prefilters).
+    """
+
+    def __init__(self):
+        self._occurrences: collections.Counter['dsl.Table'] = collections.Counter()
+        self._filters: dict['dsl.Table', list['dsl.Predicate']] = {}
+
+    @classmethod
+    @functools.lru_cache
+    def extract(cls, statement: 'dsl.Statement') -> typing.Mapping['dsl.Table', 'dsl.Predicate']:
+        """Frontend method for extracting the push-down predicates of the involved tables.
+
+        Args:
+            statement: Query to extract the predicates from.
+
+        Return:
+            Mapping of tables to their push-down predicates.
+        """
+        visitor = cls()
+        statement.accept(visitor)
+        return types.MappingProxyType(
+            {
+                t: functools.reduce(function.Or, f)
+                for t, f in visitor._filters.items()  # pylint: disable=protected-access
+                if len(f) == visitor._occurrences[t]  # pylint: disable=protected-access
+            }
+        )
+
+    def visit_table(self, source: 'dsl.Table') -> None:
+        self._occurrences[source] += 1
+        super().visit_table(source)
+
+    def visit_query(self, source: 'dsl.Query') -> None:
+        if isinstance(source.source, dsl.Table) and source.prefilter is not None:
+            self._filters.setdefault(source.source, []).append(source.prefilter)
+        super().visit_query(source)
+
+
 Partition = typing.TypeVar('Partition')
 
 
@@ -230,17 +276,30 @@ class Feed(alchemy.Feed):
         def __call__(self, statement: dsl.Statement, entry: typing.Optional[layout.Entry] = None) -> layout.Tabular:
             complete = entry and self._match_entry(statement.schema, entry.schema)[0]
             if not complete:
-                for table, columns in _Columns.extract(statement):
-                    LOGGER.debug('Request for %s using columns: %s', table, columns)
-                    if table not in self._origins:
-                        raise forml.MissingError(f'Unknown origin for table {table}')
-                    origin = self._origins[table]
-                    partitions = origin.partitions(columns, None)
-                    if origin not in self._loaded or self._loaded[origin].symmetric_difference(partitions):
-                        origin(partitions).to_sql(origin.key, self._backend, index=False, if_exists='replace')
-                        self._loaded[origin] = frozenset(partitions)
+                self._load(statement)
             return super().__call__(statement, entry)
 
+        def chunks(self, statement: dsl.Statement, size: int) -> typing.Iterator[layout.Tabular]:
+            self._load(statement)
+            return super().chunks(statement, size)
+
+        def _load(self, statement: dsl.Statement) -> None:
+            """Load all the origin partitions required by the given statement into the backend.
+
+            Args:
+                statement: Query statement to be loaded for.
+            """
+            predicates = _Predicates.extract(statement)
+            for table, columns in _Columns.extract(statement):
+                LOGGER.debug('Request for %s using columns: %s', table, columns)
+                if table not in self._origins:
+                    raise forml.MissingError(f'Unknown origin for table {table}')
+                origin = self._origins[table]
+                partitions = origin.partitions(columns, predicates.get(table))
+                if origin not in self._loaded or self._loaded[origin].symmetric_difference(partitions):
+                    origin(partitions).to_sql(origin.key, self._backend, index=False, if_exists='replace')
+                    self._loaded[origin] = frozenset(partitions)
+
     def __init__(self, *origins: Origin[Partition], **readerkw):
         self._sources: typing.Mapping[dsl.Source, sql.Selectable] = {o.source: sqlalchemy.table(o.key) for o in origins}
         super().__init__({o.source: o.key for o in origins}, origins=origins, **readerkw)
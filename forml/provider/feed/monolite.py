@@ -18,6 +18,8 @@
 Special feed allowing to combine multiple simple sources.
 """
 import abc
+import logging
+import operator
 import pathlib
 import typing
 
@@ -25,11 +27,17 @@ import pandas
 
 import forml
 from forml.io import dsl
+from forml.io.dsl import function
 from forml.provider.feed import lazy
 
 if typing.TYPE_CHECKING:
+    import pyarrow  # pylint: disable=unused-import
+    from pyarrow import compute, dataset  # pylint: disable=unused-import
+
     from forml.io import layout
 
+LOGGER = logging.getLogger(__name__)
+
 
 class Origin(lazy.Origin[None], metaclass=abc.ABCMeta):
     """Base class for data origin handlers."""
@@ -129,6 +137,212 @@ class Csv(Origin):
         return pandas.read_csv(self._path, **self._kwargs)
 
 
+class Fragment(typing.NamedTuple):
+    """Partition of a file-based dataset origin.
+
+    Apart from the file location, it carries the pruned set of row groups, the selected columns and
+    the (push-down) row filter so that it fully identifies the actually loaded content.
+    """
+
+    path: typing.Optional[str]
+    """Path of the dataset file (``None`` for an empty selection)."""
+    groups: typing.Optional[tuple[int, ...]]
+    """Indices of the selected row groups (``None`` for all)."""
+    columns: typing.Optional[tuple[str, ...]]
+    """Names of the selected columns (``None`` for all)."""
+    predicate: typing.Optional['dsl.Predicate']
+    """Optional row filter."""
+
+
+class Dataset(Origin, metaclass=abc.ABCMeta):
+    """Base class for the (potentially multi-file) :doc:`Apache Arrow datasets <pyarrow:python/dataset>`
+    origins.
+
+    The origin path can either point to a single file or a directory of files optionally organized
+    in the *hive-style* partitions (i.e. ``<path>/<column>=<value>/...``). Only the files (and
+    within them only the row groups if supported by the format) potentially matching the
+    push-down predicate are loaded while reading just the required columns.
+
+    Requires the :doc:`pyarrow <pyarrow:index>` package to be installed.
+    """
+
+    FORMAT: str
+    """Arrow dataset format name (to be defined by the implementations)."""
+
+    COMPARISON: typing.Mapping[type['dsl.Predicate'], typing.Callable[..., typing.Any]] = {
+        function.LessThan: operator.lt,
+        function.LessEqual: operator.le,
+        function.GreaterThan: operator.gt,
+        function.GreaterEqual: operator.ge,
+        function.Equal: operator.eq,
+        function.NotEqual: operator.ne,
+    }
+
+    def __init__(
+        self,
+        schema: typing.Union['dsl.Source', str],
+        path: typing.Union[pathlib.Path, str],
+        partitioning: typing.Optional[str] = 'hive',
+    ):
+        super().__init__(schema)
+        self._path: str = str(path)
+        self._partitioning: typing.Optional[str] = partitioning
+        self._dataset: typing.Optional['pyarrow.dataset.Dataset'] = None
+        self._fragments: dict[str, 'pyarrow.dataset.Fragment'] = {}
+
+    def __getstate__(self):
+        return self.__dict__ | {'_dataset': None, '_fragments': {}}
+
+    @classmethod
+    def parse_config(
+        cls, config: typing.Union[pathlib.Path, str, typing.Mapping[str, typing.Any]]
+    ) -> typing.Mapping[str, typing.Any]:
+        if isinstance(config, typing.Mapping):
+            try:
+                return {k: config[k] for k in ('partitioning',) if k in config} | {'path': config['path']}
+            except KeyError as err:
+                raise forml.MissingError('Missing required parameter `path`') from err
+        else:
+            return {'path': config}
+
+    @property
+    def dataset(self) -> 'pyarrow.dataset.Dataset':
+        """Lazily discovered Arrow dataset instance.
+
+        Returns:
+            Arrow dataset.
+        """
+        if not self._dataset:
+            from pyarrow import dataset  # pylint: disable=import-outside-toplevel
+
+            self._dataset = dataset.dataset(self._path, format=self.FORMAT, partitioning=self._partitioning)
+            self._fragments = {f.path: f for f in self._dataset.get_fragments()}
+        return self._dataset
+
+    @classmethod
+    def _filter(cls, feature: 'dsl.Feature', exact: bool = False) -> typing.Optional['pyarrow.compute.Expression']:
+        """Translate the given DSL predicate to the Arrow filter expression.
+
+        Untranslatable terms of a conjunction get dropped (unless in the exact mode) so that the
+        result is potentially weaker than the original predicate (never stronger).
+
+        Args:
+            feature: DSL feature to translate.
+            exact: Whether the translation needs to be strictly equivalent.
+
+        Returns:
+            Arrow expression or None if not translatable.
+        """
+        from pyarrow import compute  # pylint: disable=import-outside-toplevel
+
+        if isinstance(feature, dsl.Column):
+            return compute.field(feature.name)
+        if isinstance(feature, dsl.Literal):
+            return compute.scalar(feature.value)
+        if isinstance(feature, tuple(cls.COMPARISON)):
+            left, right = cls._filter(feature.left, True), cls._filter(feature.right, True)
+            if left is None or right is None:
+                return None
+            return cls.COMPARISON[type(feature)](left, right)
+        if isinstance(feature, (function.IsNull, function.NotNull)):
+            if (operand := cls._filter(feature.operand, True)) is None:
+                return None
+            return operand.is_null() if isinstance(feature, function.IsNull) else operand.is_valid()
+        if isinstance(feature, function.Not):
+            operand = cls._filter(feature.operand, True)
+            return None if operand is None else ~operand
+        if isinstance(feature, function.And):
+            left, right = cls._filter(feature.left, exact), cls._filter(feature.right, exact)
+            if left is None or right is None:
+                return None if exact else left if right is None else right
+            return left & right
+        if isinstance(feature, function.Or):
+            left, right = cls._filter(feature.left, exact), cls._filter(feature.right, exact)
+            return None if left is None or right is None else left | right
+        return None
+
+    def _split(
+        self, fragment: 'pyarrow.dataset.Fragment', expression: typing.Optional['pyarrow.compute.Expression']
+    ) -> typing.Optional[tuple[int, ...]]:
+        """Get the indices of the row groups of the given file fragment potentially matching the
+        filter expression.
+
+        The default implementation doesn't support row groups at all - formats with row-level
+        statistics are expected to override it.
+
+        Args:
+            fragment: File fragment to be split.
+            expression: Optional filter expression.
+
+        Returns:
+            Tuple of row group indices (empty if no matching groups) or None for the entire file.
+        """
+        return None
+
+    def partitions(
+        self, columns: typing.Collection['dsl.Column'], predicate: typing.Optional['dsl.Predicate']
+    ) -> typing.Iterable[Fragment]:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+
+        available = set(self.dataset.schema.names)
+        names = tuple(sorted(c.name for c in columns if c.name in available)) or None
+        if predicate is not None and (expression := self._filter(predicate)) is not None:
+            try:
+                selected = tuple(
+                    Fragment(f.path, g, names, predicate)
+                    for f in self.dataset.get_fragments(filter=expression)
+                    if (g := self._split(f, expression)) is None or g
+                )
+            except pyarrow.ArrowException as err:
+                LOGGER.warning('Ignoring push-down predicate for %s: %s', self.key, err)
+            else:
+                return selected or (Fragment(None, (), names, predicate),)
+        return tuple(Fragment(p, None, names, None) for p in self._fragments)
+
+    def load(self, partition: typing.Optional[Fragment]) -> pandas.DataFrame:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+
+        schema = self.dataset.schema
+        if not partition:
+            return self.dataset.to_table().to_pandas()
+        columns = list(partition.columns or schema.names)
+        if not partition.path:
+            return schema.empty_table().select(columns).to_pandas()
+        fragment = self._fragments[partition.path]
+        if partition.groups is not None:
+            fragment = fragment.subset(row_group_ids=list(partition.groups))
+        expression = self._filter(partition.predicate) if partition.predicate is not None else None
+        try:
+            table = fragment.to_table(schema=schema, columns=columns, filter=expression)
+        except pyarrow.ArrowException:
+            table = fragment.to_table(schema=schema, columns=columns)
+        return table.to_pandas()
+
+
+class Parquet(Dataset):
+    """Parquet file(s) origin.
+
+    Supports pruning of the row groups based on their statistics.
+    """
+
+    FORMAT = 'parquet'
+
+    def _split(
+        self, fragment: 'pyarrow.dataset.Fragment', expression: typing.Optional['pyarrow.compute.Expression']
+    ) -> typing.Optional[tuple[int, ...]]:
+        return tuple(
+            g.id
+            for p in fragment.split_by_row_group(filter=expression, schema=self.dataset.schema)
+            for g in p.row_groups
+        )
+
+
+class Feather(Dataset):
+    """Feather (Arrow IPC) file(s) origin."""
+
+    FORMAT = 'feather'
+
+
 class Feed(lazy.Feed, alias='monolite'):
     """Lightweight feed for pulling data from multiple simple origins.
 
@@ -146,6 +360,9 @@ class Feed(lazy.Feed, alias='monolite'):
 
     * *Inline* data provided as a row-oriented array.
     * *CSV files* parsed using the :func:`pandas:pandas.read_csv`.
+    * *Parquet* and *Feather* (Arrow IPC) files or (*hive-style* partitioned) directories of
+      files loaded using the :doc:`Arrow datasets <pyarrow:python/dataset>` with the column and
+      predicate push-down (including the Parquet row group pruning based on their statistics).
 
     Args:
         inline: Schema mapping of datasets provided inline as native row-oriented arrays.
@@ -155,6 +372,11 @@ class Feed(lazy.Feed, alias='monolite'):
              * ``path`` pointing to the CSV file
              * ``kwargs`` containing additional options to be passed to the underlying
                :func:`pandas:pandas.read_csv`
+        parquet: Schema mapping of datasets stored in Parquet file(s). Values can either be direct
+                 file system paths (of a file or a directory) or mapping with the ``path`` and
+                 an optional ``partitioning`` keys (the latter defaulting to ``hive``).
+        feather: Schema mapping of datasets stored in Feather (Arrow IPC) file(s) configured the
+                 same way as the ``parquet`` origins.
 
     The provider can be enabled using the following :ref:`platform configuration <platform-config>`:
 
@@ -173,14 +395,15 @@ class Feed(lazy.Feed, alias='monolite'):
         [FEED.mono.csv."openschema.sklearn:Iris"]
         path = "/tmp/iris.csv"
         kwargs = {sep = ";", engine = "pyarrow"}
+        [FEED.mono.parquet]
+        "foobar.schemas:Foo.Bar" = "/tmp/foobar/"
 
     Important:
         Select the ``sql`` :ref:`extras to install <install-extras>` ForML together with the
-        SQLAlchemy support.
+        SQLAlchemy support (plus the ``arrow`` extras for the Parquet/Feather origins).
 
     Todo:
-        * More file types (json, parquet)
-        * Multi-file data sources (partitions)
+        * More file types (json)
     """
 
     def __init__(
@@ -192,10 +415,26 @@ class Feed(lazy.Feed, alias='monolite'):
                 typing.Union[pathlib.Path, str, typing.Mapping[str, typing.Any]],
             ]
         ] = None,
+        parquet: typing.Optional[
+            typing.Mapping[
+                typing.Union['dsl.Source', str],
+                typing.Union[pathlib.Path, str, typing.Mapping[str, typing.Any]],
+            ]
+        ] = None,
+        feather: typing.Optional[
+            typing.Mapping[
+                typing.Union['dsl.Source', str],
+                typing.Union[pathlib.Path, str, typing.Mapping[str, typing.Any]],
+            ]
+        ] = None,
     ):
         origins = []
         if inline:
             origins.extend(Inline.create(inline))
         if csv:
             origins.extend(Csv.create(csv))
+        if parquet:
+            origins.extend(Parquet.create(parquet))
+        if feather:
+            origins.extend(Feather.create(feather))
         super().__init__(*origins)
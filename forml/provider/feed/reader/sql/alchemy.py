@@ -18,15 +18,19 @@
 """
 SQLAlchemy based ETL reader.
 """
+import contextlib
 import datetime
+import functools
 import inspect
 import logging
 import operator
+import os
 import typing
 
 import pandas
+import sqlalchemy
 from pyhive import sqlalchemy_trino as trino
-from sqlalchemy import func, sql
+from sqlalchemy import engine, func, sql
 from sqlalchemy import types as sqltypes
 from sqlalchemy.dialects.sqlite import base as sqlite
 from sqlalchemy.engine import interfaces
@@ -327,22 +331,91 @@ class Parser(parsmod.Visitor[sql.Selectable, sql.ColumnElement]):  # pylint: dis
         return ref, ref
 
 
+class Pool:
+    """Process-level SQLAlchemy engine (maintaining its own connection pool) lazily created from the
+    connection URL.
+
+    Only the URL and the engine options get pickled so that the instance can be shipped to other
+    processes where it recreates its engine upon the first use. An engine inherited over a *fork*
+    gets reinitialized (without closing the connections still owned by the parent) once used from
+    the child process.
+
+    Connections are checked for liveness upon each checkout (the ``pool_pre_ping`` engine option)
+    unless explicitly disabled.
+
+    Args:
+        url: SQLAlchemy connection URL.
+        options: Extra :func:`sqlalchemy.create_engine` options (i.e. ``pool_size``,
+                 ``max_overflow``, ``pool_recycle`` or ``pool_timeout``).
+    """
+
+    def __init__(self, url: str, **options: typing.Any):
+        self._url: str = url
+        self._options: typing.Mapping[str, typing.Any] = {'pool_pre_ping': True, **options}
+        self._engine: typing.Optional[engine.Engine] = None
+        self._pid: typing.Optional[int] = None
+
+    def __repr__(self):
+        return f'Pool[{sqlalchemy.engine.make_url(self._url)!r}]'
+
+    def __reduce__(self):
+        return functools.partial(self.__class__, **self._options), (self._url,)
+
+    @property
+    def engine(self) -> engine.Engine:
+        """The engine instance valid in the current process.
+
+        Returns:
+            SQLAlchemy engine.
+        """
+        pid = os.getpid()
+        if not self._engine:
+            self._engine = sqlalchemy.create_engine(self._url, **self._options)
+        elif self._pid != pid:
+            LOGGER.debug('Reinitializing %s inherited from process %d', self, self._pid)
+            self._engine.dispose(close=False)
+        self._pid = pid
+        return self._engine
+
+    def dispose(self) -> None:
+        """Close all the pooled connections."""
+        if self._engine:
+            self._engine.dispose()
+            self._engine = None
+
+
 class Reader(io.Feed.Reader[sql.Selectable, sql.ColumnElement, pandas.DataFrame]):
     """:doc:`SQLAlchemy <sqlalchemy:index>` based reader.
 
     Using the :doc:`SQLAlchemy core <sqlalchemy:core/index>` for accessing any compatible SQL
     engine.
+
+    The ``connection`` can be either a plain URL (turned into a new engine by pandas upon each read),
+    a :class:`Pool` instance (reusing its process-level engine across the reads) or any other
+    SQLAlchemy connectable.
     """
 
     def __init__(
         self,
         sources: typing.Mapping[dsl.Source, parsmod.Source],
         features: typing.Mapping[dsl.Feature, parsmod.Feature],
-        connection: typing.Union[str, interfaces.Connectable],
+        connection: typing.Union[str, Pool, interfaces.Connectable],
         **kwargs,
     ):
         super().__init__(sources, features, **{**kwargs, 'con': connection})
 
+    @staticmethod
+    def _connectable(con: typing.Union[str, Pool, interfaces.Connectable]) -> typing.Union[str, interfaces.Connectable]:
+        """Helper for resolving the connection argument.
+
+        Args:
+            con: Connection URL, pool or a connectable instance.
+
+        Returns:
+            Connection URL or connectable instance.
+        """
+        return con.engine if isinstance(con, Pool) else con
+
     @classmethod
     def parser(
         cls,
@@ -362,7 +435,8 @@ class Reader(io.Feed.Reader[sql.Selectable, sql.ColumnElement, pandas.DataFrame]
 
     @classmethod
     def format(cls, schema: dsl.Source.Schema, data: pandas.DataFrame) -> layout.Tabular:
-        """Pandas is already feature - just return the underlying array.
+        """Pandas is already feature - just wrap the frame columns coercing only those not matching
+        the schema kinds (typically the ``object`` columns of nullable or temporal fields).
 
         Args:
             schema: Layout schema.
@@ -371,18 +445,52 @@ class Reader(io.Feed.Reader[sql.Selectable, sql.ColumnElement, pandas.DataFrame]
         Returns:
             Tabular output.
         """
-        return layout.Dense.from_rows(data.values)
+        return layout.Columnar.from_frame(data, schema)
 
     @classmethod
-    def read(cls, statement: sql.Selectable, **kwargs) -> pandas.DataFrame:
+    def read(
+        cls, statement: sql.Selectable, con: typing.Union[str, Pool, interfaces.Connectable], **kwargs
+    ) -> pandas.DataFrame:
         """Perform the read operation with the given statement.
 
         Args:
             statement: SQLAlchemy select statement.
+            con: SQLAlchemy connection URL, pool or connectable instance.
             kwargs: Pandas read_sql parameters.
 
         Returns:
             Pandas DataFrame of the requested data.
         """
         LOGGER.debug('Submitting SQL query')
-        return pandas.read_sql(statement, **kwargs)
+        return pandas.read_sql(statement, cls._connectable(con), **kwargs)
+
+    @classmethod
+    def stream(
+        cls, statement: sql.Selectable, size: int, con: typing.Union[str, Pool, interfaces.Connectable], **kwargs
+    ) -> typing.Iterator[pandas.DataFrame]:
+        """Perform the read operation with the given statement fetching the rows in chunks.
+
+        The query is executed using a server-side cursor (where supported by the DB driver) so that
+        the rows are fetched incrementally rather than buffered all at once on the client side.
+
+        Args:
+            statement: SQLAlchemy select statement.
+            size: Maximum number of rows per chunk.
+            con: SQLAlchemy connection URL, pool or connectable instance.
+            kwargs: Pandas read_sql parameters.
+
+        Returns:
+            Iterator of Pandas DataFrames of the requested data.
+        """
+        con = cls._connectable(con)
+        owned = isinstance(con, str)
+        if owned:  # ad-hoc engine to be disposed once done (use the Pool for reusing it across reads)
+            con = sqlalchemy.create_engine(con)
+        try:
+            with con.connect() if isinstance(con, engine.Engine) else contextlib.nullcontext(con) as connection:
+                connection = connection.execution_options(stream_results=True, max_row_buffer=size)
+                LOGGER.debug('Submitting SQL query for chunked read')
+                yield from pandas.read_sql(statement, connection, chunksize=size, **kwargs)
+        finally:
+            if owned:
+                con.dispose()
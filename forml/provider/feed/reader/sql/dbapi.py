@@ -19,11 +19,14 @@
 PEP249 DB API SQL reader.
 """
 import abc
+import collections
 import contextlib
 import logging
+import os
 import re
 import typing
 
+import forml
 from forml import io
 from forml.io import dsl, layout
 from forml.io.dsl import function
@@ -332,8 +335,136 @@ class Parser(parsmod.Visitor[str, str]):  # pylint: disable=unsubscriptable-obje
         return f'{self.Wrap.word(instance)} AS "{name}"', name
 
 
+class Pool:
+    """Process-level pool of reusable :pep:`249` connections.
+
+    Idle connections (up to the given ``size``) are retained for subsequent reuse and get checked
+    for liveness (using the ``ping`` statement) upon each checkout. Only the connection factory
+    gets pickled so that the instance can be shipped to other processes where it starts empty; a
+    pool inherited over a *fork* forgets (without closing) the connections owned by the parent.
+
+    Args:
+        factory: Callable returning new PEP249 connection instances.
+        size: Maximum number of retained idle connections.
+        ping: Optional liveness check statement (the check is skipped if None).
+    """
+
+    def __init__(
+        self, factory: typing.Callable[[], typing.Any], size: int = 5, ping: typing.Optional[str] = 'SELECT 1'
+    ):
+        if size < 0:
+            raise forml.InvalidError(f'Invalid pool size: {size}')
+        self._factory: typing.Callable[[], typing.Any] = factory
+        self._size: int = size
+        self._ping: typing.Optional[str] = ping
+        self._idle: collections.deque = collections.deque()
+        self._pid: int = os.getpid()
+
+    def __repr__(self):
+        return f'Pool[{len(self._idle)}/{self._size}]'
+
+    def __reduce__(self):
+        return self.__class__, (self._factory, self._size, self._ping)
+
+    def __len__(self):
+        return len(self._idle)
+
+    def _alive(self, connection: typing.Any) -> bool:
+        """Check the given connection is usable.
+
+        Args:
+            connection: Connection to be checked.
+
+        Returns:
+            True if alive.
+        """
+        if not self._ping:
+            return True
+        try:
+            cursor = connection.cursor()
+            cursor.execute(self._ping)
+            cursor.fetchall()
+            cursor.close()
+        except Exception as err:  # pylint: disable=broad-except
+            LOGGER.debug('Discarding dead connection: %s', err)
+            with contextlib.suppress(Exception):
+                connection.close()
+            return False
+        return True
+
+    def _acquire(self) -> typing.Any:
+        """Get an idle connection or create a new one.
+
+        Returns:
+            Connection instance.
+        """
+        if (pid := os.getpid()) != self._pid:
+            LOGGER.debug('Reinitializing %s inherited from process %d', self, self._pid)
+            self._idle = collections.deque()
+            self._pid = pid
+        while True:
+            try:
+                connection = self._idle.pop()
+            except IndexError:
+                LOGGER.debug('Establishing SQL connection')
+                return self._factory()
+            if self._alive(connection):
+                return connection
+
+    def _release(self, connection: typing.Any) -> None:
+        """Return the connection back to the pool (or close it if the pool is full).
+
+        Any pending transaction gets rolled back first so that it doesn't leak into the next
+        checkout (connections failing the rollback get closed instead).
+
+        Args:
+            connection: Connection to be released.
+        """
+        if os.getpid() == self._pid and len(self._idle) < self._size:
+            try:
+                connection.rollback()
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.debug('Discarding connection failing to roll back: %s', err)
+            else:
+                self._idle.append(connection)
+                return
+        with contextlib.suppress(Exception):
+            connection.close()
+
+    @contextlib.contextmanager
+    def connect(self) -> typing.Iterator[typing.Any]:
+        """Context manager for checking out a pooled connection.
+
+        Connections used by a failing block get closed rather than returned to the pool.
+
+        Returns:
+            Connection instance.
+        """
+        connection = self._acquire()
+        try:
+            yield connection
+        except BaseException:
+            with contextlib.suppress(Exception):
+                connection.close()
+            raise
+        self._release(connection)
+
+    def close(self) -> None:
+        """Close all the idle connections."""
+        while self._idle:
+            with contextlib.suppress(Exception):
+                self._idle.pop().close()
+
+
 class Reader(io.Feed.Reader[str, str, layout.RowMajor], metaclass=abc.ABCMeta):
-    """SQL reader base class for :pep:`249` compliant DB APIs."""
+    """SQL reader base class for :pep:`249` compliant DB APIs.
+
+    By default, a new connection is established (and closed) for every single read. Feeds issuing
+    frequent reads can provide a :class:`Pool` instance as the ``pool`` reader keyword argument to
+    reuse the connections instead::
+
+        super().__init__(pool=dbapi.Pool(functools.partial(self.Reader.connection, **connectkw)))
+    """
 
     @classmethod
     @abc.abstractmethod
@@ -361,19 +492,58 @@ class Reader(io.Feed.Reader[str, str, layout.RowMajor], metaclass=abc.ABCMeta):
         return Parser(sources, features)
 
     @classmethod
-    def read(cls, statement: str, **kwargs) -> layout.RowMajor:
+    def _connect(cls, pool: typing.Optional[Pool], **kwargs) -> typing.ContextManager:
+        """Helper for getting the connection either from the pool or a new one.
+
+        Args:
+            pool: Optional connection pool.
+            kwargs: Connection specific keyword arguments (used if no pool).
+
+        Returns:
+            Context manager of the connection instance.
+        """
+        if pool is not None:
+            return pool.connect()
+        LOGGER.debug('Establishing SQL connection')
+        return contextlib.closing(cls.connection(**kwargs))
+
+    @classmethod
+    def read(cls, statement: str, pool: typing.Optional[Pool] = None, **kwargs) -> layout.RowMajor:
         """Perform the read operation with the given statement.
 
         Args:
             statement: Query statement in the reader's native syntax.
+            pool: Optional connection pool to be used instead of establishing a new connection.
             kwargs: Optional reader keyword args.
 
         Returns:
             Row-oriented data provided by the reader.
         """
-        LOGGER.debug('Establishing SQL connection')
-        with contextlib.closing(cls.connection(**kwargs)) as connection:
+        with cls._connect(pool, **kwargs) as connection:
             cursor = connection.cursor()
             LOGGER.debug('Executing SQL query')
             cursor.execute(statement)
             return cursor.fetchall()
+
+    @classmethod
+    def stream(
+        cls, statement: str, size: int, pool: typing.Optional[Pool] = None, **kwargs
+    ) -> typing.Iterator[layout.RowMajor]:
+        """Perform the read operation with the given statement fetching the rows in chunks.
+
+        Args:
+            statement: Query statement in the reader's native syntax.
+            size: Maximum number of rows per chunk.
+            pool: Optional connection pool to be used instead of establishing a new connection.
+            kwargs: Optional reader keyword args.
+
+        Returns:
+            Iterator of row-oriented data chunks provided by the reader.
+        """
+        with cls._connect(pool, **kwargs) as connection:
+            cursor = connection.cursor()
+            cursor.arraysize = size
+            LOGGER.debug('Executing SQL query')
+            cursor.execute(statement)
+            while chunk := cursor.fetchmany(size):
+                yield chunk
@@ -72,6 +72,7 @@ class Stats(routing.Route):
     """Stats endpoint route."""
 
     PATH = '/stats'
+    MEDIA_TYPE = 'text/plain; version=0.0.4'
 
     def __init__(self, handler: typing.Callable[[], typing.Awaitable[runtime.Stats]]):
         super().__init__(self.PATH, self.__endpoint, methods=['GET'])
@@ -84,11 +85,11 @@ class Stats(routing.Route):
             Output instance.
         """
         result = await self.__handler()
-        return respmod.Response(str(result), media_type='text/plain')
+        return respmod.Response(result.to_prometheus(), media_type=self.MEDIA_TYPE)
 
 
 class Gateway(runtime.Gateway, alias='rest'):
-    """Gateway(inventory: typing.Optional[asset.Inventory] = None, registry: typing.Optional[asset.Registry] = None, feeds: typing.Optional[io.Importer] = None, processes: typing.Optional[int] = None, loop: typing.Optional[asyncio.AbstractEventLoop] = None, server: typing.Callable[[applications.Starlette, ...], None] = uvicorn.run, **options)
+    """Gateway(inventory: typing.Optional[asset.Inventory] = None, registry: typing.Optional[asset.Registry] = None, feeds: typing.Optional[io.Importer] = None, processes: typing.Optional[int] = None, loop: typing.Optional[asyncio.AbstractEventLoop] = None, batch_size: typing.Optional[int] = None, batch_delay: typing.Optional[float] = None, codec: str = 'process', fuse: bool = False, capacity: typing.Optional[int] = None, idle: typing.Optional[float] = None, memory: typing.Optional[int] = None, share: bool = False, memo: typing.Optional[int] = None, backend: str = 'expression', workers: typing.Optional[int] = None, cache_size: typing.Optional[int] = None, cache_ttl: typing.Optional[float] = None, server: typing.Callable[[applications.Starlette, ...], None] = uvicorn.run, **options)
 
     Serving gateway implemented as a RESTful API.
 
@@ -98,7 +99,7 @@ class Gateway(runtime.Gateway, alias='rest'):
     Path                Method  Description
     ==================  ======  ==================================================================
     ``/stats``          GET     Retrieve the Engine-provided performance :class:`metrics report
-                                <forml.runtime.Stats>`.
+                                <forml.runtime.Stats>` in the Prometheus text format.
     ``/<application>``  POST    Prediction request for the given :ref:`application <application>`.
                                 The entire request *body* is passed to the :ref:`Engine <serving>`
                                 as the :class:`layout.Request.payload <forml.io.layout.Request>`
@@ -115,6 +116,27 @@ class Gateway(runtime.Gateway, alias='rest'):
                configuration).
         processes: Process pool size for each model sandbox.
         loop: Explicit event loop instance.
+        batch_size: Enable micro-batching of up to the given number of rows coalesced into a single
+                    prediction call (only valid for pipelines with row-independent outcomes).
+        batch_delay: Maximum number of seconds to wait for filling a micro-batch.
+        codec: Execution strategy for the request decoding and response encoding (one of ``inline``,
+               ``thread`` or ``process``).
+        fuse: Encode the response already within the model worker process (saving one process
+              boundary crossing per request).
+        capacity: Maximum number of model instances to be kept loaded at a time (unlimited if not
+                  specified).
+        idle: Number of seconds after which an unused model instance gets unloaded.
+        memory: Maximum total memory footprint (in bytes) of the loaded model instances.
+        share: Load the model states in a copy-on-write friendly mode (freezing the garbage
+               collector and relocating large arrays into shared memory) so that all the forked
+               workers share one copy.
+        memo: Enable the row-level memoization of up to the given number of rows within each of
+              the model workers (only valid for pipelines with row-independent outcomes).
+        backend: Execution backend of the :class:`model workers <forml.provider.runner.pyfunc.Runner>`
+                 (one of ``expression``, ``program`` or ``parallel``).
+        workers: Thread pool size of the ``parallel`` backend within each of the model workers.
+        cache_size: Enable caching of up to the given number of responses to repeated requests.
+        cache_ttl: Number of seconds after which a cached response expires.
         server: Serving loop main function accepting the provided `application instance
                 <https://www.starlette.io/applications/>`_ (defaults to `uvicorn.run
                 <https://www.uvicorn.org/deployment/#running-programmatically>`_).
@@ -146,10 +168,44 @@ class Gateway(runtime.Gateway, alias='rest'):
         feeds: typing.Optional[io.Importer] = None,
         processes: typing.Optional[int] = None,
         loop: typing.Optional[asyncio.AbstractEventLoop] = None,
+        batch_size: typing.Optional[int] = None,
+        batch_delay: typing.Optional[float] = None,
+        codec: str = 'process',
+        fuse: bool = False,
+        capacity: typing.Optional[int] = None,
+        idle: typing.Optional[float] = None,
+        memory: typing.Optional[int] = None,
+        share: bool = False,
+        memo: typing.Optional[int] = None,
+        backend: str = 'expression',
+        workers: typing.Optional[int] = None,
+        cache_size: typing.Optional[int] = None,
+        cache_ttl: typing.Optional[float] = None,
         server: typing.Callable[[applications.Starlette, ...], None] = uvicorn.run,
         **options,
     ):
-        super().__init__(inventory, registry, feeds, processes=processes, loop=loop, server=server, options=options)
+        super().__init__(
+            inventory,
+            registry,
+            feeds,
+            processes=processes,
+            loop=loop,
+            batch_size=batch_size,
+            batch_delay=batch_delay,
+            codec=codec,
+            fuse=fuse,
+            capacity=capacity,
+            idle=idle,
+            memory=memory,
+            share=share,
+            memo=memo,
+            backend=backend,
+            workers=workers,
+            cache_size=cache_size,
+            cache_ttl=cache_ttl,
+            server=server,
+            options=options,
+        )
 
     @classmethod
     def run(
@@ -0,0 +1,142 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Asyncio runner.
+"""
+import asyncio
+import logging
+import typing
+from concurrent import futures
+
+from forml import flow, runtime
+from forml.io._input import extract
+from forml.io._output import commit
+
+if typing.TYPE_CHECKING:
+    from forml import io
+    from forml.io import asset
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Runner(runtime.Runner, alias='asyncio'):
+    """ForML runner executing the compiled task graph as a set of :doc:`asyncio <python:library/asyncio>`
+    tasks each awaiting its upstream dependencies.
+
+    The instructions are executed in threads using two separate executors:
+
+    * the I/O-bound ones (state loading/dumping, generation committing and the feed readers or sink
+      writers) using the default event loop executor so that the independent ones can overlap
+    * the CPU-bound functors using a dedicated pool bounded by the number of *workers*
+
+    The total number of concurrently executing instructions is limited by the *concurrency* level. On
+    first failure, all the remaining tasks get cancelled (while the already running instructions
+    can't be interrupted).
+
+    Args:
+        concurrency: Maximum number of concurrently executing instructions (unlimited by default).
+        workers: Thread pool size for the CPU-bound instructions.
+        cache: Optional :class:`node output cache <forml.flow.Cache>` (or its directory path).
+
+    The provider can be enabled using the following :ref:`platform configuration <platform-config>`:
+
+    .. code-block:: toml
+       :caption: config.toml
+
+        [RUNNER.async]
+        provider = "asyncio"
+        concurrency = 16
+        workers = 4
+    """
+
+    IO: tuple[type[flow.Actor], ...] = (extract.Driver, commit.Driver)
+    """Actor types considered I/O-bound."""
+
+    def __init__(
+        self,
+        instance: typing.Optional['asset.Instance'] = None,
+        feed: typing.Optional['io.Feed'] = None,
+        sink: typing.Optional['io.Sink'] = None,
+        concurrency: typing.Optional[int] = None,
+        workers: typing.Optional[int] = None,
+        cache: typing.Optional[typing.Union[str, 'flow.Cache']] = None,
+    ):
+        super().__init__(instance, feed, sink, cache, concurrency=concurrency, workers=workers)
+
+    @classmethod
+    def run(cls, symbols: typing.Collection[flow.Symbol], **kwargs) -> None:
+        asyncio.run(cls.execute(symbols, kwargs.get('concurrency'), kwargs.get('workers')))
+
+    @classmethod
+    def bound(cls, instruction: flow.Instruction) -> bool:
+        """Check whether the given instruction is I/O-bound.
+
+        Args:
+            instruction: Instruction to be checked.
+
+        Returns:
+            True if I/O-bound.
+        """
+        if isinstance(instruction, (flow.Loader, flow.Dumper, flow.Committer)):
+            return True
+        if not isinstance(instruction, flow.Functor):
+            return False
+        actor = instruction.builder.actor
+        return isinstance(actor, type) and issubclass(actor, cls.IO)
+
+    @classmethod
+    async def execute(
+        cls,
+        symbols: typing.Collection[flow.Symbol],
+        concurrency: typing.Optional[int] = None,
+        workers: typing.Optional[int] = None,
+    ) -> None:
+        """Execute the given symbols as asyncio tasks.
+
+        Args:
+            symbols: Symbols to be executed.
+            concurrency: Maximum number of concurrently executing instructions.
+            workers: Thread pool size for the CPU-bound instructions.
+        """
+        upstream: dict[flow.Instruction, tuple[flow.Instruction]] = dict(symbols)
+        assert len(upstream) == len(symbols), 'Duplicated symbols in DAG sequence'
+        loop = asyncio.get_running_loop()
+        limit = asyncio.Semaphore(concurrency or len(upstream))
+        pool = futures.ThreadPoolExecutor(workers, thread_name_prefix='asyncio')
+        tasks: dict[flow.Instruction, asyncio.Task] = {}
+
+        async def task(instruction: flow.Instruction) -> typing.Any:
+            """Coroutine executing the given instruction once its arguments are available."""
+            args = [await tasks[a] for a in upstream[instruction]]
+            if isinstance(instruction, flow.Getter):  # trivial
+                return instruction(*args)
+            async with limit:
+                return await loop.run_in_executor(None if cls.bound(instruction) else pool, instruction, *args)
+
+        for instruction in upstream:
+            tasks[instruction] = asyncio.create_task(task(instruction), name=repr(instruction))
+        try:
+            done, pending = await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for future in done:
+                if not future.cancelled() and future.exception():
+                    raise future.exception()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
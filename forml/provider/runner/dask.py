@@ -18,16 +18,21 @@
 """
 Dask runner.
 """
+import collections
 import functools
 import importlib
 import logging
 import typing
+import uuid
 
 import dask
 
+import forml
 from forml import flow, runtime
 
 if typing.TYPE_CHECKING:
+    from dask import distributed
+
     from forml import io
     from forml.io import asset
 
@@ -43,6 +48,19 @@ class Runner(runtime.Runner, alias='dask'):
 
                    * ``threaded``
                    * ``multiprocessing``
+                   * ``distributed`` - submitting the graph to a persistent :doc:`Dask
+                     distributed <distributed:index>` cluster (requires the ``distributed``
+                     package)
+        address: Address of the existing Dask distributed scheduler to connect to (a local cluster
+                 gets started on the first run if omitted) - only applicable to the ``distributed``
+                 scheduler.
+        cache: Optional :class:`node output cache <forml.flow.Cache>` (or its directory path).
+
+    With the ``distributed`` scheduler, the client connection (and the local cluster if started)
+    is reused by all subsequent runs within the same process. The actor builders and the loaded
+    actor states are scattered to the cluster just once (the states keyed by their absolute
+    state IDs) so that repeated runs involving the same actors don't pay for their repeated
+    serialization and transfer and the tasks consuming them get scheduled close to the data.
 
     The provider can be enabled using the following :ref:`platform configuration <platform-config>`:
 
@@ -53,9 +71,14 @@ class Runner(runtime.Runner, alias='dask'):
         provider = "dask"
         scheduler = "threaded"
 
+        [RUNNER.cluster]
+        provider = "dask"
+        scheduler = "distributed"
+        address = "tcp://dask-scheduler:8786"
+
     Important:
         Select the ``dask`` :ref:`extras to install <install-extras>` ForML together with the Dask
-        support.
+        support (or the ``dask-distributed`` extras for the ``distributed`` scheduler).
     """
 
     class Dag(dict):
@@ -90,8 +113,15 @@ class Runner(runtime.Runner, alias='dask'):
 
                 return functools.reduce(nonnull, leaves, None)
 
-        def __init__(self, symbols: typing.Collection[flow.Symbol]):
-            tasks: dict[int, tuple[flow.Instruction, int]] = {id(i): (i, *(id(p) for p in a)) for i, a in symbols}
+        def __init__(self, symbols: typing.Collection[flow.Symbol], prefix: typing.Optional[str] = None):
+            self.prefix: str = prefix or uuid.uuid4().hex
+            def key(instruction: flow.Instruction) -> typing.Hashable:
+                """Get the task key of the given instruction (made globally unique using the prefix)."""
+                return id(instruction) if prefix is None else (prefix, id(instruction))
+
+            tasks: dict[typing.Hashable, tuple[flow.Instruction, typing.Hashable]] = {
+                key(i): (i, *(key(p) for p in a)) for i, a in symbols
+            }
             assert len(tasks) == len(symbols), 'Duplicated symbols in DAG sequence'
             leaves = set(tasks).difference(p for _, *a in tasks.values() for p in a)
             assert leaves, 'Not acyclic'
@@ -100,7 +130,7 @@ class Runner(runtime.Runner, alias='dask'):
                     'Dag output based on %d leaves: %s', leaves_len, ','.join(repr(tasks[n][0]) for n in leaves)
                 )
                 output = self.Output()
-                self.output = id(output)
+                self.output = key(output)
                 tasks[self.output] = output, *leaves
             else:
                 self.output = leaves.pop()
@@ -109,7 +139,48 @@ class Runner(runtime.Runner, alias='dask'):
         def __repr__(self):
             return repr({k: (repr(i), *a) for k, (i, *a) in self.items()})
 
+    class Remote(flow.Instruction):
+        """Functor proxy instruction receiving the actor builder (scattered to the cluster just once)
+        as its first argument so that only the lightweight action gets serialized with each run.
+
+        Args:
+            functor: Functor to be proxied.
+        """
+
+        def __init__(self, functor: flow.Functor):
+            self._name: str = repr(functor)
+            self._action: typing.Any = functor.action
+            self.lean = functor.lean
+            self.instrument = functor.instrument
+
+        def __repr__(self):
+            return self._name
+
+        def execute(self, builder: flow.Builder, *args: typing.Any) -> typing.Any:  # pylint: disable=arguments-differ
+            """Instruction functionality.
+
+            Args:
+                builder: Actor builder of the proxied functor.
+                *args: Functor arguments.
+
+            Returns:
+                Functor output.
+            """
+            functor = flow.Functor(builder, self._action)
+            functor.lean = self.lean
+            return functor.execute(*args)
+
     SCHEDULER = 'multiprocessing'
+    DISTRIBUTED = 'distributed'
+    """Name of the scheduler using the persistent distributed cluster."""
+    SCATTERED = 256
+    """Maximum number of the scattered objects (states and builders) retained per each cluster."""
+
+    _ACTIVE = frozenset({'running', 'connecting', 'newly-created'})
+    _CLIENTS: dict[typing.Optional[str], 'distributed.Client'] = {}
+    _SCATTERED: dict[
+        'distributed.Client', collections.OrderedDict[typing.Hashable, tuple[typing.Any, 'distributed.Future']]
+    ] = {}
 
     def __init__(
         self,
@@ -117,12 +188,97 @@ class Runner(runtime.Runner, alias='dask'):
         feed: typing.Optional['io.Feed'] = None,
         sink: typing.Optional['io.Sink'] = None,
         scheduler: typing.Optional[str] = None,
+        cache: typing.Optional[typing.Union[str, 'flow.Cache']] = None,
+        address: typing.Optional[str] = None,
     ):
-        super().__init__(instance, feed, sink, scheduler=scheduler)
+        if address and scheduler != self.DISTRIBUTED:
+            raise forml.InvalidError(f'Address not applicable to {scheduler or self.SCHEDULER} scheduler')
+        super().__init__(instance, feed, sink, cache, scheduler=scheduler, address=address)
 
     @classmethod
     def run(cls, symbols: typing.Collection[flow.Symbol], **kwargs) -> None:
+        scheduler = kwargs.get('scheduler') or cls.SCHEDULER
+        if scheduler == cls.DISTRIBUTED:
+            cls.submit(symbols, cls.client(kwargs.get('address')))
+            return
         dag = cls.Dag(symbols)
         LOGGER.debug('Dask DAG: %s', dag)
-        scheduler = kwargs.get('scheduler') or cls.SCHEDULER
         importlib.import_module(f'{dask.__name__}.{scheduler}').get(dag, dag.output)
+
+    @classmethod
+    def client(cls, address: typing.Optional[str] = None) -> 'distributed.Client':
+        """Get the (cached) distributed client connected to the given scheduler address.
+
+        Args:
+            address: Scheduler address to connect to (starting a local cluster if None).
+
+        Returns:
+            Distributed client instance.
+        """
+        client = cls._CLIENTS.get(address)
+        if not client or client.status not in cls._ACTIVE:
+            for stale in [c for c in cls._SCATTERED if c.status not in cls._ACTIVE]:
+                del cls._SCATTERED[stale]  # the futures of closed clients are void anyway
+            distributed = importlib.import_module(f'{dask.__name__}.distributed')
+            LOGGER.info('Connecting Dask distributed client to %s', address or 'new local cluster')
+            client = cls._CLIENTS[address] = distributed.Client(address, set_as_default=False)
+        return client
+
+    @classmethod
+    def submit(cls, symbols: typing.Collection[flow.Symbol], client: 'distributed.Client') -> None:
+        """Execute the symbols on the distributed cluster.
+
+        The loaders get executed locally with their states scattered to the cluster (unless already
+        present there) and so do the builders of the functors (which get replaced by their
+        :class:`remote proxies <Runner.Remote>`).
+
+        Args:
+            symbols: Symbols to be executed.
+            client: Distributed client instance.
+        """
+        dag = cls.Dag(symbols, prefix=uuid.uuid4().hex)
+        for key, (instruction, *args) in dag.items():
+            if isinstance(instruction, flow.Loader):
+                if (sid := instruction.sid) is None:
+                    dag[key] = instruction()
+                else:
+                    dag[key] = cls.scatter(client, sid, instruction)
+            elif isinstance(instruction, flow.Functor):
+                builder = instruction.builder
+                future = cls.scatter(client, ('builder', id(builder)), lambda b=builder: b, builder)
+                dag[key] = cls.Remote(instruction), future, *args
+        LOGGER.debug('Dask DAG: %s', dag)
+        client.get(dag, dag.output)
+
+    @classmethod
+    def scatter(
+        cls,
+        client: 'distributed.Client',
+        key: typing.Hashable,
+        value: typing.Callable[[], typing.Any],
+        anchor: typing.Any = None,
+    ) -> 'distributed.Future':
+        """Scatter the value to the cluster (unless already present there under the same key).
+
+        Args:
+            client: Distributed client instance.
+            key: Identity of the value.
+            value: Callback providing the value to be scattered (only called if not present yet).
+            anchor: Optional object to be retained as long as the value stays scattered (keeping
+                    its identity based key valid).
+
+        Returns:
+            Future of the scattered value.
+        """
+        scattered = cls._SCATTERED.setdefault(client, collections.OrderedDict())
+        if (entry := scattered.get(key)) is None or entry[1].status != 'finished':
+            LOGGER.debug('Scattering %s', key)
+            entry = scattered[key] = anchor, client.scatter([value()], hash=False)[0]  # not splitting tuples
+        scattered.move_to_end(key)
+        while len(scattered) > cls.SCATTERED:
+            scattered.popitem(last=False)[1][1].release()
+        return entry[1]
+
+
+# the (uniquely prefixed) DAG is tokenized by its prefix instead of the (non-deterministic) pickling of its instructions
+dask.base.normalize_token.register(Runner.Dag)(lambda d: (Runner.Dag.__name__, d.prefix))
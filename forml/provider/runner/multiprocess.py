@@ -0,0 +1,210 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Multiprocess runner.
+"""
+import collections
+import logging
+import mmap
+import os
+import pickle
+import shutil
+import tempfile
+import typing
+import uuid
+from concurrent import futures
+
+import cloudpickle
+
+from forml import flow, runtime
+
+if typing.TYPE_CHECKING:
+    from forml import io
+    from forml.io import asset
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Handle(typing.NamedTuple):
+    """Reference to an intermediate task result exchanged between the worker processes.
+
+    The value is pickled using the protocol 5 with any large out-of-band buffers (i.e. the numpy,
+    pandas or Arrow data) written into a temporal file which the consumers memory-map instead of
+    unpickling a copy of the data.
+    """
+
+    header: bytes
+    """Pickled value (without the out-of-band buffers)."""
+
+    path: typing.Optional[str] = None
+    """Path of the file holding the out-of-band buffers (if any)."""
+
+    sizes: tuple[int, ...] = ()
+    """Sizes of the individual out-of-band buffers."""
+
+    THRESHOLD = 1 << 16
+    """Minimal total size (in bytes) of the buffers to be exchanged via the memory-mapped file."""
+
+    @classmethod
+    def dump(cls, value: typing.Any, staging: str) -> 'Handle':
+        """Store the given value returning its handle.
+
+        Args:
+            value: Value to be stored.
+            staging: Directory for the buffer files.
+
+        Returns:
+            Handle of the stored value.
+        """
+        buffers: list[pickle.PickleBuffer] = []
+        header = cloudpickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        if not buffers:
+            return cls(header)
+        raw = [b.raw() for b in buffers]
+        if sum(r.nbytes for r in raw) < cls.THRESHOLD:
+            return cls(cloudpickle.dumps(value, protocol=5))
+        path = os.path.join(staging, uuid.uuid4().hex)
+        with open(path, 'wb') as file:
+            for buffer in raw:
+                file.write(buffer)
+        return cls(header, path, tuple(r.nbytes for r in raw))
+
+    def load(self) -> typing.Any:
+        """Retrieve the referenced value.
+
+        The buffers are memory-mapped in the copy-on-write mode so the value can be modified without
+        affecting the other consumers.
+
+        Returns:
+            Referenced value.
+        """
+        if not self.path:
+            return pickle.loads(self.header)
+        with open(self.path, 'rb') as file:
+            view = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY))
+        buffers = []
+        start = 0
+        for size in self.sizes:
+            stop = start + size
+            buffers.append(view[start:stop])
+            start = stop
+        return pickle.loads(self.header, buffers=buffers)
+
+    def release(self) -> None:
+        """Remove the buffer file (the existing mappings remain valid)."""
+        if self.path:
+            os.unlink(self.path)
+
+
+def execute(instruction: bytes, staging: str, *args: Handle) -> Handle:
+    """Worker function executing the given instruction.
+
+    Args:
+        instruction: Instruction to be executed (cloudpickled).
+        staging: Directory for the buffer files.
+        args: Handles of the instruction arguments.
+
+    Returns:
+        Handle of the instruction result.
+    """
+    return Handle.dump(cloudpickle.loads(instruction)(*(a.load() for a in args)), staging)
+
+
+class Runner(runtime.Runner, alias='multiprocess'):
+    """Native ForML runner executing the compiled task graph using a pool of worker processes.
+
+    The instructions are scheduled as soon as all their upstream dependencies are completed with the
+    intermediate results exchanged between the workers using just their :class:`handles
+    <forml.provider.runner.multiprocess.Handle>` pointing to memory-mapped files (rather than
+    pickling the entire payloads through the process pipes).
+
+    Args:
+        processes: Size of the worker pool (defaults to the number of CPUs).
+        staging: Directory for the intermediate buffer files (defaults to ``/dev/shm`` if available
+                 or the system temp directory otherwise).
+        cache: Optional :class:`node output cache <forml.flow.Cache>` (or its directory path).
+
+    The provider can be enabled using the following :ref:`platform configuration <platform-config>`:
+
+    .. code-block:: toml
+       :caption: config.toml
+
+        [RUNNER.parallel]
+        provider = "multiprocess"
+        processes = 8
+    """
+
+    SHM = '/dev/shm'
+    """Preferred default staging location."""
+
+    def __init__(
+        self,
+        instance: typing.Optional['asset.Instance'] = None,
+        feed: typing.Optional['io.Feed'] = None,
+        sink: typing.Optional['io.Sink'] = None,
+        processes: typing.Optional[int] = None,
+        staging: typing.Optional[str] = None,
+        cache: typing.Optional[typing.Union[str, 'flow.Cache']] = None,
+    ):
+        super().__init__(instance, feed, sink, cache, processes=processes, staging=staging)
+
+    @classmethod
+    def run(cls, symbols: typing.Collection[flow.Symbol], **kwargs) -> None:
+        upstream: dict[flow.Instruction, tuple[flow.Instruction]] = dict(symbols)
+        assert len(upstream) == len(symbols), 'Duplicated symbols in DAG sequence'
+        downstream: dict[flow.Instruction, list[flow.Instruction]] = collections.defaultdict(list)
+        for instruction, args in upstream.items():
+            for arg in set(args):
+                downstream[arg].append(instruction)
+        waiting: dict[flow.Instruction, int] = {i: len(set(a)) for i, a in upstream.items()}
+        consumers: dict[flow.Instruction, int] = {i: len(downstream[i]) for i in upstream}
+        results: dict[flow.Instruction, Handle] = {}
+        staging = kwargs.get('staging') or (cls.SHM if os.path.isdir(cls.SHM) else None)
+        staging = tempfile.mkdtemp(prefix='forml-', dir=staging)
+        running: dict[futures.Future, flow.Instruction] = {}
+
+        def submit(instruction: flow.Instruction) -> None:
+            """Submit the instruction to the pool."""
+            args = (results[a] for a in upstream[instruction])
+            running[pool.submit(execute, cloudpickle.dumps(instruction), staging, *args)] = instruction
+
+        try:
+            with futures.ProcessPoolExecutor(kwargs.get('processes')) as pool:
+                for instruction in (i for i, w in waiting.items() if not w):
+                    submit(instruction)
+                while running:
+                    done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                    for future in done:
+                        instruction = running.pop(future)
+                        try:
+                            results[instruction] = future.result()
+                        except BaseException:
+                            pool.shutdown(cancel_futures=True)
+                            raise
+                        for consumer in downstream[instruction]:
+                            waiting[consumer] -= 1
+                            if not waiting[consumer]:
+                                submit(consumer)
+                        for arg in set(upstream[instruction]):
+                            consumers[arg] -= 1
+                            if not consumers[arg]:
+                                results.pop(arg).release()
+                        if not consumers[instruction]:  # leaf
+                            results.pop(instruction).release()
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
@@ -20,15 +20,24 @@ Low-latency function runner suitable for apply-mode serving.
 """
 import abc
 import collections
+import functools
 import logging
+import mmap
+import os
+import types
 import typing
+from concurrent import futures
+
+import numpy
+import pandas
 
 import forml
 from forml import flow, runtime
+from forml.io import layout
 
 if typing.TYPE_CHECKING:
     from forml import io
-    from forml.io import asset, dsl, layout
+    from forml.io import asset, dsl
 
 LOGGER = logging.getLogger(__name__)
 
@@ -40,19 +49,29 @@ class Term(abc.ABC):
     def __call__(self, arg: typing.Any) -> typing.Any:
         """Term body."""
 
+    def shutdown(self) -> None:
+        """Release any resources held by the term."""
+
 
 class Task(Term):
-    """Term representing an actor action."""
+    """Term representing an actor action.
+
+    Args:
+        actor: Actor instance.
+        action: Action to be performed on the actor.
+        lean: Call the action bound directly to the actor skipping any of its logging.
+    """
 
-    def __init__(self, actor: flow.Actor, action: flow.Apply):
+    def __init__(self, actor: flow.Actor, action: flow.Apply, lean: bool = False):
         self._actor: flow.Actor = actor
         self._action: flow.Apply = action
+        self._call: typing.Callable[..., typing.Any] = action.bind(actor) if lean else functools.partial(action, actor)
 
     def __repr__(self):
         return f'{self._actor}.{self._action}'
 
     def __call__(self, *args: typing.Any) -> typing.Any:
-        return self._action(self._actor, *args)
+        return self._call(*args)
 
 
 class Get(Term):
@@ -144,7 +163,12 @@ class Pop(Branch):
 
 
 class Expression(Term):
-    """Final composed lambda expression representing the DAG as a chained function call."""
+    """Final composed lambda expression representing the DAG as a chained function call.
+
+    Args:
+        symbols: Source symbols representing the code to be executed.
+        lean: Bind the actor actions directly skipping any of their per-call logging.
+    """
 
     class Node(typing.NamedTuple):
         """Helper case class representing DAG node metadata."""
@@ -153,10 +177,11 @@ class Expression(Term):
         szout: int
         args: typing.Sequence[Term]
 
-    def __init__(self, symbols: typing.Iterable[flow.Symbol]):
-        dag = self._build(symbols)
+    def __init__(self, symbols: typing.Iterable[flow.Symbol], lean: bool = False):
+        dag = self._build(symbols, lean)
         assert len(dag) > 0 and dag[-1].szout == 0 and not dag[0].args, 'Invalid DAG'
         providers: typing.Mapping[Term, typing.Deque[Term]] = {n.term: collections.deque([n.term]) for n in dag}
+        providers[dag[0].term].extend(Branch.fork(providers[dag[0].term].popleft(), dag[0].szout))
 
         for node in dag[1:]:
             args = [providers[a].popleft() for a in node.args]
@@ -198,11 +223,12 @@ class Expression(Term):
         return sorted(index, key=lambda i: index[i], reverse=True)
 
     @classmethod
-    def _build(cls, symbols: typing.Iterable[flow.Symbol]) -> typing.Sequence['Expression.Node']:
+    def _build(cls, symbols: typing.Iterable[flow.Symbol], lean: bool = False) -> typing.Sequence['Expression.Node']:
         """Build the ordered DAG sequence of terms.
 
         Args:
             symbols: Source symbols representing the code to be executed.
+            lean: Bind the actor actions directly skipping any of their per-call logging.
 
         Returns:
             Sequence of tuples each representing a terms, number of its outputs and a sequence of its upstream terms.
@@ -249,12 +275,322 @@ class Expression(Term):
                 builder, action = instruction
                 actor = builder()
                 action, args = action.reduce(actor, *(evaluate(a) for a in upstream[instruction]))
-                term = Task(actor, action)
+                term = Task(actor, action, lean)
             dag.append((term, tuple(resolve(a) for a in args)))
             i2t[instruction] = term
         return tuple(cls.Node(t, szout[t], u) for t, u in dag)
 
 
+class Program(Term):
+    """Alternative to the recursive :class:`Expression` compiling the DAG into a flat loop over its
+    dependency-ordered instructions.
+
+    The intermediate values are held in a preallocated sequence of slots with each slot getting
+    released as soon as its last consumer has been executed (instead of being held by the call
+    stack of the nested terms until the whole expression unwinds).
+
+    Args:
+        symbols: Source symbols representing the code to be executed.
+        lean: Bind the actor actions directly skipping any of their per-call logging.
+    """
+
+    class Step(typing.NamedTuple):
+        """Helper case class representing a single program instruction."""
+
+        term: Term
+        args: tuple[int, ...]
+        release: tuple[int, ...]
+
+    def __init__(self, symbols: typing.Iterable[flow.Symbol], lean: bool = False):
+        dag = Expression._build(symbols, lean)  # pylint: disable=protected-access
+        assert len(dag) > 0 and dag[-1].szout == 0 and not dag[0].args, 'Invalid DAG'
+        slots: dict[Term, int] = {n.term: i for i, n in enumerate(dag)}
+        released: set[int] = set()
+        steps: list[Program.Step] = []
+        for node in reversed(dag[1:]):  # the first consumer seen in reverse is the last one to execute
+            args = tuple(slots[a] for a in node.args)
+            release = tuple(a for a in dict.fromkeys(args) if a not in released)
+            released.update(release)
+            steps.append(self.Step(node.term, args, release))
+        self._size: int = len(dag)
+        self._head: Term = dag[0].term
+        self._steps: tuple[Program.Step] = tuple(reversed(steps))
+
+    def __call__(self, arg: typing.Any) -> typing.Any:
+        values = [None] * self._size
+        values[0] = self._head(arg)
+        for index, (term, args, release) in enumerate(self._steps, start=1):
+            values[index] = term(*[values[a] for a in args])
+            for slot in release:
+                values[slot] = None
+        return values[-1]
+
+    def __repr__(self):
+        return '; '.join(f'${i}={s.term}{tuple(f"${a}" for a in s.args)}' for i, s in enumerate(self._steps, 1))
+
+
+class Parallel(Program):
+    """Variant of the :class:`Program` executing the mutually independent steps concurrently using
+    a thread pool.
+
+    The steps are grouped into *waves* of instructions depending only on the results of the
+    previous waves with each wave executed in parallel. This pays off for DAGs with wide branches
+    of actors releasing the GIL (i.e. the typical numpy/sklearn based models).
+
+    The thread pool is created lazily (and recreated after forking the process) and is released
+    using the :meth:`shutdown` method.
+
+    Args:
+        symbols: Source symbols representing the code to be executed.
+        workers: Thread pool size.
+        lean: Bind the actor actions directly skipping any of their per-call logging.
+    """
+
+    def __init__(self, symbols: typing.Iterable[flow.Symbol], workers: typing.Optional[int] = None, lean: bool = False):
+        super().__init__(symbols, lean)
+        levels: list[int] = [0] * self._size
+        waves: dict[int, list[int]] = collections.defaultdict(list)
+        expiry: dict[int, int] = {}  # the step order doesn't follow the waves - releasing after the last consumer wave
+        for index, step in enumerate(self._steps, start=1):
+            levels[index] = 1 + max((levels[a] for a in step.args), default=0)
+            waves[levels[index]].append(index)
+            for slot in step.args:
+                expiry[slot] = max(expiry.get(slot, 0), levels[index])
+        releases: dict[int, list[int]] = collections.defaultdict(list)
+        for slot, level in expiry.items():
+            releases[level].append(slot)
+        self._waves: tuple[tuple[int, ...]] = tuple(tuple(waves[w]) for w in sorted(waves))
+        self._releases: tuple[tuple[int, ...]] = tuple(tuple(releases[w]) for w in sorted(waves))
+        self._workers: typing.Optional[int] = workers
+        self._pool: typing.Optional[futures.Executor] = None
+        self._pid: typing.Optional[int] = None
+
+    def __call__(self, arg: typing.Any) -> typing.Any:
+        values = [None] * self._size
+        values[0] = self._head(arg)
+        for wave, release in zip(self._waves, self._releases):
+            if len(wave) == 1:
+                self._execute(values, wave[0])
+            else:
+                pool = self._executor
+                for future in [pool.submit(self._execute, values, i) for i in wave]:
+                    future.result()
+            for slot in release:
+                values[slot] = None
+        return values[-1]
+
+    def shutdown(self) -> None:
+        if self._pool and self._pid == os.getpid():
+            self._pool.shutdown()
+        self._pool = self._pid = None
+
+    @property
+    def _executor(self) -> futures.Executor:
+        """Get the thread pool for the current process.
+
+        Returns:
+            Thread pool executor.
+        """
+        if self._pid != os.getpid():  # threads don't survive forking
+            self._pool = futures.ThreadPoolExecutor(self._workers, thread_name_prefix='pyfunc')
+            self._pid = os.getpid()
+        return self._pool
+
+    def _execute(self, values: list[typing.Any], index: int) -> None:
+        """Execute the given step storing its result in the values sequence.
+
+        Args:
+            values: Sequence of the intermediate value slots.
+            index: Index of the step to be executed.
+        """
+        term, args, _ = self._steps[index - 1]
+        values[index] = term(*[values[a] for a in args])
+
+
+class Memo(Term):
+    """Row-level memoization wrapper of the entire expression.
+
+    The incoming entry rows get hashed and only those not found in the LRU cache are sent through
+    the wrapped expression with the outcome rows merged back in the original order. Since the runner
+    is bound to a single model instance, the cache is implicitly specific to its generation.
+
+    The cached outcome rows are kept as single-row slices of the original outcome container (numpy
+    array, pandas frame/series, ``layout.Tabular`` or a generic sequence) so that the merged outcome
+    is of the same type as the one produced by the wrapped expression.
+
+    Entries with unhashable rows bypass the cache.
+
+    Attention:
+        This is only valid for pipelines producing each of the outcome rows purely based on the
+        corresponding input row (row-independent pipelines).
+
+    Args:
+        term: Expression to be memoized.
+        size: Maximum number of rows to be kept in the cache.
+    """
+
+    def __init__(self, term: Term, size: int):
+        if size < 1:
+            raise forml.InvalidError(f'Invalid memo size: {size}')
+        self._term: Term = term
+        self._size: int = size
+        self._cache: dict[typing.Hashable, tuple['dsl.Source.Schema', typing.Any]] = {}  # in the LRU order
+
+    def __repr__(self):
+        return f'memo({self._term!r})'
+
+    def shutdown(self) -> None:
+        self._term.shutdown()
+
+    def __call__(self, entry: 'layout.Entry') -> 'layout.Outcome':
+        keys = [(entry.schema, tuple(r)) for r in entry.data.to_rows()]
+        try:
+            hash(tuple(keys))
+        except TypeError:
+            return self._term(entry)
+        if not keys:
+            return self._term(entry)
+        known: dict[typing.Hashable, tuple['dsl.Source.Schema', typing.Any]] = {}
+        missing: dict[typing.Hashable, int] = {}
+        for index, key in enumerate(keys):
+            if key in known or key in missing:
+                continue
+            if key in self._cache:
+                known[key] = self._cache[key] = self._cache.pop(key)  # moving to the end
+            else:
+                missing[key] = index
+        if missing:
+            outcome = self._term(layout.Entry(entry.schema, entry.data.take_rows(list(missing.values()))))
+            if len(outcome.data) != len(missing):
+                raise forml.UnexpectedError('Outcome not matching the input size (not row-independent?)')
+            for index, key in enumerate(missing):
+                known[key] = self._cache[key] = outcome.schema, self._take(outcome.data, [index])
+            while len(self._cache) > self._size:
+                del self._cache[next(iter(self._cache))]
+            if len(missing) == len(keys):  # all rows unique and computed in the original order
+                return outcome
+        return layout.Outcome(known[keys[0]][0], self._concat([known[k][1] for k in keys]))
+
+    @staticmethod
+    def _take(data: typing.Any, indices: typing.Sequence[int]) -> typing.Any:
+        """Slice the given outcome data retaining its container type.
+
+        Args:
+            data: Outcome data.
+            indices: Row indices to take.
+
+        Returns:
+            Outcome data slice.
+        """
+        if isinstance(data, numpy.ndarray):
+            return data.take(indices, axis=0)
+        if isinstance(data, (pandas.DataFrame, pandas.Series)):
+            return data.iloc[indices]
+        if isinstance(data, layout.Tabular):
+            return data.take_rows(indices)
+        return [data[i] for i in indices]
+
+    @staticmethod
+    def _concat(parts: typing.Sequence[typing.Any]) -> typing.Any:
+        """Concatenate the given outcome data slices (as produced by :meth:`_take`).
+
+        Args:
+            parts: Sequence of the outcome data slices of the same container type.
+
+        Returns:
+            Concatenated outcome data.
+        """
+        first = parts[0]
+        if isinstance(first, numpy.ndarray):
+            return numpy.concatenate(parts)
+        if isinstance(first, (pandas.DataFrame, pandas.Series)):
+            return pandas.concat(parts, ignore_index=True)
+        if isinstance(first, layout.Tabular):
+            return first.from_rows(numpy.concatenate([p.to_rows() for p in parts]))
+        return [r for p in parts for r in p]
+
+
+class Sharing:
+    """Helper for relocating large (plain) numpy arrays held by the (stateful) actors into anonymous
+    shared memory mappings.
+
+    When forking the worker processes from the process with the loaded runner, the relocated array
+    buffers don't get duplicated even as the CPython reference counting and garbage collection keep
+    touching the (private) heap pages of the owning objects. The relocated arrays are read-only.
+
+    Args:
+        threshold: Minimal size (in bytes) of an array to be relocated.
+    """
+
+    THRESHOLD = 1 << 20
+    """Default minimal size (in bytes) of a relocated array."""
+
+    ATOMS = (str, bytes, int, float, complex, bool, type(None), type, types.ModuleType, types.FunctionType)
+    """Types not worth traversing."""
+
+    def __init__(self, threshold: typing.Optional[int] = None):
+        self._threshold: int = self.THRESHOLD if threshold is None else threshold
+
+    def __call__(self, root: typing.Any) -> int:
+        """Traverse the object graph of the given root and relocate all the large arrays it references.
+
+        Only arrays referenced via dictionaries, lists or the object attributes can be replaced.
+
+        Args:
+            root: Root object of the graph to be traversed.
+
+        Returns:
+            Total size (in bytes) of the relocated arrays.
+        """
+        seen: set[int] = set()
+        stack: list[typing.Any] = [root]
+        total = 0
+        while stack:
+            obj = stack.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            if isinstance(obj, (dict, list)):
+                content = obj
+            elif isinstance(obj, (tuple, set, frozenset, collections.deque)):
+                stack.extend(obj)
+                continue
+            elif hasattr(obj, '__dict__') and not isinstance(obj, self.ATOMS):
+                content = vars(obj)
+            else:
+                continue
+            for key, value in list(content.items() if isinstance(content, dict) else enumerate(content)):
+                if isinstance(value, numpy.ndarray):
+                    if (  # subclasses (masked arrays, memmaps, etc.) can't be safely replaced with a plain array
+                        type(value) is not numpy.ndarray  # pylint: disable=unidiomatic-typecheck
+                        or value.dtype.hasobject
+                        or value.nbytes < self._threshold
+                        or isinstance(value.base, mmap.mmap)
+                    ):
+                        continue
+                    content[key] = self.relocate(value)
+                    total += value.nbytes
+                elif not isinstance(value, self.ATOMS):
+                    stack.append(value)
+        LOGGER.debug('Relocated %d bytes into shared memory', total)
+        return total
+
+    @staticmethod
+    def relocate(array: numpy.ndarray) -> numpy.ndarray:
+        """Copy the given array into an anonymous shared memory mapping.
+
+        Args:
+            array: Array to be relocated.
+
+        Returns:
+            Read-only copy of the array backed by the shared memory.
+        """
+        mapped = numpy.ndarray(array.shape, array.dtype, buffer=mmap.mmap(-1, max(array.nbytes, 1)))
+        mapped[...] = array
+        mapped.flags.writeable = False
+        return mapped
+
+
 class Runner(runtime.Runner, alias='pyfunc'):
     """Non-distributed low-latency runner turning the task graph into a single synchronous python
     function.
@@ -268,17 +604,50 @@ class Runner(runtime.Runner, alias='pyfunc'):
     This runner is internally used by the :doc:`serving engine<../serving>`. It does not support
     training/tuning actions. Defining it explicitly using the :ref:`platform configuration
     <platform-config>` for other runtime mechanisms is not usual.
+
+    Args:
+        instance: Model instance to be executed.
+        feed: Feed to be used for the input data.
+        sink: Sink to be used for the output data.
+        backend: Execution backend to compile the task graph into - either the nested ``expression``
+                 of lambda terms, the flat-loop ``program`` or its multithreaded ``parallel``
+                 variant.
+        share: Relocate the large numpy arrays held by the loaded actors into the :class:`shared
+               memory <forml.provider.runner.pyfunc.Sharing>` (to be shared by forked processes).
+        memo: Enable the :class:`row-level memoization <forml.provider.runner.pyfunc.Memo>` of up
+              to the given number of rows (only valid for row-independent pipelines).
+        lean: Bind the actor actions directly skipping any of their per-call logging (defaults to
+              lean unless the ``DEBUG`` logging is enabled for the flow instructions).
+        workers: Thread pool size of the ``parallel`` backend.
     """
 
+    BACKENDS: typing.Mapping[str, type[Term]] = {'expression': Expression, 'program': Program, 'parallel': Parallel}
+    """Available execution backends."""
+
     def __init__(
         self,
         instance: typing.Optional['asset.Instance'] = None,
         feed: typing.Optional['io.Feed'] = None,
         sink: typing.Optional['io.Sink'] = None,
+        backend: str = 'expression',
+        share: bool = False,
+        memo: typing.Optional[int] = None,
+        lean: typing.Optional[bool] = None,
+        workers: typing.Optional[int] = None,
     ):
-        super().__init__(instance, feed, sink)
+        if backend not in self.BACKENDS:
+            raise forml.InvalidError(f'Unknown backend: {backend}')
+        if lean is None:
+            lean = flow.Instruction.quiet()
+        super().__init__(instance, feed, sink, backend=backend, share=share, memo=memo, lean=lean, workers=workers)
         composition = self._build(None, None, self._instance.project.pipeline)
-        self._expression = Expression(flow.compile(composition.apply, self._instance.state(composition.persistent)))
+        self._expression: Term = self._compose(
+            flow.compile(composition.apply, self._instance.state(composition.persistent)), backend, lean, workers
+        )
+        if share:
+            Sharing()(self._expression)
+        if memo:
+            self._expression = Memo(self._expression, memo)
 
     def train(self, lower: typing.Optional['dsl.Native'] = None, upper: typing.Optional['dsl.Native'] = None) -> None:
         raise forml.InvalidError('Invalid runner mode')
@@ -286,9 +655,48 @@ class Runner(runtime.Runner, alias='pyfunc'):
     def tune(self, lower: typing.Optional['dsl.Native'] = None, upper: typing.Optional['dsl.Native'] = None) -> None:
         raise forml.InvalidError('Invalid runner mode')
 
+    def _stream(self, segment: 'flow.Segment', assets: typing.Optional['asset.State'], chunksize: int) -> None:
+        symbols = self._compile(segment, assets)
+        expression = self._compose(symbols, self._kwargs['backend'], self._kwargs['lean'], self._kwargs['workers'])
+        try:
+            for entry in self._chunks(self._head(symbols), chunksize):
+                expression(entry)
+        finally:
+            expression.shutdown()
+
     @classmethod
-    def run(cls, symbols: typing.Collection[flow.Symbol], **kwargs) -> None:
-        Expression(symbols)(None)
+    def _compose(
+        cls, symbols: typing.Collection[flow.Symbol], backend: str, lean: bool, workers: typing.Optional[int]
+    ) -> Term:
+        """Compile the symbols into the term of the given backend.
+
+        Args:
+            symbols: Source symbols representing the code to be executed.
+            backend: Execution backend name.
+            lean: Bind the actor actions directly skipping any of their per-call logging.
+            workers: Thread pool size of the ``parallel`` backend.
+
+        Returns:
+            Executable term.
+        """
+        if cls.BACKENDS[backend] is Parallel:
+            return Parallel(symbols, workers=workers, lean=lean)
+        return cls.BACKENDS[backend](symbols, lean=lean)
+
+    @classmethod
+    def run(
+        cls,
+        symbols: typing.Collection[flow.Symbol],
+        backend: str = 'expression',
+        lean: bool = False,
+        workers: typing.Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        expression = cls._compose(symbols, backend, lean, workers)
+        try:
+            expression(None)
+        finally:
+            expression.shutdown()
 
     def call(self, entry: 'layout.Entry') -> 'layout.Outcome':
         """Special function exec entrypoint used by the serving engine.
@@ -300,3 +708,7 @@ class Runner(runtime.Runner, alias='pyfunc'):
             Pipeline output.
         """
         return self._expression(entry)
+
+    def shutdown(self) -> None:
+        """Release any resources held by the execution backend (i.e. the ``parallel`` thread pool)."""
+        self._expression.shutdown()
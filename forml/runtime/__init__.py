@@ -20,15 +20,21 @@ Runtime launching subsystem.
 """
 
 from ._agent import Runner
+from ._bench import Benchmark
+from ._load import LoadTest
 from ._pad import Launcher, Platform, Repo
-from ._perf import Stats
+from ._perf import Profile, Profiler, Stats
 from ._pseudo import Virtual
 from ._service import Gateway
 
 __all__ = [
+    'Benchmark',
     'Gateway',
     'Launcher',
+    'LoadTest',
     'Platform',
+    'Profile',
+    'Profiler',
     'Repo',
     'Runner',
     'Stats',
@@ -22,6 +22,7 @@ import abc
 import functools
 import logging
 import typing
+from concurrent import futures
 
 import forml
 from forml import evaluation
@@ -30,10 +31,13 @@ from forml import io as iomod
 from forml import project, provider, setup
 from forml.io import asset as assetmod
 from forml.io import dsl
+from forml.io._input import extract
+
+from . import _perf
 
 if typing.TYPE_CHECKING:
     from forml import flow, io  # pylint: disable=reimported
-    from forml.io import asset  # pylint: disable=reimported
+    from forml.io import asset, layout  # pylint: disable=reimported
 
 LOGGER = logging.getLogger(__name__)
 
@@ -46,11 +50,19 @@ class Runner(provider.Service, default=setup.Runner.default, path=setup.Runner.p
 
     All that needs to be supplied by the provider is the abstract :meth:`run` method.
 
+    Any runs launched within an active :class:`runtime.Profiler <forml.runtime.Profiler>` context get
+    their instructions instrumented for collecting the execution profile. Unless the ``DEBUG``
+    logging is enabled for the :class:`flow instructions <forml.flow.Instruction>`, they are compiled
+    in the *lean* mode skipping any of their per-call logging.
+
     Args:
         instance: A particular instance of the persistent artifacts to be executed.
         feed: Optional input feed instance to retrieve the data from (falls back to the default
               configured feed).
         sink: Output sink instance (no output is produced if omitted).
+        cache: Optional :class:`node output cache <forml.flow.Cache>` (or just its directory path)
+               allowing to skip the re-execution of the actors whose inputs didn't change since the
+               previous runs.
         kwargs: Additional keyword arguments for the :meth:`run` method.
     """
 
@@ -61,11 +73,15 @@ class Runner(provider.Service, default=setup.Runner.default, path=setup.Runner.p
         instance: typing.Optional['asset.Instance'] = None,
         feed: typing.Optional['io.Feed'] = None,
         sink: typing.Optional['io.Sink'] = None,
+        cache: typing.Optional[typing.Union[str, 'flow.Cache']] = None,
         **kwargs,
     ):
+        if isinstance(cache, str):
+            cache = flowmod.Cache(cache)
         self._instance: 'asset.Instance' = instance or assetmod.Instance()
         self._feed: 'io.Feed' = feed or iomod.Feed()
         self._sink: typing.Optional['io.Sink'] = sink
+        self._cache: typing.Optional['flow.Cache'] = cache
         self._kwargs: typing.Mapping[str, typing.Any] = kwargs
 
     def train(self, lower: typing.Optional[dsl.Native] = None, upper: typing.Optional[dsl.Native] = None) -> None:
@@ -80,15 +96,36 @@ class Runner(provider.Service, default=setup.Runner.default, path=setup.Runner.p
             composition.train, self._instance.state(composition.persistent, self._instance.tag.training.trigger())
         )
 
-    def apply(self, lower: typing.Optional[dsl.Native] = None, upper: typing.Optional[dsl.Native] = None) -> None:
+    def apply(
+        self,
+        lower: typing.Optional[dsl.Native] = None,
+        upper: typing.Optional[dsl.Native] = None,
+        chunksize: typing.Optional[int] = None,
+    ) -> None:
         """Run the applying code.
 
+        In the *chunked* mode (if the ``chunksize`` is provided), the feed is read incrementally in
+        batches of up to the given number of rows and the (stateless) apply task graph is executed
+        for each of them separately with the outputs passed to the sink as they come. The peak memory
+        footprint is then bounded by the chunk size rather than the full dataset size (provided the
+        feed reader supports the :meth:`incremental reading <forml.io.Feed.Reader.stream>` - otherwise
+        it loads the full data upfront emitting a warning).
+
+        Note:
+            In the chunked mode, the sink :meth:`writer <forml.io.Sink.Writer.write>` gets called
+            repeatedly for each of the chunks (each time with just that chunk) so it must append to
+            (rather than overwrite) any of its previous outputs.
+
         Args:
             lower: Ordinal value as the lower bound for the ETL cycle.
             upper:  Ordinal value as the upper bound for the ETL cycle.
+            chunksize: Maximum number of rows per chunk to execute the chunked mode.
         """
         composition = self._build(lower, upper, self._instance.project.pipeline, output=None)  # TO-DO: sink schema
-        self._exec(composition.apply, self._instance.state(composition.persistent))
+        if chunksize:
+            self._stream(composition.apply, self._instance.state(composition.persistent), chunksize)
+        else:
+            self._exec(composition.apply, self._instance.state(composition.persistent))
 
     def tune(self, lower: typing.Optional[dsl.Native] = None, upper: typing.Optional[dsl.Native] = None) -> None:
         """Run the tune mode.
@@ -175,6 +212,26 @@ class Runner(provider.Service, default=setup.Runner.default, path=setup.Runner.p
         composition = functools.reduce(flowmod.Composition.Builder.via, blocks, composition)
         return composition.build(self._sink.save(output) if self._sink else None)
 
+    def _compile(
+        self, segment: 'flow.Segment', assets: typing.Optional['asset.State'] = None
+    ) -> typing.Collection['flow.Symbol']:
+        """Compile the given segment and assets into the symbol table.
+
+        Args:
+            segment: Pipeline segment.
+            assets: Persistent assets to be used.
+
+        Returns:
+            Compiled symbol table.
+        """
+        return flowmod.compile(
+            segment,
+            assets,
+            self._cache,
+            instrument=_perf.Profiler.current(),
+            lean=flowmod.Instruction.quiet(),
+        )
+
     def _exec(self, segment: 'flow.Segment', assets: typing.Optional['asset.State'] = None) -> None:
         """Execute the given segment and assets.
 
@@ -185,7 +242,76 @@ class Runner(provider.Service, default=setup.Runner.default, path=setup.Runner.p
         Returns:
             Optional return value.
         """
-        return self.run(flowmod.compile(segment, assets), **self._kwargs)
+        return self.run(self._compile(segment, assets), **self._kwargs)
+
+    def _stream(self, segment: 'flow.Segment', assets: typing.Optional['asset.State'], chunksize: int) -> None:
+        """Execute the given segment and assets in the chunked mode.
+
+        The symbol table is compiled just once with all the states preloaded upfront. Each chunk is
+        then fed into the extraction driver using its *entry* input.
+
+        Args:
+            segment: Pipeline segment.
+            assets: Persistent assets to be used.
+            chunksize: Maximum number of rows per chunk.
+        """
+        symbols = tuple(self._compile(segment, assets))
+        head = self._head(symbols)
+        mapping = {i: Literal(i()) for i, _ in symbols if isinstance(i, flowmod.Loader)}
+        symbols = tuple(
+            flowmod.Symbol(mapping.get(i, i), [mapping.get(a, a) for a in args]) for i, args in symbols if i is not head
+        )
+        for entry in self._chunks(head, chunksize):
+            feed = Literal(entry)
+            self.run((flowmod.Symbol(feed, ()), flowmod.Symbol(head, [feed]), *symbols), **self._kwargs)
+
+    @staticmethod
+    def _head(symbols: typing.Iterable['flow.Symbol']) -> 'flow.Functor':
+        """Find the extraction driver within the given symbol table.
+
+        Args:
+            symbols: Symbol table to search.
+
+        Returns:
+            The extraction driver functor.
+
+        Raises:
+            forml.InvalidError: If not exactly one extraction driver is found.
+        """
+
+        def is_head(instruction: 'flow.Instruction') -> bool:
+            """Check the instruction is the extraction driver."""
+            if not isinstance(instruction, flowmod.Functor):
+                return False
+            actor = instruction.builder.actor
+            return isinstance(actor, type) and issubclass(actor, extract.Driver)
+
+        heads = [i for i, a in symbols if not a and is_head(i)]
+        if len(heads) != 1:
+            raise forml.InvalidError('Chunked mode requires exactly one extraction driver')
+        return heads[0]
+
+    @staticmethod
+    def _chunks(head: 'flow.Functor', chunksize: int) -> typing.Iterator['layout.Entry']:
+        """Read the chunks using the given extraction driver.
+
+        The next chunk is always being read in the background while the current one is processed.
+
+        Args:
+            head: Extraction driver functor.
+            chunksize: Maximum number of rows per chunk.
+
+        Returns:
+            Iterator of the chunk entries.
+        """
+        if chunksize < 1:
+            raise forml.InvalidError(f'Invalid chunk size: {chunksize}')
+        with futures.ThreadPoolExecutor(1, thread_name_prefix='chunker') as reader:
+            chunks = head.builder().chunks(chunksize)
+            pending = reader.submit(next, chunks, None)
+            while (entry := pending.result()) is not None:
+                pending = reader.submit(next, chunks, None)
+                yield entry
 
     @classmethod
     @abc.abstractmethod
@@ -199,3 +325,20 @@ class Runner(provider.Service, default=setup.Runner.default, path=setup.Runner.p
             kwargs: Custom keyword arguments provided via the constructor.
         """
         raise NotImplementedError()
+
+
+class Literal(flowmod.Instruction):
+    """Instruction simply returning the constant value it was created with.
+
+    Args:
+        value: Value to be returned.
+    """
+
+    def __init__(self, value: typing.Any):
+        self._value: typing.Any = value
+
+    def __repr__(self):
+        return f'Literal[{type(self._value).__name__}]'
+
+    def execute(self) -> typing.Any:  # pylint: disable=arguments-differ
+        return self._value
@@ -0,0 +1,421 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Runner benchmarking.
+"""
+import functools
+import json
+import logging
+import pathlib
+import time
+import tracemalloc
+import typing
+
+import numpy
+
+import forml
+from forml import flow, io
+from forml import project as prjmod
+from forml.io import dsl
+from forml.pipeline import payload, wrap
+
+from . import _agent, _pseudo
+
+LOGGER = logging.getLogger(__name__)
+
+
+@wrap.Actor.apply
+def Scale(features: 'flow.Features', *, factor: float) -> 'flow.Result':  # pylint: disable=invalid-name
+    """Synthetic stateless actor multiplying the features by the given factor."""
+    return numpy.asarray(features, dtype=float) * factor
+
+
+@wrap.Actor.apply
+def Mean(*features: 'flow.Features') -> 'flow.Result':  # pylint: disable=invalid-name
+    """Synthetic stateless actor averaging all its inputs."""
+    return sum(features) / len(features)
+
+
+@wrap.Actor.train
+def Center(
+    state: typing.Optional[numpy.ndarray],  # pylint: disable=unused-argument
+    features: 'flow.Features',
+    labels: 'flow.Labels',  # pylint: disable=unused-argument
+) -> numpy.ndarray:
+    """Synthetic stateful actor learning the column means."""
+    return numpy.asarray(features, dtype=float).mean(axis=0)
+
+
+@wrap.Operator.mapper
+@Center.apply
+def Center(state: numpy.ndarray, features: 'flow.Features') -> 'flow.Result':  # pylint: disable=function-redefined
+    """Synthetic stateful actor centering the features using the learned means."""
+    return numpy.asarray(features, dtype=float) - state
+
+
+class Benchmark:
+    """Harness for measuring the end-to-end performance of the runner providers executing a synthetic
+    workload.
+
+    The workload is a pipeline of configurable *depth* (number of layers) each made of a
+    :class:`payload.MapReduce <forml.pipeline.payload.MapReduce>` operator with given *width*
+    (number of parallel stateless mappers) followed by a final stateful actor. The data is supplied
+    using the :class:`monolite feed <forml.provider.feed.monolite.Feed>` holding an inline dataset
+    of the given number of *rows* and *columns*.
+
+    Each benchmark case (runner and mode combination) is executed repeatedly reporting the latency
+    percentiles, the throughput (rows per second) and the peak memory allocated by the launching
+    process (measured in a separate traced iteration to not affect the timing).
+
+    Args:
+        spec: Workload specification.
+        runners: Runner specifications to be benchmarked as tuples of their provider reference and
+                 the keyword parameters.
+        repeat: Number of timed iterations per each case.
+        warmup: Number of untimed iterations preceding the timed ones.
+
+    Examples:
+        >>> report = runtime.Benchmark(runtime.Benchmark.Spec(depth=8, rows=100_000))()
+        >>> print(report)
+        >>> report.dump('benchmark.json')
+
+        The individual cases can also be measured using `pytest-benchmark
+        <https://pytest-benchmark.readthedocs.io>`_:
+
+        >>> def test_apply(benchmark):
+        ...     bench = runtime.Benchmark()
+        ...     benchmark(bench.prepare(runtime.Benchmark.Case('pyfunc', {}, 'apply')))
+    """
+
+    class Spec(typing.NamedTuple):
+        """Synthetic workload specification."""
+
+        depth: int = 4
+        """Number of the pipeline layers."""
+        width: int = 2
+        """Number of the parallel branches within each layer."""
+        rows: int = 10_000
+        """Number of the dataset rows."""
+        columns: int = 8
+        """Number of the dataset feature columns."""
+
+    class Case(typing.NamedTuple):
+        """Benchmark case specification."""
+
+        runner: str
+        """Runner provider reference."""
+        params: typing.Mapping[str, typing.Any]
+        """Runner keyword parameters."""
+        mode: str
+        """Launcher mode (either ``train`` or ``apply``)."""
+
+        def __str__(self):
+            params = ','.join(f'{k}={v}' for k, v in self.params.items())
+            return f'{self.runner}[{params}]:{self.mode}' if params else f'{self.runner}:{self.mode}'
+
+    class Result(typing.NamedTuple):
+        """Measurements of a single case."""
+
+        case: str
+        """Case name."""
+        rows: int
+        """Number of rows processed per iteration."""
+        latencies: tuple[float, ...]
+        """Individual iteration latencies (in seconds)."""
+        memory: int
+        """Peak memory (in bytes) allocated within the launching process during an iteration."""
+
+        def percentile(self, percent: float) -> float:
+            """Get the latency percentile.
+
+            Args:
+                percent: Percentile to get (0-100).
+
+            Returns:
+                Latency (in seconds).
+            """
+            return float(numpy.percentile(self.latencies, percent))
+
+        @property
+        def throughput(self) -> float:
+            """Number of rows processed per second (based on the median latency)."""
+            return self.rows / self.percentile(50)
+
+    class Report(typing.NamedTuple):
+        """Collection of the benchmark results."""
+
+        spec: 'Benchmark.Spec'
+        """Workload specification."""
+        results: tuple['Benchmark.Result', ...]
+        """Individual case results."""
+
+        def __str__(self):
+            lines = [
+                f'{"p50[ms]":>10} {"p90[ms]":>10} {"p99[ms]":>10} {"rows/s":>12} {"memory[kB]":>11}  case',
+            ]
+            for result in self.results:
+                lines.append(
+                    f'{result.percentile(50) * 1000:>10.2f} {result.percentile(90) * 1000:>10.2f} '
+                    f'{result.percentile(99) * 1000:>10.2f} {result.throughput:>12.0f} {result.memory // 1024:>11}'
+                    f'  {result.case}'
+                )
+            return '\n'.join(lines)
+
+        def dump(self, path: typing.Union[str, pathlib.Path]) -> None:
+            """Store the report into the given JSON file.
+
+            Args:
+                path: Target file path.
+            """
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump({'spec': self.spec._asdict(), 'results': [r._asdict() for r in self.results]}, file)
+
+        @classmethod
+        def load(cls, path: typing.Union[str, pathlib.Path]) -> 'Benchmark.Report':
+            """Load the report previously stored using the :meth:`dump` method.
+
+            Args:
+                path: Source file path.
+
+            Returns:
+                Report instance.
+            """
+            with open(path, encoding='utf-8') as file:
+                content = json.load(file)
+            return cls(
+                Benchmark.Spec(**content['spec']),
+                tuple(
+                    Benchmark.Result(r['case'], r['rows'], tuple(r['latencies']), r['memory'])
+                    for r in content['results']
+                ),
+            )
+
+        def compare(self, baseline: 'Benchmark.Report', tolerance: float = 0.1) -> typing.Sequence[str]:
+            """Compare this report against the baseline detecting the median latency regressions.
+
+            Args:
+                baseline: Report to compare with.
+                tolerance: Relative latency increase considered acceptable.
+
+            Returns:
+                Descriptions of the regressed cases (empty if no regression).
+
+            Raises:
+                forml.InvalidError: If the reports are based on different workload specs.
+            """
+            if self.spec != baseline.spec:
+                raise forml.InvalidError(f'Incomparable benchmark specs: {self.spec} vs {baseline.spec}')
+            previous = {r.case: r for r in baseline.results}
+            regressions = []
+            for result in self.results:
+                if result.case not in previous:
+                    continue
+                before, after = previous[result.case].percentile(50), result.percentile(50)
+                if after > before * (1 + tolerance):
+                    regressions.append(f'{result.case}: {before * 1000:.2f}ms -> {after * 1000:.2f}ms')
+            return regressions
+
+    RUNNERS: tuple[tuple[str, typing.Mapping[str, typing.Any]], ...] = (
+        ('pyfunc', {}),
+        ('dask', {'scheduler': 'threaded'}),
+        ('dask', {'scheduler': 'multiprocessing'}),
+        ('multiprocess', {}),
+        ('asyncio', {}),
+    )
+    """Default runners to be benchmarked."""
+    MODES = ('train', 'apply')
+    """Benchmarked launcher modes."""
+
+    def __init__(
+        self,
+        spec: 'Benchmark.Spec' = Spec(),  # noqa: B008
+        runners: typing.Iterable[tuple[str, typing.Mapping[str, typing.Any]]] = RUNNERS,
+        repeat: int = 5,
+        warmup: int = 1,
+    ):
+        if repeat < 1 or warmup < 0:
+            raise forml.InvalidError('Invalid benchmark repetitions')
+        self._spec: Benchmark.Spec = spec
+        self._runners: tuple[tuple[str, typing.Mapping[str, typing.Any]], ...] = tuple(runners)
+        self._repeat: int = repeat
+        self._warmup: int = warmup
+        self._feed: io.Feed = self.feed(spec)
+        self._launcher: _pseudo.Virtual = self.source(spec).bind(self.pipeline(spec)).launcher
+        self._trained: bool = False
+
+    @staticmethod
+    def schema(spec: 'Benchmark.Spec') -> dsl.Table:
+        """Assemble the synthetic dataset schema.
+
+        Args:
+            spec: Workload specification.
+
+        Returns:
+            Table with the feature columns ``f0``...``fN`` followed by the ``label`` column.
+        """
+        return dsl.Table(
+            dsl.Schema.from_fields(
+                *(dsl.Field(dsl.Float(), name=f'f{i}') for i in range(spec.columns)),
+                dsl.Field(dsl.Float(), name='label'),
+                title='Synthetic',
+            )
+        )
+
+    @classmethod
+    def source(cls, spec: 'Benchmark.Spec') -> prjmod.Source:
+        """Assemble the synthetic project source.
+
+        Args:
+            spec: Workload specification.
+
+        Returns:
+            Project source component.
+        """
+        schema = cls.schema(spec)
+        return prjmod.Source.query(schema.select(*(schema[f'f{i}'] for i in range(spec.columns))), schema.label)
+
+    @classmethod
+    def feed(cls, spec: 'Benchmark.Spec') -> io.Feed:
+        """Create the feed holding the (deterministic) synthetic dataset.
+
+        Args:
+            spec: Workload specification.
+
+        Returns:
+            Monolite feed instance.
+        """
+        data = numpy.random.default_rng(0).random((spec.rows, spec.columns + 1))
+        return io.Feed['monolite'](inline={cls.schema(spec): data.tolist()})
+
+    @staticmethod
+    def pipeline(spec: 'Benchmark.Spec') -> flow.Composable:
+        """Assemble the synthetic pipeline.
+
+        Args:
+            spec: Workload specification.
+
+        Returns:
+            Pipeline expression.
+        """
+        layers = (
+            payload.MapReduce(*(Scale.builder(factor=1 + b) for b in range(spec.width)), reducer=Mean.builder())
+            for _ in range(spec.depth)
+        )
+        return functools.reduce(flow.Composable.__rshift__, layers) >> Center()
+
+    @property
+    def cases(self) -> typing.Sequence['Benchmark.Case']:
+        """All the cases of this benchmark."""
+        return tuple(self.Case(r, p, m) for r, p in self._runners for m in self.MODES)
+
+    def prepare(self, case: 'Benchmark.Case') -> typing.Callable[[], None]:
+        """Prepare the callable executing a single iteration of the given case.
+
+        Args:
+            case: Case to be prepared.
+
+        Returns:
+            Callable with no arguments executing the case.
+        """
+        if case.mode not in self.MODES:
+            raise forml.InvalidError(f'Invalid benchmark mode: {case.mode}')
+        if case.mode == 'apply' and not self._trained:
+            self._train()  # the apply mode needs a trained generation
+            self._trained = True
+
+        def execute() -> None:
+            """Run the case action."""
+            getattr(self._runner((case.runner, case.params)), case.mode)()
+
+        return execute
+
+    def _train(self) -> None:
+        """Train the generation using the first of the benchmarked runners supporting the training
+        (falling back to the default runner of the virtual launcher).
+        """
+        for spec in self._runners:
+            try:
+                self._runner(spec).train()
+            except forml.InvalidError as err:  # runner not supporting the train mode
+                LOGGER.debug('Runner %s not usable for training: %s', spec[0], err)
+                continue
+            return
+        self._launcher(feeds=[self._feed]).train()
+
+    def _runner(self, spec: tuple[str, typing.Mapping[str, typing.Any]]) -> '_agent.Runner':
+        """Create the runner instance.
+
+        Args:
+            spec: Runner reference and its parameters.
+
+        Returns:
+            Runner instance.
+        """
+        reference, params = spec
+        return _agent.Runner[reference](self._launcher.instance, self._feed, io.Sink['null'](), **params)
+
+    def measure(self, case: 'Benchmark.Case') -> 'Benchmark.Result':
+        """Measure the given case.
+
+        Args:
+            case: Case to be measured.
+
+        Returns:
+            Case measurement result.
+        """
+        LOGGER.info('Benchmarking %s', case)
+        execute = self.prepare(case)
+        for _ in range(self._warmup):
+            execute()
+        latencies = []
+        for _ in range(self._repeat):
+            start = time.perf_counter()
+            execute()
+            latencies.append(time.perf_counter() - start)
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        try:
+            execute()
+            memory = tracemalloc.get_traced_memory()[1] - base
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+        return self.Result(str(case), self._spec.rows, tuple(latencies), memory)
+
+    def __call__(self, cases: typing.Optional[typing.Iterable['Benchmark.Case']] = None) -> 'Benchmark.Report':
+        """Run the benchmark.
+
+        Cases not supported by the particular runner (i.e. the *train* mode of the ``pyfunc``
+        runner) are skipped.
+
+        Args:
+            cases: Cases to be measured (all by default).
+
+        Returns:
+            Benchmark report.
+        """
+        results = []
+        for case in cases or self.cases:
+            try:
+                results.append(self.measure(case))
+            except forml.InvalidError as err:
+                LOGGER.warning('Skipping %s: %s', case, err)
+        return self.Report(self._spec, tuple(results))
@@ -0,0 +1,500 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Serving load testing.
+"""
+import asyncio
+import contextlib
+import http.client
+import json
+import logging
+import pathlib
+import shutil
+import threading
+import time
+import typing
+from concurrent import futures
+
+import numpy
+
+import forml
+from forml import application as appmod
+from forml import io
+from forml import project as prjmod
+from forml.io import asset, dsl, layout
+
+from . import _bench, _service
+
+if typing.TYPE_CHECKING:
+    from forml import runtime
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Inventory(asset.Inventory):
+    """Trivial in-memory inventory holding the load test application descriptor."""
+
+    def __init__(self, *descriptors: appmod.Descriptor):
+        self._content: dict[str, appmod.Descriptor] = {d.name: d for d in descriptors}
+
+    def list(self) -> typing.Iterable[str]:
+        return self._content.keys()
+
+    def get(self, application: str) -> appmod.Descriptor:
+        try:
+            return self._content[application]
+        except KeyError as err:
+            raise forml.MissingError(f'Application {application} not found') from err
+
+    def put(self, descriptor: appmod.Descriptor.Handle) -> None:
+        raise forml.InvalidError('Read-only inventory')
+
+
+class Server:
+    """Server loop function running the `Uvicorn <https://www.uvicorn.org/>`_ server in a background
+    thread (rather than blocking the caller) so that it can be used as the :class:`rest gateway
+    <forml.provider.gateway.rest.Gateway>` *server* parameter for an in-process load testing.
+    """
+
+    def __init__(self):
+        self._server = None
+        self._thread: typing.Optional[threading.Thread] = None
+
+    def __call__(self, app: typing.Callable, **options) -> None:
+        import uvicorn  # pylint: disable=import-outside-toplevel
+
+        self._server = uvicorn.Server(uvicorn.Config(app, **options))
+        self._thread = threading.Thread(target=self._server.run, name='loadtest-server', daemon=True)
+        self._thread.start()
+        while not self._server.started:
+            if not self._thread.is_alive():
+                raise forml.UnexpectedError('Server failed to start')
+            time.sleep(0.01)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """The actual (host, port) address the server is listening on.
+
+        Returns:
+            Address tuple.
+        """
+        return self._server.servers[0].sockets[0].getsockname()[:2]
+
+    def stop(self) -> None:
+        """Terminate the server."""
+        if self._server:
+            self._server.should_exit = True
+            self._thread.join()
+
+
+class LoadTest:
+    """Harness for measuring the serving performance of the :ref:`Engine <serving>` both directly and
+    through the :class:`rest gateway <forml.provider.gateway.rest.Gateway>` over HTTP.
+
+    The served model is the :class:`synthetic benchmark <forml.runtime.Benchmark>` project of the
+    given *workload* specification trained into a :class:`volatile registry
+    <forml.provider.registry.filesystem.volatile.Registry>` and exposed via the :class:`generic
+    application descriptor <forml.application.Generic>`. Its sources get generated into a temporary
+    directory (so that the project can be loaded also by the (spawned) model worker processes) which
+    only lives for the duration of the load test run.
+
+    Each load test case (target and payload encoding combination) starts a fresh engine which, after
+    a number of warmup requests, receives the requests either in a *closed-loop* mode (given number
+    of concurrent clients each sending the next request upon receiving the previous response) or in
+    an *open-loop* mode (requests arriving at the fixed *rate* regardless of the responses with up
+    to the *concurrency* number of them in-flight). In the open-loop mode, the latency is measured
+    since the scheduled arrival time to also account for any client-side queueing.
+
+    The report provides the throughput, the latency percentiles and the average latency of the
+    individual serving stages (``decode``, ``select``, ``predict`` and ``encode``) as collected by
+    the engine :class:`metrics <forml.runtime.Stats>`.
+
+    Args:
+        spec: Load specification.
+        workload: Synthetic project specification.
+        targets: Load test targets (``engine`` and/or ``rest``).
+        encodings: Request payload encodings (as content-type headers).
+        warmup: Number of untimed requests preceding the timed ones.
+        options: Additional engine parameters (i.e. ``processes``, ``codec``, ``fuse``, ``batch_size``
+                 etc.).
+
+    Examples:
+        >>> report = runtime.LoadTest(runtime.LoadTest.Spec(requests=5000, rate=500), codec='thread')()
+        >>> print(report)
+        >>> report.dump('loadtest.json')
+
+    Important:
+        The ``rest`` target requires the ``rest`` :ref:`extras <install-extras>`.
+    """
+
+    class Spec(typing.NamedTuple):
+        """Load specification."""
+
+        requests: int = 1000
+        """Number of timed requests per each case."""
+        concurrency: int = 8
+        """Maximum number of in-flight requests."""
+        rate: typing.Optional[float] = None
+        """Open-loop arrival rate (requests per second) or closed-loop if not set."""
+        rows: int = 1
+        """Number of rows per request."""
+
+    class Case(typing.NamedTuple):
+        """Load test case specification."""
+
+        target: str
+        """Load test target (either ``engine`` or ``rest``)."""
+        encoding: str
+        """Request payload encoding."""
+
+        def __str__(self):
+            return f'{self.target}:{self.encoding}'
+
+    class Result(typing.NamedTuple):
+        """Measurements of a single case."""
+
+        case: str
+        """Case name."""
+        latencies: tuple[float, ...]
+        """Individual latencies (in seconds) of the successful requests."""
+        errors: int
+        """Number of failed requests."""
+        elapsed: float
+        """Total duration (in seconds) of the timed requests."""
+        stages: typing.Mapping[str, float]
+        """Average latency (in seconds) of the individual serving stages."""
+
+        def percentile(self, percent: float) -> float:
+            """Get the latency percentile.
+
+            Args:
+                percent: Percentile to get (0-100).
+
+            Returns:
+                Latency (in seconds).
+            """
+            return float(numpy.percentile(self.latencies, percent)) if self.latencies else float('nan')
+
+        @property
+        def throughput(self) -> float:
+            """Number of successful requests served per second."""
+            return len(self.latencies) / self.elapsed
+
+    class Report(typing.NamedTuple):
+        """Collection of the load test results."""
+
+        spec: 'LoadTest.Spec'
+        """Load specification."""
+        results: tuple['LoadTest.Result', ...]
+        """Individual case results."""
+
+        def __str__(self):
+            stages = LoadTest.STAGES
+            lines = [
+                f'{"p50[ms]":>10} {"p95[ms]":>10} {"p99[ms]":>10} {"req/s":>10} {"errors":>7} '
+                + ' '.join(f'{s + "[ms]":>12}' for s in stages)
+                + '  case'
+            ]
+            for result in self.results:
+                lines.append(
+                    f'{result.percentile(50) * 1000:>10.2f} {result.percentile(95) * 1000:>10.2f} '
+                    f'{result.percentile(99) * 1000:>10.2f} {result.throughput:>10.1f} {result.errors:>7} '
+                    + ' '.join(f'{result.stages.get(s, float("nan")) * 1000:>12.3f}' for s in stages)
+                    + f'  {result.case}'
+                )
+            return '\n'.join(lines)
+
+        def dump(self, path: typing.Union[str, pathlib.Path]) -> None:
+            """Store the report into the given JSON file.
+
+            Args:
+                path: Target file path.
+            """
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump({'spec': self.spec._asdict(), 'results': [r._asdict() for r in self.results]}, file)
+
+    TARGETS = ('engine', 'rest')
+    """Supported load test targets."""
+    ENCODINGS = ('application/json; format=pandas-records', 'text/csv')
+    """Default request payload encodings."""
+    STAGES = ('decode', 'select', 'predict', 'encode')
+    """Reported serving stages."""
+    PACKAGE = 'loadtest'
+    """Package name of the generated synthetic project."""
+    MODULE = '''from forml import project
+from forml.runtime import _bench
+
+project.setup(_bench.Benchmark.{component}(_bench.Benchmark.Spec(**{spec})))
+'''
+    """Template of the generated synthetic project component modules."""
+    PAYLOADS = 16
+    """Number of distinct request payloads (rotated) per each case."""
+
+    def __init__(
+        self,
+        spec: 'LoadTest.Spec' = Spec(),  # noqa: B008
+        workload: '_bench.Benchmark.Spec' = _bench.Benchmark.Spec(depth=2, rows=1000),  # noqa: B008
+        targets: typing.Iterable[str] = TARGETS,
+        encodings: typing.Iterable[str] = ENCODINGS,
+        warmup: int = 10,
+        **options: typing.Any,
+    ):
+        if spec.requests < 1 or spec.concurrency < 1 or spec.rows < 1 or (spec.rate is not None and spec.rate <= 0):
+            raise forml.InvalidError(f'Invalid load spec: {spec}')
+        if warmup < 0:
+            raise forml.InvalidError('Invalid load test warmup')
+        self._spec: LoadTest.Spec = spec
+        self._workload: _bench.Benchmark.Spec = workload
+        self._targets: tuple[str, ...] = tuple(targets)
+        if any(t not in self.TARGETS for t in self._targets):
+            raise forml.InvalidError(f'Invalid load test targets: {self._targets}')
+        self._encodings: tuple[layout.Encoding, ...] = tuple(layout.Encoding.parse(e)[0] for e in encodings)
+        self._warmup: int = warmup
+        self._options: typing.Mapping[str, typing.Any] = options
+        self._feed: io.Feed = _bench.Benchmark.feed(workload)
+        self._launcher: typing.Optional['runtime.Virtual'] = None
+        self._application: typing.Optional[str] = None
+        self._inventory: typing.Optional[asset.Inventory] = None
+
+    @classmethod
+    def artifact(cls, workload: '_bench.Benchmark.Spec', path: pathlib.Path) -> prjmod.Artifact:
+        """Generate the synthetic project sources into the given directory.
+
+        Args:
+            workload: Synthetic project specification.
+            path: Target directory.
+
+        Returns:
+            Project artifact.
+        """
+        package = path / cls.PACKAGE
+        package.mkdir()
+        (package / '__init__.py').touch()
+        for component in ('source', 'pipeline'):
+            (package / f'{component}.py').write_text(
+                cls.MODULE.format(component=component, spec=workload._asdict()), encoding='utf-8'
+            )
+        return prjmod.Artifact(path, cls.PACKAGE)
+
+    @property
+    def cases(self) -> typing.Sequence['LoadTest.Case']:
+        """All the cases of this load test."""
+        return tuple(self.Case(t, e.header) for t in self._targets for e in self._encodings)
+
+    def payloads(self, encoding: layout.Encoding) -> typing.Sequence[bytes]:
+        """Generate the request payloads.
+
+        Args:
+            encoding: Payload encoding.
+
+        Returns:
+            Sequence of the encoded payloads.
+        """
+        encoder = layout.get_encoder(encoding)
+        schema = dsl.Schema.from_fields(*(dsl.Field(dsl.Float(), name=f'f{i}') for i in range(self._workload.columns)))
+        generator = numpy.random.default_rng(0)
+        return tuple(
+            encoder.dumps(layout.Outcome(schema, generator.random((self._spec.rows, self._workload.columns)).tolist()))
+            for _ in range(self.PAYLOADS)
+        )
+
+    @contextlib.contextmanager
+    def _project(self) -> typing.Iterator[None]:
+        """Context of the synthetic project generated into a temporary directory and trained.
+
+        The directory gets removed upon exiting the context.
+        """
+        path = asset.mkdtemp(prefix='loadtest-')
+        try:
+            self._launcher = self.artifact(self._workload, path).launcher
+            self._application = str(self._launcher.instance.generation.project.key)
+            self._inventory = Inventory(appmod.Generic(self._application))
+            self._launcher(feeds=[self._feed]).train()  # using the default runner
+            yield
+        finally:
+            self._launcher = self._application = self._inventory = None
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _engine(self) -> _service.Engine:
+        """Create a fresh engine instance.
+
+        Returns:
+            Engine instance.
+        """
+        return _service.Engine(self._inventory, self._launcher.registry, io.Importer(self._feed), **self._options)
+
+    def measure(self, case: 'LoadTest.Case') -> 'LoadTest.Result':
+        """Measure the given case.
+
+        Args:
+            case: Case to be measured.
+
+        Returns:
+            Case measurement result.
+        """
+        if case.target not in self.TARGETS:
+            raise forml.InvalidError(f'Invalid load test target: {case.target}')
+        if self._launcher is None:  # not within a load test run
+            with self._project():
+                return self.measure(case)
+        LOGGER.info('Load testing %s', case)
+        encoding = layout.Encoding.parse(case.encoding)[0]
+        payloads = self.payloads(encoding)
+        engine = self._engine()
+        try:
+            if case.target == 'engine':
+
+                async def send(payload: bytes) -> None:
+                    """Direct engine request."""
+                    await engine.apply(self._application, layout.Request(payload, encoding))
+
+                return asyncio.run(self._drive(case, engine, send, payloads))
+            return self._http(case, engine, encoding, payloads)
+        finally:
+            engine.shutdown()
+
+    def _http(
+        self,
+        case: 'LoadTest.Case',
+        engine: _service.Engine,
+        encoding: layout.Encoding,
+        payloads: typing.Sequence[bytes],
+    ) -> 'LoadTest.Result':
+        """Measure the case using the rest gateway serving the given engine.
+
+        Args:
+            case: Case to be measured.
+            engine: Engine to be served.
+            encoding: Payload encoding.
+            payloads: Request payloads.
+
+        Returns:
+            Case measurement result.
+        """
+        server = Server()
+        _service.Gateway['rest'].run(
+            engine.apply, engine.stats, server=server, options={'host': '127.0.0.1', 'port': 0, 'log_level': 'warning'}
+        )
+        host, port = server.address
+        local = threading.local()
+        connections: list[http.client.HTTPConnection] = []
+        headers = {'content-type': encoding.header}
+        path = f'/{self._application}'
+
+        def post(payload: bytes) -> None:
+            """Blocking HTTP request using a per-thread persistent connection."""
+            if not hasattr(local, 'connection'):
+                local.connection = http.client.HTTPConnection(host, port)
+                connections.append(local.connection)
+            local.connection.request('POST', path, payload, headers)
+            response = local.connection.getresponse()
+            body = response.read()
+            if response.status != 200:
+                raise forml.UnexpectedError(f'HTTP {response.status}: {body[:256]!r}')
+
+        pool = futures.ThreadPoolExecutor(self._spec.concurrency, thread_name_prefix='loadtest')
+
+        async def send(payload: bytes) -> None:
+            """HTTP request executed in the client thread pool."""
+            await asyncio.get_running_loop().run_in_executor(pool, post, payload)
+
+        try:
+            return asyncio.run(self._drive(case, engine, send, payloads))
+        finally:
+            pool.shutdown()
+            for connection in connections:
+                connection.close()
+            server.stop()
+
+    async def _drive(
+        self,
+        case: 'LoadTest.Case',
+        engine: _service.Engine,
+        send: typing.Callable[[bytes], typing.Awaitable[None]],
+        payloads: typing.Sequence[bytes],
+    ) -> 'LoadTest.Result':
+        """Generate the load using the given request sender.
+
+        Args:
+            case: Case to be measured.
+            engine: Engine for collecting the stage metrics.
+            send: Coroutine function sending the payload as a single request.
+            payloads: Request payloads.
+
+        Returns:
+            Case measurement result.
+        """
+        for index in range(self._warmup):
+            await send(payloads[index % len(payloads)])
+        before = (await engine.stats()).applications.get(self._application)
+        limit = asyncio.Semaphore(self._spec.concurrency)
+        latencies: list[float] = []
+        errors = 0
+
+        async def request(payload: bytes, arrival: float) -> None:
+            """Send the request recording its latency since the given arrival time."""
+            nonlocal errors
+            async with limit:
+                try:
+                    await send(payload)
+                except Exception as err:  # pylint: disable=broad-except
+                    LOGGER.debug('Request failed: %s', err)
+                    errors += 1
+                    return
+            latencies.append(time.perf_counter() - arrival)
+
+        start = time.perf_counter()
+        if self._spec.rate:
+            tasks = []
+            for index in range(self._spec.requests):
+                arrival = start + index / self._spec.rate
+                if (delay := arrival - time.perf_counter()) > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.create_task(request(payloads[index % len(payloads)], arrival)))
+            await asyncio.gather(*tasks)
+        else:
+            indices = iter(range(self._spec.requests))
+
+            async def client() -> None:
+                """Closed-loop client sending the next request upon receiving the previous response."""
+                for index in indices:
+                    await request(payloads[index % len(payloads)], time.perf_counter())
+
+            await asyncio.gather(*(client() for _ in range(self._spec.concurrency)))
+        elapsed = time.perf_counter() - start
+        after = (await engine.stats()).applications[self._application]
+        stages = {}
+        for stage, histogram in after.latency.items():
+            count, total = histogram.count, histogram.sum
+            if before and stage in before.latency:
+                count, total = count - before.latency[stage].count, total - before.latency[stage].sum
+            if count:
+                stages[stage] = total / count
+        return self.Result(str(case), tuple(latencies), errors, elapsed, stages)
+
+    def __call__(self, cases: typing.Optional[typing.Iterable['LoadTest.Case']] = None) -> 'LoadTest.Report':
+        """Run the load test.
+
+        Args:
+            cases: Cases to be measured (all by default).
+
+        Returns:
+            Load test report.
+        """
+        with self._project():
+            return self.Report(self._spec, tuple(self.measure(c) for c in cases or self.cases))
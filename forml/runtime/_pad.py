@@ -131,7 +131,9 @@ class Launcher:
         return self(self._assets.project.source.extract.train, self._sink.apply).train
 
     @property
-    def apply(self) -> typing.Callable[[typing.Optional[dsl.Native], typing.Optional[dsl.Native]], None]:
+    def apply(
+        self,
+    ) -> typing.Callable[[typing.Optional[dsl.Native], typing.Optional[dsl.Native], typing.Optional[int]], None]:
         """Return the apply handler.
 
         Returns:
@@ -14,15 +14,427 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+
 """
 Runtime performance reporting.
 """
+import bisect
+import collections
+import contextvars
+import json
+import math
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+import time
 import typing
 
+import forml
+from forml import flow
+
+if typing.TYPE_CHECKING:
+    from forml.io import asset
+
 
 class Stats(typing.NamedTuple):
     """Runtime performance metrics report.
 
-    Todo:
-        Complete the Stats concept.
+    The metrics are aggregated both per each of the served *applications* and per each of the involved
+    model *instances*.
+    """
+
+    applications: typing.Mapping[str, 'Stats.Metrics'] = {}
+    """Metrics aggregated per application name."""
+    instances: typing.Mapping[str, 'Stats.Metrics'] = {}
+    """Metrics aggregated per model instance."""
+
+    class Histogram(typing.NamedTuple):
+        """Latency histogram with fixed bucket bounds."""
+
+        BOUNDS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, math.inf)
+        """Upper bounds (in seconds) of the histogram buckets."""
+
+        buckets: tuple[int, ...]
+        """Number of observations falling into each of the buckets (non-cumulative)."""
+        sum: float
+        """Total sum of all the observed values."""
+
+        @property
+        def count(self) -> int:
+            """Total number of observations.
+
+            Returns:
+                Observation count.
+            """
+            return sum(self.buckets)
+
+    class Metrics(typing.NamedTuple):
+        """Metrics of a particular scope."""
+
+        requests: int = 0
+        """Number of requests received."""
+        errors: int = 0
+        """Number of requests failed."""
+        pending: int = 0
+        """Number of requests currently waiting for the prediction (queue depth)."""
+        latency: typing.Mapping[str, 'Stats.Histogram'] = {}
+        """Latency histograms per each of the processing stages."""
+
+    def to_prometheus(self, prefix: str = 'forml') -> str:
+        """Render the report using the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix.
+
+        Returns:
+            Prometheus formatted metrics.
+        """
+
+        def escape(value: str) -> str:
+            return value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+        def scopes() -> typing.Iterable[tuple[str, 'Stats.Metrics']]:
+            for label, mapping in (('application', self.applications), ('instance', self.instances)):
+                for key, metrics in sorted(mapping.items()):
+                    yield f'{label}="{escape(key)}"', metrics
+
+        lines = []
+        for name, kind, info, getter in (
+            ('requests_total', 'counter', 'Number of received requests.', lambda m: m.requests),
+            ('errors_total', 'counter', 'Number of failed requests.', lambda m: m.errors),
+            ('pending', 'gauge', 'Number of requests waiting for prediction.', lambda m: m.pending),
+        ):
+            lines.append(f'# HELP {prefix}_{name} {info}')
+            lines.append(f'# TYPE {prefix}_{name} {kind}')
+            lines.extend(f'{prefix}_{name}{{{s}}} {getter(m)}' for s, m in scopes())
+        lines.append(f'# HELP {prefix}_latency_seconds Processing latency per stage.')
+        lines.append(f'# TYPE {prefix}_latency_seconds histogram')
+        for scope, metrics in scopes():
+            for stage, histogram in sorted(metrics.latency.items()):
+                labels = f'{scope},stage="{stage}"'
+                cumulative = 0
+                for bound, count in zip(histogram.BOUNDS, histogram.buckets):
+                    cumulative += count
+                    bound = '+Inf' if math.isinf(bound) else repr(bound)
+                    lines.append(f'{prefix}_latency_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{prefix}_latency_seconds_sum{{{labels}}} {histogram.sum}')
+                lines.append(f'{prefix}_latency_seconds_count{{{labels}}} {cumulative}')
+        return '\n'.join(lines) + '\n'
+
+
+class Collector:
+    """Low-overhead collector of the serving metrics.
+
+    The collector is a plain per-process aggregator with all the updates expected to happen within the
+    single thread of the serving event loop, hence there is no locking involved.
+
+    Args:
+        refresh: Maximum age (in seconds) of the cached report snapshot as provided to the model selectors.
+    """
+
+    class Counters:
+        """Mutable counters of a particular scope."""
+
+        def __init__(self):
+            self.requests: int = 0
+            self.errors: int = 0
+            self.pending: int = 0
+            self.latency: dict[str, tuple[list[int], list[float]]] = {}
+
+        def observe(self, stage: str, seconds: float) -> None:
+            """Record the given latency observation.
+
+            Args:
+                stage: Processing stage name.
+                seconds: Observed latency.
+            """
+            if stage not in self.latency:
+                self.latency[stage] = [0] * len(Stats.Histogram.BOUNDS), [0.0]
+            buckets, total = self.latency[stage]
+            buckets[bisect.bisect_left(Stats.Histogram.BOUNDS, seconds)] += 1
+            total[0] += seconds
+
+        def freeze(self) -> Stats.Metrics:
+            """Get the immutable copy of the counters.
+
+            Returns:
+                Metrics instance.
+            """
+            return Stats.Metrics(
+                self.requests,
+                self.errors,
+                self.pending,
+                {s: Stats.Histogram(tuple(b), t[0]) for s, (b, t) in self.latency.items()},
+            )
+
+    REFRESH = 1.0
+
+    def __init__(self, refresh: float = REFRESH):
+        self._refresh: float = refresh
+        self._applications: dict[str, Collector.Counters] = {}
+        self._instances: dict['asset.Instance', Collector.Counters] = {}
+        self._snapshot: Stats = Stats()
+        self._timestamp: float = -math.inf
+
+    def _scopes(
+        self, application: str, instance: typing.Optional['asset.Instance'] = None
+    ) -> typing.Iterable['Collector.Counters']:
+        """Get the counters of the given scopes.
+
+        Args:
+            application: Application name.
+            instance: Optional model instance.
+
+        Returns:
+            Counters of the involved scopes.
+        """
+        if application not in self._applications:
+            self._applications[application] = self.Counters()
+        yield self._applications[application]
+        if instance is not None:
+            if instance not in self._instances:
+                self._instances[instance] = self.Counters()
+            yield self._instances[instance]
+
+    def request(self, application: str) -> None:
+        """Record a new request.
+
+        Args:
+            application: Application name.
+        """
+        for counters in self._scopes(application):
+            counters.requests += 1
+
+    def error(self, application: str, instance: typing.Optional['asset.Instance'] = None) -> None:
+        """Record a request failure.
+
+        Args:
+            application: Application name.
+            instance: Optional model instance (if already selected).
+        """
+        for counters in self._scopes(application, instance):
+            counters.errors += 1
+
+    def enqueue(self, application: str, instance: 'asset.Instance') -> None:
+        """Record a request submitted for prediction.
+
+        Args:
+            application: Application name.
+            instance: Model instance.
+        """
+        for counters in self._scopes(application, instance):
+            counters.pending += 1
+        self._instances[instance].requests += 1
+
+    def dequeue(self, application: str, instance: 'asset.Instance') -> None:
+        """Record a request finished its prediction.
+
+        Args:
+            application: Application name.
+            instance: Model instance.
+        """
+        for counters in self._scopes(application, instance):
+            counters.pending -= 1
+
+    def observe(
+        self, stage: str, seconds: float, application: str, instance: typing.Optional['asset.Instance'] = None
+    ) -> None:
+        """Record a latency observation of the particular stage.
+
+        Args:
+            stage: Processing stage name.
+            seconds: Observed latency.
+            application: Application name.
+            instance: Optional model instance.
+        """
+        for counters in self._scopes(application, instance):
+            counters.observe(stage, seconds)
+
+    def snapshot(self, fresh: bool = False) -> Stats:
+        """Get the (possibly cached) report of the collected metrics.
+
+        Args:
+            fresh: Force the report to be up-to-date regardless of the refresh interval.
+
+        Returns:
+            Stats report.
+        """
+        now = time.monotonic()
+        if fresh or now - self._timestamp > self._refresh:
+            self._snapshot = Stats(
+                {a: c.freeze() for a, c in self._applications.items()},
+                {repr(i): c.freeze() for i, c in self._instances.items()},
+            )
+            self._timestamp = now
+        return self._snapshot
+
+
+class Profile(typing.NamedTuple):
+    """Instruction level runtime profiling report."""
+
+    samples: tuple['flow.Instrument.Sample', ...] = ()
+    """All the individual instruction execution samples ordered by their start time."""
+
+    class Metrics(typing.NamedTuple):
+        """Metrics aggregated per instruction name."""
+
+        calls: int = 0
+        """Number of the instruction executions."""
+        wall: float = 0
+        """Total wall time (in seconds)."""
+        cpu: float = 0
+        """Total CPU time (in seconds)."""
+        input: int = 0
+        """Total size (in bytes) of the input arguments."""
+        output: int = 0
+        """Total size (in bytes) of the outputs."""
+        memory: int = 0
+        """Maximum increase (in bytes) of the process peak RSS."""
+
+    @property
+    def instructions(self) -> typing.Mapping[str, 'Profile.Metrics']:
+        """Metrics aggregated per instruction name ordered by the total wall time (descending).
+
+        Returns:
+            Mapping of instruction names to their metrics.
+        """
+        metrics: dict[str, Profile.Metrics] = collections.defaultdict(self.Metrics)
+        for sample in self.samples:
+            current = metrics[sample.name]
+            metrics[sample.name] = self.Metrics(
+                current.calls + 1,
+                current.wall + sample.wall,
+                current.cpu + sample.cpu,
+                current.input + sample.input,
+                current.output + sample.output,
+                max(current.memory, sample.memory),
+            )
+        return dict(sorted(metrics.items(), key=lambda i: i[1].wall, reverse=True))
+
+    def __str__(self):
+        lines = [
+            f'{"calls":>6} {"wall[ms]":>10} {"cpu[ms]":>10} {"input[kB]":>10} {"output[kB]":>10} {"rss[kB]":>8}  name'
+        ]
+        for name, metrics in self.instructions.items():
+            lines.append(
+                f'{metrics.calls:>6} {metrics.wall * 1000:>10.2f} {metrics.cpu * 1000:>10.2f} '
+                f'{metrics.input // 1024:>10} {metrics.output // 1024:>10} {metrics.memory // 1024:>8}  {name}'
+            )
+        return '\n'.join(lines)
+
+    def to_chrome(self) -> typing.Mapping[str, typing.Any]:
+        """Render the samples as a timeline using the Chrome `Trace Event Format
+        <https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`_ (as
+        supported also by `Perfetto <https://ui.perfetto.dev>`_).
+
+        Returns:
+            JSON serializable trace object.
+        """
+        events = [
+            {
+                'name': s.name,
+                'cat': 'instruction',
+                'ph': 'X',
+                'ts': s.start * 1_000_000,
+                'dur': s.wall * 1_000_000,
+                'pid': s.pid,
+                'tid': s.tid,
+                'args': {
+                    'cpu_ms': s.cpu * 1000,
+                    'input_bytes': s.input,
+                    'output_bytes': s.output,
+                    'rss_delta_bytes': s.memory,
+                },
+            }
+            for s in self.samples
+        ]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+class Profiler(flow.Instrument):
+    """Instrument collecting the instruction execution samples of all the runs launched within its
+    context.
+
+    The samples are spooled in a temporal directory (one file per each process) so that they can be
+    collected also from the remote workers sharing the local filesystem. Each process keeps its
+    spool file open (line-buffered) for the whole profiling session.
+
+    Examples:
+        >>> with runtime.Profiler() as profiler:
+        ...     launcher.train()
+        >>> print(profiler.profile)
     """
+
+    _CURRENT: contextvars.ContextVar[typing.Optional['Profiler']] = contextvars.ContextVar('profiler', default=None)
+
+    def __init__(self):
+        self._spool: typing.Optional[pathlib.Path] = None
+        self._lock: threading.Lock = threading.Lock()
+        self._pid: typing.Optional[int] = None
+        self._handle: typing.Optional[typing.TextIO] = None
+        self._samples: list['flow.Instrument.Sample'] = []
+        self._token: typing.Optional[contextvars.Token] = None
+
+    def __getstate__(self):
+        return {'_spool': self._spool}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._pid = self._handle = None
+
+    def __enter__(self) -> 'Profiler':
+        if self._spool:
+            raise forml.UnexpectedError('Profiler already active')
+        self._spool = pathlib.Path(tempfile.mkdtemp(prefix='profile-'))
+        self._token = self._CURRENT.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._CURRENT.reset(self._token)
+        with self._lock:
+            if self._handle and self._pid == os.getpid():
+                self._handle.close()
+            self._pid = self._handle = None
+        for path in self._spool.iterdir():
+            with path.open() as spool:
+                self._samples.extend(flow.Instrument.Sample(*json.loads(r)) for r in spool)
+        shutil.rmtree(self._spool, ignore_errors=True)
+        self._spool = None
+
+    @classmethod
+    def current(cls) -> typing.Optional['Profiler']:
+        """Get the currently active profiler (if any).
+
+        Returns:
+            Active profiler instance or None.
+        """
+        return cls._CURRENT.get()
+
+    def record(self, sample: 'flow.Instrument.Sample') -> None:
+        line = json.dumps(sample) + '\n'
+        with self._lock:
+            if (pid := os.getpid()) != self._pid:  # first sample in this process (or since forking)
+                self._handle = (self._spool / f'{pid}.jsonl').open('a', buffering=1, encoding='utf-8')
+                self._pid = pid
+            self._handle.write(line)
+
+    @property
+    def profile(self) -> Profile:
+        """Report of all the samples collected so far (excluding the currently active context).
+
+        Returns:
+            Profiling report.
+        """
+        return Profile(tuple(sorted(self._samples, key=lambda s: s.start)))
+
+    def dump(self, path: typing.Union[str, pathlib.Path]) -> None:
+        """Write the Chrome trace of the collected samples into the given file.
+
+        Args:
+            path: Target file path.
+        """
+        with open(path, 'w', encoding='utf-8') as trace:
+            json.dump(self.profile.to_chrome(), trace)
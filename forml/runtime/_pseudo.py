@@ -18,6 +18,7 @@
 """
 Special lightweight launcher for dummy execution.
 """
+import contextlib
 import logging
 import types
 import typing
@@ -29,7 +30,7 @@ from forml.io import asset
 from forml.provider.registry.filesystem import volatile
 
 from ..pipeline import payload
-from . import _pad
+from . import _pad, _perf
 
 if typing.TYPE_CHECKING:
     from forml import flow, project, runtime  # pylint: disable=reimported
@@ -90,6 +91,14 @@ class Virtual:
 
        >>> launcher_instance('dask', ['openlake']).apply()
        [0.31, 0.63, 0.16, 0.87]
+
+    The *call* syntax also accepts an optional :class:`profiler <forml.runtime.Profiler>` for
+    collecting the instruction-level execution profile of the triggered actions:
+
+    >>> profiler = runtime.Profiler()
+    >>> launcher_instance(profiler=profiler).train()
+    >>> print(profiler.profile)
+    >>> profiler.dump('trace.json')
     """
 
     class Trained:
@@ -112,9 +121,12 @@ class Virtual:
     class Handler:
         """Wrapper for selected launcher parameters."""
 
-        def __init__(self, launcher: _pad.Launcher, sniffer: payload.Sniff):
+        def __init__(
+            self, launcher: _pad.Launcher, sniffer: payload.Sniff, profiler: typing.Optional[_perf.Profiler] = None
+        ):
             self._launcher: _pad.Launcher = launcher
             self._sniffer: payload.Sniff = sniffer
+            self._profiler: typing.Optional[_perf.Profiler] = profiler
 
         def _run(
             self,
@@ -125,7 +137,7 @@ class Virtual:
             lower: typing.Optional['dsl.Native'] = None,
             upper: typing.Optional['dsl.Native'] = None,
         ) -> payload.Sniff.Future:
-            with self._sniffer as future:
+            with self._profiler or contextlib.nullcontext(), self._sniffer as future:
                 action(self._launcher)(lower, upper)
             return future
 
@@ -204,13 +216,32 @@ class Virtual:
         self._sniffer: payload.Sniff = payload.Sniff()
         asset.Directory(self._registry).get(self._project).put(package)
 
+    @property
+    def instance(self) -> asset.Instance:
+        """Asset instance of the latest generation of the virtual project.
+
+        Returns:
+            Asset instance.
+        """
+        return asset.Instance(self._project, registry=asset.Directory(self._registry))
+
+    @property
+    def registry(self) -> asset.Registry:
+        """The internal volatile registry holding the virtual project.
+
+        Returns:
+            Registry instance.
+        """
+        return self._registry
+
     def __call__(
         self,
         runner: typing.Optional[typing.Union[setup.Runner, str]] = None,
         feeds: typing.Optional[typing.Iterable[typing.Union[setup.Feed, str, io.Feed]]] = None,
+        profiler: typing.Optional['runtime.Profiler'] = None,
     ) -> 'runtime.Virtual.Handler':
         launcher = _pad.Platform(runner, self._registry, feeds, self.Sink(self._sniffer)).launcher(self._project)
-        return self.Handler(launcher, self._sniffer)
+        return self.Handler(launcher, self._sniffer, profiler)
 
     def __getitem__(self, runner: typing.Union[setup.Runner, str]) -> 'runtime.Virtual.Handler':
         """Convenient shortcut for selecting a specific runner using the `launcher[name]` syntax.
@@ -19,15 +19,15 @@ Runtime service facility.
 """
 import abc
 import logging
+import time
 import typing
 
-from forml import io, provider
-from forml import runtime as runmod
-from forml import setup
+import forml
+from forml import io, provider, setup
 from forml.io import asset, layout
 
 from .. import _perf
-from . import dispatch
+from . import cache, dispatch
 
 if typing.TYPE_CHECKING:
     import asyncio
@@ -39,7 +39,12 @@ LOGGER = logging.getLogger(__name__)
 
 
 class Engine:
-    """Serving engine implementation."""
+    """Serving engine implementation.
+
+    Optionally, the engine maintains a :class:`response cache <forml.runtime._service.cache.Cache>` serving the
+    repeated requests (dispatched to the same model instance) without the prediction and encoding. The cache
+    gets invalidated whenever the particular project lineage switches to a new model instance.
+    """
 
     def __init__(
         self,
@@ -48,9 +53,43 @@ class Engine:
         feeds: io.Importer,
         processes: typing.Optional[int] = None,
         loop: typing.Optional['asyncio.AbstractEventLoop'] = None,
+        batch_size: typing.Optional[int] = None,
+        batch_delay: typing.Optional[float] = None,
+        codec: str = 'process',
+        fuse: bool = False,
+        capacity: typing.Optional[int] = None,
+        idle: typing.Optional[float] = None,
+        memory: typing.Optional[int] = None,
+        share: bool = False,
+        memo: typing.Optional[int] = None,
+        backend: str = 'expression',
+        workers: typing.Optional[int] = None,
+        cache_size: typing.Optional[int] = None,
+        cache_ttl: typing.Optional[float] = None,
     ):
-        self._wrapper: dispatch.Wrapper = dispatch.Wrapper(inventory, registry, processes, loop)
-        self._dealer: dispatch.Dealer = dispatch.Dealer(feeds, processes, loop)
+        self._collector: _perf.Collector = _perf.Collector()
+        self._wrapper: dispatch.Wrapper = dispatch.Wrapper(
+            inventory, registry, processes, loop, self._collector, codec=codec
+        )
+        self._fuse: bool = fuse
+        self._dealer: dispatch.Dealer = dispatch.Dealer(
+            feeds,
+            processes,
+            loop,
+            batch_size=batch_size,
+            batch_delay=batch_delay,
+            capacity=capacity,
+            idle=idle,
+            memory=memory,
+            share=share,
+            memo=memo,
+            backend=backend,
+            workers=workers,
+        )
+        self._cache: typing.Optional[cache.Cache] = None
+        if cache_size:
+            self._cache = cache.Cache(cache_size, cache_ttl)
+            self._dealer.subscribe(self._cache.invalidate)
 
     def shutdown(self):
         """Terminate the engine."""
@@ -62,10 +101,8 @@ class Engine:
 
         Returns:
             Performance metrics report.
-
-        Todo: Implement true stats collection.
         """
-        return runmod.Stats()
+        return self._collector.snapshot(fresh=True)
 
     async def apply(self, application: str, request: layout.Request) -> layout.Response:
         """Engine predict entrypoint.
@@ -77,9 +114,69 @@ class Engine:
         Returns:
             Serving result response.
         """
-        query = await self._wrapper.extract(application, request, _perf.Stats())
-        outcome = await self._dealer(query.instance, query.decoded.entry)
-        return await self._wrapper.respond(query, outcome)
+        query = await self._extract(application, request)
+        if self._cache is None:
+            return await self._respond(query)
+        key = cache.Cache.Key.from_request(application, query.instance, request)
+        response = self._cache.get(key)
+        if response is None:
+            response = await self._respond(query)
+            self._cache.put(key, response)
+        return response
+
+    async def _extract(self, application: str, request: layout.Request) -> dispatch.Wrapper.Query:
+        """Decode the request and select the model instance.
+
+        Args:
+            application: Application unique name.
+            request: Application request instance.
+
+        Returns:
+            Extracted query parameters.
+        """
+        try:
+            query = await self._wrapper.extract(application, request, self._collector.snapshot())
+        except forml.MissingError:  # not collecting unknown applications
+            raise
+        except Exception:
+            self._collector.request(application)
+            self._collector.error(application)
+            raise
+        self._collector.request(application)
+        return query
+
+    async def _respond(self, query: dispatch.Wrapper.Query) -> layout.Response:
+        """Uncached prediction implementation.
+
+        Args:
+            query: Extracted query parameters.
+
+        Returns:
+            Serving result response.
+        """
+        application = query.application
+        self._collector.enqueue(application, query.instance)
+        start = time.perf_counter()
+        try:
+            if self._fuse:
+                response, encode = await self._dealer(query.instance, query.decoded.entry, self._wrapper.encoder(query))
+            else:
+                outcome = await self._dealer(query.instance, query.decoded.entry)
+        except Exception:
+            self._collector.error(application, query.instance)
+            raise
+        finally:
+            self._collector.dequeue(application, query.instance)
+        if self._fuse:
+            self._collector.observe('predict', time.perf_counter() - start - encode, application, query.instance)
+            self._wrapper.observe(query, encode)
+            return response
+        self._collector.observe('predict', time.perf_counter() - start, application, query.instance)
+        try:
+            return await self._wrapper.respond(query, outcome)
+        except Exception:
+            self._collector.error(application, query.instance)
+            raise
 
 
 class Gateway(provider.Service, default=setup.Gateway.default, path=setup.Gateway.path):
@@ -94,6 +191,27 @@ class Gateway(provider.Service, default=setup.Gateway.default, path=setup.Gatewa
                (default as per the platform configuration).
         processes: Process pool size for each model sandbox.
         loop: Explicit event loop instance.
+        batch_size: Enable micro-batching of up to the given number of rows coalesced into a single
+                    prediction call (only valid for pipelines with row-independent outcomes).
+        batch_delay: Maximum number of seconds to wait for filling a micro-batch.
+        codec: Execution strategy for the request decoding and response encoding (one of ``inline``,
+               ``thread`` or ``process``).
+        fuse: Encode the response already within the model worker process (saving one process
+              boundary crossing per request).
+        capacity: Maximum number of model instances to be kept loaded at a time (unlimited if not
+                  specified).
+        idle: Number of seconds after which an unused model instance gets unloaded.
+        memory: Maximum total memory footprint (in bytes) of the loaded model instances.
+        share: Load the model states in a copy-on-write friendly mode (freezing the garbage
+               collector and relocating large arrays into shared memory) so that all the forked
+               workers share one copy.
+        memo: Enable the row-level memoization of up to the given number of rows within each of
+              the model workers (only valid for pipelines with row-independent outcomes).
+        backend: Execution backend of the :class:`model workers <forml.provider.runner.pyfunc.Runner>`
+                 (one of ``expression``, ``program`` or ``parallel``).
+        workers: Thread pool size of the ``parallel`` backend within each of the model workers.
+        cache_size: Enable caching of up to the given number of responses to repeated requests.
+        cache_ttl: Number of seconds after which a cached response expires.
         kwargs: Additional serving loop keyword arguments passed to the :meth:`run` method.
     """
 
@@ -104,6 +222,19 @@ class Gateway(provider.Service, default=setup.Gateway.default, path=setup.Gatewa
         feeds: typing.Optional['io.Importer'] = None,
         processes: typing.Optional[int] = None,
         loop: typing.Optional['asyncio.AbstractEventLoop'] = None,
+        batch_size: typing.Optional[int] = None,
+        batch_delay: typing.Optional[float] = None,
+        codec: str = 'process',
+        fuse: bool = False,
+        capacity: typing.Optional[int] = None,
+        idle: typing.Optional[float] = None,
+        memory: typing.Optional[int] = None,
+        share: bool = False,
+        memo: typing.Optional[int] = None,
+        backend: str = 'expression',
+        workers: typing.Optional[int] = None,
+        cache_size: typing.Optional[int] = None,
+        cache_ttl: typing.Optional[float] = None,
         **kwargs,
     ):
         if not inventory:
@@ -112,7 +243,26 @@ class Gateway(provider.Service, default=setup.Gateway.default, path=setup.Gatewa
             registry = asset.Registry()
         if not feeds:
             feeds = io.Importer(io.Feed())
-        self._engine: Engine = Engine(inventory, registry, feeds, processes=processes, loop=loop)
+        self._engine: Engine = Engine(
+            inventory,
+            registry,
+            feeds,
+            processes=processes,
+            loop=loop,
+            batch_size=batch_size,
+            batch_delay=batch_delay,
+            codec=codec,
+            fuse=fuse,
+            capacity=capacity,
+            idle=idle,
+            memory=memory,
+            share=share,
+            memo=memo,
+            backend=backend,
+            workers=workers,
+            cache_size=cache_size,
+            cache_ttl=cache_ttl,
+        )
         self._kwargs: typing.Mapping[str, typing.Any] = kwargs
 
     def __enter__(self):
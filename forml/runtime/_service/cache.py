@@ -0,0 +1,143 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Runtime service response caching.
+"""
+import hashlib
+import logging
+import time
+import typing
+
+import forml
+
+if typing.TYPE_CHECKING:
+    from forml.io import asset, layout
+
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Cache:
+    """Response cache with the size bounded LRU eviction and optional entry expiration.
+
+    The cache is keyed by the application, the model instance selected for the request, the request payload
+    digest, its encoding, parameters and the accepted response encodings. Since the key includes the selected
+    instance, cache hits can skip the prediction and the response encoding (but not the request decoding and
+    the model selection) and a newly published generation picked up by the selector naturally bypasses the
+    responses of its predecessors. The entries of a project lineage still get invalidated once the lineage
+    switches to another instance (dropping also the responses produced by the predecessor while the new
+    instance was warming up).
+
+    Args:
+        size: Maximum number of the cached responses.
+        ttl: Optional number of seconds after which a cached response expires.
+    """
+
+    class Key(typing.NamedTuple):
+        """Cache key case class."""
+
+        application: str
+        instance: 'asset.Instance'
+        digest: bytes
+        encoding: str
+        params: tuple[tuple[str, str], ...]
+        accept: tuple[str, ...]
+
+        @classmethod
+        def from_request(
+            cls, application: str, instance: 'asset.Instance', request: 'layout.Request'
+        ) -> 'Cache.Key':
+            """Create the cache key for the given request.
+
+            Args:
+                application: Application name.
+                instance: Model instance selected for serving the request.
+                request: Application request.
+
+            Returns:
+                Cache key instance.
+            """
+            return cls(
+                application,
+                instance,
+                hashlib.blake2b(request.payload, digest_size=16).digest(),
+                request.encoding.header,
+                tuple(sorted((k, str(v)) for k, v in request.params.items())),
+                tuple(e.header for e in request.accept),
+            )
+
+    class Entry(typing.NamedTuple):
+        """Cache entry case class."""
+
+        expires: float
+        response: 'layout.Response'
+
+    def __init__(self, size: int, ttl: typing.Optional[float] = None):
+        if size < 1:
+            raise forml.InvalidError(f'Invalid cache size: {size}')
+        self._size: int = size
+        self._ttl: typing.Optional[float] = ttl
+        self._entries: dict[Cache.Key, Cache.Entry] = {}  # in the LRU order
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: 'Cache.Key') -> typing.Optional['layout.Response']:
+        """Get the cached response for the given key.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached response or None if not cached (or expired).
+        """
+        entry = self._entries.pop(key, None)
+        if not entry:
+            return None
+        if entry.expires < time.monotonic():
+            return None
+        self._entries[key] = entry
+        return entry.response
+
+    def put(self, key: 'Cache.Key', response: 'layout.Response') -> None:
+        """Store the given response in the cache.
+
+        Args:
+            key: Cache key.
+            response: Response to be cached.
+        """
+        expires = time.monotonic() + self._ttl if self._ttl is not None else float('inf')
+        self._entries.pop(key, None)
+        self._entries[key] = self.Entry(expires, response)
+        while len(self._entries) > self._size:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, lineage: 'asset.Project.Key') -> None:
+        """Drop all the entries served by instances of the given project lineage.
+
+        Args:
+            lineage: Project key whose entries are to be dropped.
+        """
+        stale = [k for k in self._entries if k.instance.generation.project.key == lineage]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            LOGGER.debug('Invalidated %d cached responses of %s', len(stale), lineage)
+
+    def clear(self) -> None:
+        """Drop all the entries."""
+        self._entries.clear()
@@ -18,7 +18,10 @@
 Runtime service facility.
 """
 import asyncio
+import functools
 import logging
+import threading
+import time
 import typing
 import uuid
 from concurrent import futures
@@ -27,6 +30,7 @@ import forml
 from forml import io
 from forml.io import asset
 
+from .. import _perf
 from . import prediction
 
 if typing.TYPE_CHECKING:
@@ -39,39 +43,211 @@ LOGGER = logging.getLogger(__name__)
 
 
 class Dealer:
-    """Pool of prediction executors."""
+    """Pool of prediction executors.
+
+    The executors are kept in a cache bounded by the optional eviction policy (any combination of the maximum
+    number of executors, their idle timeout and their total memory footprint) with the least recently used
+    executors getting evicted first. Executors with outstanding tasks or still warming up as well as the
+    current executors of each of the project lineages are never evicted.
+
+    Newly requested model instances get their executors warmed up in the background while the requests keep
+    being routed to the (ready) current executor of the same project lineage (if any) until the new one is
+    ready to take over. Executors that fail (e.g. during their warm-up) get dropped to be respawned upon the
+    next request.
+
+    Args:
+        feeds: Feeds importer for the potential feature augmentation.
+        processes: Process pool size for each of the executors.
+        loop: Explicit event loop instance.
+        batch_size: Optional micro-batching size (only valid for row-independent pipelines).
+        batch_delay: Optional micro-batching window in seconds.
+        capacity: Optional maximum number of the cached executors.
+        idle: Optional number of seconds after which an unused executor gets evicted.
+        memory: Optional maximum total memory footprint (in bytes) of all the cached executors.
+        share: Load the model states in the copy-on-write friendly mode shared by the forked workers.
+        memo: Optional row-level memoization size (only valid for row-independent pipelines).
+        backend: Execution backend of the pyfunc runner serving the executors.
+        workers: Thread pool size of the ``parallel`` execution backend.
+    """
 
     def __init__(
         self,
         feeds: io.Importer,
         processes: typing.Optional[int] = None,
         loop: typing.Optional[asyncio.AbstractEventLoop] = None,
+        batch_size: typing.Optional[int] = None,
+        batch_delay: typing.Optional[float] = None,
+        capacity: typing.Optional[int] = None,
+        idle: typing.Optional[float] = None,
+        memory: typing.Optional[int] = None,
+        share: bool = False,
+        memo: typing.Optional[int] = None,
+        backend: str = 'expression',
+        workers: typing.Optional[int] = None,
     ):
+        if capacity is not None and capacity < 1:
+            raise forml.InvalidError(f'Invalid capacity: {capacity}')
         self._feeds: io.Importer = feeds
         self._processes: typing.Optional[int] = processes
         self._loop: typing.Optional[asyncio.AbstractEventLoop] = loop
-        self._cache: dict[asset.Instance, prediction.Executor] = {}
+        self._batch_size: typing.Optional[int] = batch_size
+        self._batch_delay: typing.Optional[float] = batch_delay
+        self._capacity: typing.Optional[int] = capacity
+        self._idle: typing.Optional[float] = idle
+        self._memory: typing.Optional[int] = memory
+        self._share: bool = share
+        self._memo: typing.Optional[int] = memo
+        self._backend: str = backend
+        self._workers: typing.Optional[int] = workers
+        self._cache: dict[asset.Instance, prediction.Executor] = {}  # in the LRU order
+        self._used: dict[asset.Instance, float] = {}
+        self._current: dict[asset.Project.Key, asset.Instance] = {}
+        self._subscribers: list[typing.Callable[[asset.Project.Key], None]] = []
+
+    def __call__(
+        self,
+        instance: asset.Instance,
+        entry: 'layout.Entry',
+        encode: typing.Optional[typing.Callable[['layout.Outcome'], typing.Any]] = None,
+    ) -> asyncio.Future[typing.Any]:
+        """Apply the given instance to the provided entry.
+
+        Args:
+            instance: Model instance to be used.
+            entry: Input data.
+            encode: Optional (picklable) function to be applied to the outcome still within the worker process.
+
+        Returns:
+            Future outcome (or its encoded form if the encode function was provided).
+        """
+        executor = self._route(instance)
+        self._evict()
+        outcome = executor.apply(entry, encode)
+        return asyncio.wrap_future(outcome, loop=self._loop)
 
-    def __call__(self, instance: asset.Instance, entry: 'layout.Entry') -> asyncio.Future['layout.Outcome']:
+    def subscribe(self, notifier: typing.Callable[[asset.Project.Key], None]) -> None:
+        """Register a callback to be notified whenever a project lineage switches to a new instance.
+
+        Args:
+            notifier: Callback receiving the project key of the switched lineage.
+        """
+        self._subscribers.append(notifier)
+
+    def _route(self, instance: asset.Instance) -> prediction.Executor:
+        """Get the executor to serve the given instance potentially warming it up while routing to the current
+        executor of the same lineage.
+
+        Args:
+            instance: Model instance to be served.
+
+        Returns:
+            Executor to be used.
+        """
+        lineage = instance.generation.project.key
+        current = self._current.get(lineage)
+        if instance in self._cache and self._cache[instance].failed:  # dropping to get respawned
+            LOGGER.warning('Prediction executor for %s failed', instance)
+            self._drop(instance)
+            if current == instance:
+                del self._current[lineage]
+                current = None
+        predecessor = self._cache.get(current) if current is not None and current != instance else None
+        if predecessor and not predecessor.ready:
+            predecessor = None
         if instance not in self._cache:
-            LOGGER.info('Spawning new prediction executor')
+            LOGGER.info('Spawning new prediction executor for %s', instance)
             executor = prediction.Executor(
-                instance, self._feeds.match(instance.project.source.extract.apply), self._processes
+                instance,
+                self._feeds.match(instance.project.source.extract.apply),
+                self._processes,
+                batch_size=self._batch_size,
+                batch_delay=self._batch_delay,
+                share=self._share,
+                memo=self._memo,
+                backend=self._backend,
+                workers=self._workers,
             )
-            executor.start()
+            if predecessor:  # warming up in background while still serving using the predecessor
+                threading.Thread(target=executor.start, daemon=True, name=f'{executor.name}:warmup').start()
+            else:
+                executor.start()
             self._cache[instance] = executor
-        outcome = self._cache[instance].apply(entry)
-        return asyncio.wrap_future(outcome, loop=self._loop)
+            self._used[instance] = time.monotonic()
+        executor = self._cache[instance]
+        if predecessor and not executor.ready:
+            instance = current
+            executor = predecessor
+        elif current != instance:
+            LOGGER.info('Switching %s to %s', lineage, instance)
+            self._current[lineage] = instance
+            for notifier in self._subscribers:
+                notifier(lineage)
+        self._cache[instance] = self._cache.pop(instance)  # moving to the end
+        self._used[instance] = time.monotonic()
+        return executor
+
+    def _drop(self, instance: asset.Instance) -> None:
+        """Remove the executor from the cache and stop it in the background.
+
+        Args:
+            instance: Model instance of the executor to be dropped.
+        """
+        executor = self._cache.pop(instance)
+        del self._used[instance]
+        threading.Thread(target=executor.stop, daemon=True, name=f'{executor.name}:eviction').start()
+
+    def _evict(self) -> None:
+        """Evict the least recently used (idle) executors exceeding the configured limits."""
+
+        def evict(instance: asset.Instance) -> None:
+            """Remove the executor from the cache and stop it in the background."""
+            LOGGER.info('Evicting prediction executor for %s', instance)
+            self._drop(instance)
+
+        current = set(self._current.values())
+        candidates = [
+            i for i, e in self._cache.items() if i not in current and e.ready and not e.pending
+        ]  # in the LRU order
+        if self._idle is not None:
+            expired = time.monotonic() - self._idle
+            for instance in [i for i in candidates if self._used[i] < expired]:
+                evict(instance)
+                candidates.remove(instance)
+        if self._capacity is not None:
+            while len(self._cache) > self._capacity and candidates:
+                evict(candidates.pop(0))
+        if self._memory is not None:
+            while sum(e.footprint for e in self._cache.values()) > self._memory and candidates:
+                evict(candidates.pop(0))
 
     def shutdown(self) -> None:
         """Stop and drop all the cached executors."""
         for executor in self._cache.values():
             executor.stop()
         self._cache.clear()
+        self._used.clear()
+        self._current.clear()
 
 
 class Wrapper:
-    """(Un)Wrapper of engine requests and their responses."""
+    """(Un)Wrapper of engine requests and their responses.
+
+    The request decoding (including the model selection) and the response encoding get executed using one
+    of the following codec strategies:
+
+    * ``inline`` - directly within the event loop thread (no serialization overhead but blocking the loop)
+    * ``thread`` - using a thread pool (no serialization overhead but subject to the GIL contention)
+    * ``process`` - using a process pool (fully parallel but pickling the descriptor, the registry and the
+      payload to and from the child process)
+
+    Args:
+        inventory: Inventory of the application descriptors.
+        registry: Model registry to select the instances from.
+        max_workers: Pool size for the codec executors.
+        loop: Explicit event loop instance.
+        collector: Metrics collector.
+        codec: Codec execution strategy (one of ``inline``, ``thread`` or ``process``).
+    """
 
     class Frozen(asset.Registry):
         """Registry proxy blocking all write attempts."""
@@ -137,11 +313,23 @@ class Wrapper:
     class Query(typing.NamedTuple):
         """Case class for holding query attributes."""
 
+        application: str
         descriptor: 'appmod.Descriptor'
         instance: asset.Instance
         accept: tuple['layout.Encoding']
         decoded: 'layout.Request.Decoded'
 
+    class Inline(futures.Executor):
+        """Pseudo executor running the submitted calls synchronously within the caller thread."""
+
+        def submit(self, fn, /, *args, **kwargs) -> futures.Future:  # pylint: disable=arguments-differ
+            result = futures.Future()
+            try:
+                result.set_result(fn(*args, **kwargs))
+            except BaseException as err:  # pylint: disable=broad-except
+                result.set_exception(err)
+            return result
+
     class Executor:
         """Helper for pool executor with lazy loop access."""
 
@@ -158,18 +346,30 @@ class Wrapper:
             """Shut the executor down."""
             self._pool.shutdown()
 
+    CODECS: typing.Mapping[str, typing.Callable[[typing.Optional[int]], futures.Executor]] = {
+        'inline': lambda _: Wrapper.Inline(),
+        'thread': futures.ThreadPoolExecutor,
+        'process': futures.ProcessPoolExecutor,
+    }
+    """Available codec execution strategies."""
+
     def __init__(
         self,
         inventory: asset.Inventory,
         registry: asset.Registry,
         max_workers: typing.Optional[int] = None,
         loop: typing.Optional[asyncio.AbstractEventLoop] = None,
+        collector: typing.Optional[_perf.Collector] = None,
+        codec: str = 'process',
     ):
+        if codec not in self.CODECS:
+            raise forml.InvalidError(f'Unknown codec strategy: {codec}')
         self._inventory: asset.Inventory = inventory
         self._registry: asset.Directory = asset.Directory(self.Frozen(registry))
-        self._processes: Wrapper.Executor = self.Executor(futures.ProcessPoolExecutor(max_workers), loop)
+        self._codec: Wrapper.Executor = self.Executor(self.CODECS[codec](max_workers), loop)
         self._threads: Wrapper.Executor = self.Executor(futures.ThreadPoolExecutor(max_workers), loop)
         self._descriptors: dict[str, typing.Optional['appmod.Descriptor']] = {}
+        self._collector: _perf.Collector = collector or _perf.Collector()
 
     def _get_descriptor(self, application: str) -> 'appmod.Descriptor':
         """Get the application descriptor.
@@ -195,7 +395,7 @@ class Wrapper:
         registry: 'asset.Directory',
         request: 'layout.Request',
         stats: 'runtime.Stats',
-    ) -> tuple['asset.Instance', 'layout.Request.Decoded']:
+    ) -> tuple['asset.Instance', 'layout.Request.Decoded', float, float]:
         """Helper for request decoding and model selection.
 
         Args:
@@ -205,10 +405,36 @@ class Wrapper:
             stats: Actual system stats provided for the dispatcher to potentially use for model selection.
 
         Returns:
-            Asset instance object and decoded version of the serving request.
+            Asset instance object, decoded version of the serving request and the decoding and selection
+            latencies.
         """
+        start = time.perf_counter()
         decoded = descriptor.receive(request)
-        return descriptor.select(registry, decoded.context, stats), decoded
+        decode = time.perf_counter()
+        instance = descriptor.select(registry, decoded.context, stats)
+        return instance, decoded, decode - start, time.perf_counter() - decode
+
+    @staticmethod
+    def _encode(
+        descriptor: 'appmod.Descriptor',
+        outcome: 'layout.Outcome',
+        encoding: typing.Sequence['layout.Encoding'],
+        context: typing.Any,
+    ) -> tuple['layout.Response', float]:
+        """Helper for the response encoding.
+
+        Args:
+            descriptor: Application descriptor to be used for encoding.
+            outcome: Prediction outcome.
+            encoding: Accepted encodings.
+            context: Decoding context.
+
+        Returns:
+            Native encoded response and the encoding latency.
+        """
+        start = time.perf_counter()
+        response = descriptor.respond(outcome, encoding, context)
+        return response, time.perf_counter() - start
 
     async def extract(self, application: str, request: 'layout.Request', stats: 'runtime.Stats') -> 'Wrapper.Query':
         """Extract the query parameters from the given request object belonging to the particular application.
@@ -222,8 +448,12 @@ class Wrapper:
             Extracted query parameters.
         """
         descriptor = await self._threads(self._get_descriptor, application)
-        instance, decoded = await self._processes(self._dispatch, descriptor, self._registry, request, stats)
-        return self.Query(descriptor, instance, request.accept, decoded)
+        instance, decoded, decode, select = await self._codec(
+            self._dispatch, descriptor, self._registry, request, stats
+        )
+        self._collector.observe('decode', decode, application)
+        self._collector.observe('select', select, application, instance)
+        return self.Query(application, descriptor, instance, request.accept, decoded)
 
     async def respond(self, query: 'Wrapper.Query', outcome: 'layout.Outcome') -> 'layout.Response':
         """Encode the given outcome into a native response.
@@ -235,14 +465,32 @@ class Wrapper:
         Returns:
             Native encoded response.
         """
-        return await self._processes(
-            query.descriptor.respond,
-            outcome,
-            query.accept,
-            query.decoded.context,
-        )
+        response, encode = await self._codec(self.encoder(query), outcome)
+        self.observe(query, encode)
+        return response
+
+    def encoder(self, query: 'Wrapper.Query') -> typing.Callable[['layout.Outcome'], tuple['layout.Response', float]]:
+        """Get the (picklable) encoding function for the given query.
+
+        Args:
+            query: Query parameters as returned from extract.
+
+        Returns:
+            Function encoding the query outcome into a native response returned together with the encoding
+            latency.
+        """
+        return functools.partial(self._encode, query.descriptor, encoding=query.accept, context=query.decoded.context)
+
+    def observe(self, query: 'Wrapper.Query', encode: float) -> None:
+        """Record the encoding latency of a response produced externally using the query :meth:`encoder`.
+
+        Args:
+            query: Query parameters as returned from extract.
+            encode: Encoding latency.
+        """
+        self._collector.observe('encode', encode, query.application, query.instance)
 
     def shutdown(self) -> None:
         """Terminate the executors."""
-        self._processes.shutdown()
+        self._codec.shutdown()
         self._threads.shutdown()
@@ -17,14 +17,21 @@
 """
 Runtime service facility worker.
 """
+import functools
+import gc
+import itertools
 import logging
 import multiprocessing
 import os
 import queue
+import resource
 import threading
+import time
 import typing
 from concurrent import futures
-from multiprocessing import context
+from multiprocessing import context, resource_tracker, shared_memory
+
+import numpy
 
 import forml
 from forml import io
@@ -32,16 +39,78 @@ from forml.io import asset, layout
 from forml.provider.runner import pyfunc
 from forml.provider.sink import null
 
+if typing.TYPE_CHECKING:
+    from forml.io import dsl
+
 LOGGER = logging.getLogger(__name__)
 
 
+class Shared(layout.Dense):
+    """Dense payload backed by a shared memory block so that only its descriptor gets pickled when passed
+    between the processes.
+
+    The block is owned by its creator (the executor) which is expected to eventually :meth:`release` it with
+    unlinking while the attached (worker) copies simply get closed once garbage collected.
+    """
+
+    THRESHOLD = 1 << 16
+    """Minimal payload size (in bytes) for offloading to the shared memory."""
+
+    def __init__(self, memory: shared_memory.SharedMemory, shape: tuple[int, ...], dtype: numpy.dtype):
+        super().__init__(numpy.ndarray(shape, dtype=dtype, buffer=memory.buf))
+        self._memory: shared_memory.SharedMemory = memory
+
+    def __reduce__(self):
+        return self._attach, (self._memory.name, self._rows.shape, self._rows.dtype.str)
+
+    @classmethod
+    def _attach(cls, name: str, shape: tuple[int, ...], dtype: str) -> 'Shared':
+        """Unpickling helper attaching to an existing shared memory block.
+
+        Args:
+            name: Shared memory block name.
+            shape: Array shape.
+            dtype: Array data type.
+
+        Returns:
+            Shared payload instance.
+        """
+        memory = shared_memory.SharedMemory(name)
+        # the block is owned (and eventually unlinked) by its creator
+        resource_tracker.unregister(memory._name, 'shared_memory')  # pylint: disable=protected-access
+        return cls(memory, shape, numpy.dtype(dtype))
+
+    @classmethod
+    def offload(cls, data: layout.Tabular) -> layout.Tabular:
+        """Copy the given payload to a new shared memory block if it is numeric and large enough.
+
+        Args:
+            data: Payload to be offloaded.
+
+        Returns:
+            Shared payload instance or the original payload if not eligible.
+        """
+        rows = data.to_rows()
+        if not isinstance(rows, numpy.ndarray) or rows.dtype.kind not in 'biufc' or rows.nbytes < cls.THRESHOLD:
+            return data
+        shared = cls(shared_memory.SharedMemory(create=True, size=rows.nbytes), rows.shape, rows.dtype)
+        shared._rows[...] = rows
+        return shared
+
+    def release(self) -> None:
+        """Close and unlink the underlying shared memory block."""
+        self._rows = None
+        self._memory.close()
+        self._memory.unlink()
+
+
 class Result(typing.NamedTuple):
     """Result tuple."""
 
     id: int  # pylint: disable=invalid-name
     """Task id."""
-    outcome: typing.Optional[layout.Outcome]
-    """Task outcome if successful."""
+    outcome: typing.Optional[typing.Any]
+    """Task outcome (potentially encoded) if successful."""
     exception: typing.Optional[BaseException]
     """Task exception if failed."""
 
@@ -53,8 +122,32 @@ class Task(typing.NamedTuple):
     """Task id."""
     entry: layout.Entry
     """Task input."""
+    encode: typing.Optional[typing.Callable[[layout.Outcome], typing.Any]] = None
+    """Optional function to be applied to the outcome before returning it."""
+
+    def __call__(self, runner: pyfunc.Runner) -> 'Result':
+        """Execute the task using the given runner.
+
+        Args:
+            runner: Runner to be used for the execution.
+
+        Returns:
+            Successful result instance.
 
-    def success(self, outcome: layout.Outcome) -> 'Result':
+        Raises:
+            forml.AnyError: If the encoding fails (so that it is reported just as a task failure).
+        """
+        outcome = runner.call(self.entry)
+        if self.encode:
+            try:
+                outcome = self.encode(outcome)
+            except forml.AnyError:
+                raise
+            except Exception as err:
+                raise forml.FailedError(f'Encoding failed: {err!r}') from err
+        return self.success(outcome)
+
+    def success(self, outcome: typing.Any) -> 'Result':
         """Create a descriptor representing successful task result.
 
         Args:
@@ -82,6 +175,11 @@ class Pool(context.SpawnProcess):
 
     Upon starting, this spawns a subprocess with the Pyfunc runner instance, which loads all states so that all the
     forked workers share just one (read-only) copy of the memory.
+
+    In the *share* mode, the states get loaded in a copy-on-write friendly way - with the garbage collector frozen
+    before forking (so that it doesn't touch the inherited objects) and with the large arrays relocated into the
+    :class:`shared memory <forml.provider.runner.pyfunc.Sharing>` (so that the reference counting doesn't trigger
+    copying of their buffers).
     """
 
     class Worker(context.ForkProcess):
@@ -105,19 +203,21 @@ class Pool(context.SpawnProcess):
         def run(self) -> None:
             """Worker loop."""
             LOGGER.debug('Worker loop %s starting', self.name)
+            gc.enable()  # potentially disabled by the parent
             while not self._stopped.is_set():
                 try:
                     task: Task = self._tasks.get(timeout=1)
                 except queue.Empty:
                     continue
                 try:
-                    self._results.put_nowait(task.success(self._runner.call(task.entry)))
+                    self._results.put_nowait(task(self._runner))
                 except forml.AnyError as err:
                     self._results.put_nowait(task.failure(err))
                 except Exception as err:
                     self._results.put_nowait(task.failure(err))
                     self._stopped.set()
                     raise err
+            self._runner.shutdown()
             LOGGER.debug('Worker loop %s quiting', self.name)
 
     def __init__(
@@ -129,6 +229,10 @@ class Pool(context.SpawnProcess):
         stopped: multiprocessing.Event,
         processes: typing.Optional[int] = None,
         name: typing.Optional[str] = None,
+        share: bool = False,
+        memo: typing.Optional[int] = None,
+        backend: str = 'expression',
+        workers: typing.Optional[int] = None,
     ):
         super().__init__(name=(name or 'pool'))
         self._instance: asset.Instance = instance
@@ -137,11 +241,50 @@ class Pool(context.SpawnProcess):
         self._results: multiprocessing.Queue = results
         self._stopped: multiprocessing.Event = stopped
         self._processes: int = processes or os.cpu_count()
+        self._share: bool = share
+        self._memo: typing.Optional[int] = memo
+        self._backend: str = backend
+        self._workers: typing.Optional[int] = workers
+        ctx = multiprocessing.get_context('spawn')
+        self._ready: multiprocessing.Event = ctx.Event()
+        self._footprint: multiprocessing.Value = ctx.Value('q', 0, lock=False)
+
+    @property
+    def ready(self) -> bool:
+        """Check whether the pool has already loaded the model (and is about to start its workers).
+
+        Returns:
+            True if ready.
+        """
+        return self._ready.is_set()
+
+    @property
+    def footprint(self) -> int:
+        """Memory footprint of the pool (peak resident set size of the loaded model process).
+
+        Returns:
+            Footprint in bytes (zero if not ready yet).
+        """
+        return self._footprint.value
 
     def run(self) -> None:
         """Pool loop."""
         LOGGER.debug('Worker pool %s starting', self.name)
-        runner: pyfunc.Runner = pyfunc.Runner(self._instance, self._feed, null.Sink())
+        if self._share:
+            gc.disable()
+        runner: pyfunc.Runner = pyfunc.Runner(
+            self._instance,
+            self._feed,
+            null.Sink(),
+            share=self._share,
+            memo=self._memo,
+            backend=self._backend,
+            workers=self._workers,
+        )
+        self._footprint.value = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        if self._share:
+            gc.freeze()
+        self._ready.set()  # the model is loaded - any tasks submitted meanwhile just wait for the workers to fork
         pool: list[context.ForkProcess] = [
             self.Worker(runner, self._tasks, self._results, self._stopped, name=f'{self.name}:{i}')
             for i in range(self._processes)
@@ -161,8 +304,171 @@ class Pool(context.SpawnProcess):
         self.join()
 
 
+class Batcher(threading.Thread):
+    """Micro-batching frontend coalescing individual entries into vectorized tasks.
+
+    Entries arriving within the *delay* window (or until the *size* limit is reached) get
+    concatenated (grouped by their schema) into a single entry submitted as one task with its
+    outcome rows eventually scattered back to the individual futures.
+
+    Attention:
+        This is only valid for pipelines producing each of the outcome rows purely based on the
+        corresponding input row (row-independent pipelines).
+
+    Args:
+        submit: Callback for submitting the (batched) entry returning its future outcome.
+        size: Maximum number of rows to be coalesced within a single batch.
+        delay: Maximum number of seconds to hold the first pending entry while waiting for more.
+        name: Optional thread name.
+    """
+
+    DELAY = 0.002
+    """Default batching window in seconds."""
+
+    def __init__(
+        self,
+        submit: typing.Callable[[layout.Entry], futures.Future[layout.Outcome]],
+        size: int,
+        delay: typing.Optional[float] = None,
+        name: typing.Optional[str] = None,
+    ):
+        super().__init__(daemon=True, name=(name or 'batcher'))
+        self._submit: typing.Callable[[layout.Entry], futures.Future[layout.Outcome]] = submit
+        self._size: int = size
+        self._delay: float = self.DELAY if delay is None else delay
+        self._pending: list[tuple[layout.Entry, futures.Future[layout.Outcome]]] = []
+        self._rows: int = 0
+        self._ready: threading.Condition = threading.Condition()
+        self._stopped: bool = False
+
+    def __call__(self, entry: layout.Entry) -> futures.Future[layout.Outcome]:
+        """Enqueue the given entry for the next batch.
+
+        Args:
+            entry: Input data.
+
+        Returns:
+            Future result instance.
+        """
+        outcome = futures.Future()
+        with self._ready:
+            self._pending.append((entry, outcome))
+            self._rows += len(entry.data.to_rows())
+            self._ready.notify()
+        return outcome
+
+    def run(self) -> None:
+        """Batcher loop."""
+        LOGGER.debug('Batcher loop %s starting', self.name)
+        while True:
+            with self._ready:
+                while not self._pending and not self._stopped:
+                    self._ready.wait()
+                if not self._pending:
+                    break
+                deadline = time.monotonic() + self._delay
+                while self._rows < self._size and not self._stopped:
+                    if (remaining := deadline - time.monotonic()) <= 0:
+                        break
+                    self._ready.wait(remaining)
+                batch, self._pending, self._rows = self._pending, [], 0
+            self._dispatch(batch)
+        LOGGER.debug('Batcher loop %s quiting', self.name)
+
+    def _dispatch(self, batch: typing.Sequence[tuple[layout.Entry, futures.Future[layout.Outcome]]]) -> None:
+        """Submit the given batch of entries grouped by their schemas.
+
+        Args:
+            batch: Sequence of entries and their future outcomes.
+        """
+        groups: dict['dsl.Source.Schema', list[tuple[layout.Entry, futures.Future[layout.Outcome]]]] = {}
+        for entry, outcome in batch:
+            groups.setdefault(entry.schema, []).append((entry, outcome))
+        for schema, group in groups.items():
+            if len(group) == 1:
+                entry, outcome = group[0]
+                self._chain(self._submit(entry), outcome)
+                continue
+            rows = [numpy.asarray(e.data.to_rows()) for e, _ in group]
+            merged = layout.Entry(schema, layout.Dense.from_rows(numpy.concatenate(rows)))
+            self._submit(merged).add_done_callback(
+                functools.partial(self._scatter, targets=[o for _, o in group], sizes=[len(r) for r in rows])
+            )
+
+    @staticmethod
+    def _chain(source: futures.Future[layout.Outcome], target: futures.Future[layout.Outcome]) -> None:
+        """Propagate the result of the source future to the target one.
+
+        Args:
+            source: Future to be waited for.
+            target: Future to receive the result.
+        """
+
+        def propagate(future: futures.Future[layout.Outcome]) -> None:
+            if future.exception():
+                target.set_exception(future.exception())
+            else:
+                target.set_result(future.result())
+
+        source.add_done_callback(propagate)
+
+    @staticmethod
+    def _scatter(
+        source: futures.Future[layout.Outcome],
+        targets: typing.Sequence[futures.Future[layout.Outcome]],
+        sizes: typing.Sequence[int],
+    ) -> None:
+        """Split the batched outcome back to the individual futures.
+
+        Args:
+            source: Completed future of the batched outcome.
+            targets: Individual futures to receive their parts of the outcome.
+            sizes: Number of rows belonging to each of the targets.
+        """
+        if source.exception():
+            for target in targets:
+                target.set_exception(source.exception())
+            return
+        outcome: layout.Outcome = source.result()
+        if len(outcome.data) != sum(sizes):
+            error = forml.UnexpectedError('Batched outcome not matching the input size (not row-independent?)')
+            for target in targets:
+                target.set_exception(error)
+            return
+        start = 0
+        for target, size in zip(targets, sizes):
+            stop = start + size
+            target.set_result(layout.Outcome(outcome.schema, outcome.data[start:stop]))
+            start = stop
+
+    def stop(self) -> None:
+        """Flush all the pending entries and stop the batcher."""
+        with self._ready:
+            self._stopped = True
+            self._ready.notify()
+        self.join()
+
+
 class Executor(threading.Thread):
-    """Asynchronous worker frontend dispatching the worker pool."""
+    """Asynchronous worker frontend dispatching the worker pool.
+
+    The tasks are passed to the pool using plain (pipe-based) multiprocessing queues with any large numeric
+    payloads offloaded to the :class:`shared memory <Shared>` so that only their descriptors get pickled.
+
+    Args:
+        instance: Model instance to be served.
+        feed: Feed for potential feature augmentation.
+        processes: Process pool size.
+        name: Optional thread name.
+        batch_size: Enable :class:`micro-batching <Batcher>` of up to the given number of rows (only valid
+                    for row-independent pipelines).
+        batch_delay: Maximum number of seconds to wait for filling a micro-batch.
+        share: Load the model states in the copy-on-write friendly :class:`share mode <Pool>`.
+        memo: Enable the row-level memoization of up to the given number of rows (only valid for
+              row-independent pipelines).
+        backend: Execution backend of the pyfunc runner.
+        workers: Thread pool size of the ``parallel`` execution backend.
+    """
 
     def __init__(
         self,
@@ -170,15 +476,40 @@ class Executor(threading.Thread):
         feed: io.Feed,
         processes: typing.Optional[int] = None,
         name: typing.Optional[str] = None,
+        batch_size: typing.Optional[int] = None,
+        batch_delay: typing.Optional[float] = None,
+        share: bool = False,
+        memo: typing.Optional[int] = None,
+        backend: str = 'expression',
+        workers: typing.Optional[int] = None,
     ):
         super().__init__(daemon=True, name=(name or 'executor'))
-        self._manager: multiprocessing.Manager = multiprocessing.Manager()
-        self._stopped: multiprocessing.Event = self._manager.Event()
-        self._tasks: multiprocessing.Queue = self._manager.Queue()
-        self._results: multiprocessing.Queue = self._manager.Queue()
-        self._pool: Pool = Pool(instance, feed, self._tasks, self._results, self._stopped, processes)
+        ctx = multiprocessing.get_context('spawn')
+        self._stopped: multiprocessing.Event = ctx.Event()
+        self._tasks: multiprocessing.Queue = ctx.Queue()
+        self._results: multiprocessing.Queue = ctx.Queue()
+        self._pool: Pool = Pool(
+            instance,
+            feed,
+            self._tasks,
+            self._results,
+            self._stopped,
+            processes,
+            share=share,
+            memo=memo,
+            backend=backend,
+            workers=workers,
+        )
         self._pending: dict[int, futures.Future[layout.Outcome]] = {}
-        self._index: int = 0
+        self._shared: dict[int, Shared] = {}
+        self._halted: bool = False
+        self._index: typing.Iterator[int] = itertools.count()
+        self._lock: threading.Lock = threading.Lock()
+        self._batcher: typing.Optional[Batcher] = (
+            Batcher(self._submit, batch_size, batch_delay, name=f'{self.name}:batcher')
+            if batch_size and batch_size > 1
+            else None
+        )
 
     def run(self) -> None:
         """Executor loop."""
@@ -190,41 +521,125 @@ class Executor(threading.Thread):
                 result = self._results.get(timeout=1)
             except queue.Empty:
                 continue
+            with self._lock:
+                outcome = self._pending.pop(result.id)
+                shared = self._shared.pop(result.id, None)
+            if shared is not None:
+                shared.release()
             if result.exception:
-                self._pending[result.id].set_exception(result.exception)
+                outcome.set_exception(result.exception)
             else:
-                self._pending[result.id].set_result(result.outcome)
-            del self._pending[result.id]
+                outcome.set_result(result.outcome)
         else:
             self._stopped.set()
         LOGGER.debug('Executor loop %s quiting', self.name)
 
-    def apply(self, entry: layout.Entry) -> futures.Future[layout.Outcome]:
+    @property
+    def ready(self) -> bool:
+        """Check whether the executor is running with its pool ready to process tasks without a cold start delay.
+
+        Returns:
+            True if ready.
+        """
+        return self.is_alive() and self._pool.ready
+
+    @property
+    def failed(self) -> bool:
+        """Check whether the executor has terminated (or failed to start) without being explicitly stopped.
+
+        Returns:
+            True if failed.
+        """
+        return self._stopped.is_set() and not self._halted
+
+    @property
+    def footprint(self) -> int:
+        """Memory footprint of the executor pool.
+
+        Returns:
+            Footprint in bytes.
+        """
+        return self._pool.footprint
+
+    @property
+    def pending(self) -> int:
+        """Number of tasks submitted but not completed yet.
+
+        Returns:
+            Pending tasks count.
+        """
+        return len(self._pending)
+
+    def apply(
+        self, entry: layout.Entry, encode: typing.Optional[typing.Callable[[layout.Outcome], typing.Any]] = None
+    ) -> futures.Future[typing.Any]:
         """Submit the given entry data to the processing pool and return a future result instance.
 
         Args:
             entry: Input data.
+            encode: Optional (picklable) function to be applied to the outcome within the worker process (bypassing
+                    the micro-batching).
 
         Returns:
             Future result instance.
         """
         if not self.is_alive():
             raise RuntimeError('Executor not running')
+        if self._batcher and not encode:
+            return self._batcher(entry)
+        return self._submit(entry, encode)
+
+    def _submit(
+        self, entry: layout.Entry, encode: typing.Optional[typing.Callable[[layout.Outcome], typing.Any]] = None
+    ) -> futures.Future[typing.Any]:
+        """Submit the given entry data as a new task.
+
+        This gets called concurrently from both the batcher thread and the caller threads (bypassing
+        the batcher), so the task id gets allocated and registered under the lock.
+
+        Args:
+            entry: Input data.
+            encode: Optional function to be applied to the outcome within the worker process.
+
+        Returns:
+            Future result instance.
+        """
         outcome = futures.Future()
-        self._pending[self._index] = outcome
-        self._tasks.put(Task(self._index, entry))
-        self._index += 1
+        data = Shared.offload(entry.data)
+        with self._lock:
+            index = next(self._index)
+            self._pending[index] = outcome
+            if isinstance(data, Shared):
+                self._shared[index] = data
+        if isinstance(data, Shared):
+            entry = layout.Entry(entry.schema, data)
+        self._tasks.put(Task(index, entry, encode))
         return outcome
 
     def start(self) -> None:
         """Start the executor."""
         self._stopped.clear()
-        self._pool.start()
-        super().start()
+        try:
+            self._pool.start()
+            super().start()
+            if self._batcher:
+                self._batcher.start()
+        except Exception:
+            self._stopped.set()
+            raise
 
     def stop(self) -> None:
         """Stop the executor."""
+        self._halted = True
+        if self._batcher and self._batcher.is_alive():
+            self._batcher.stop()
         self._stopped.set()
-        self._pool.join()
-        self.join()
-        self._manager.shutdown()
+        if self._pool.pid is not None:
+            self._pool.join()
+        if self.ident is not None:
+            self.join()
+        for shared in self._shared.values():
+            shared.release()
+        self._shared.clear()
+        self._tasks.close()
+        self._results.close()
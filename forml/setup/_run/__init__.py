@@ -29,7 +29,7 @@ from click import core
 import forml
 
 from .. import _conf
-from . import application, model, project
+from . import application, benchmark, model, project
 
 
 class Scope(typing.NamedTuple):
@@ -87,6 +87,8 @@ def group(
 group.add_command(model.group)
 group.add_command(project.group)
 group.add_command(application.group)
+group.add_command(benchmark.bench)
+group.add_command(benchmark.loadtest)
 
 
 def cli() -> None:
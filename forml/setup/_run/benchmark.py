@@ -0,0 +1,108 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+ForML command line interface.
+"""
+import typing
+
+import click
+
+from forml import runtime, setup
+
+if typing.TYPE_CHECKING:
+    from .. import _run
+
+
+@click.command(name='bench')
+@click.option('-R', '--runner', multiple=True, type=str, help='Runtime runner references (all defaults if omitted).')
+@click.option('--depth', type=click.IntRange(min=1), default=runtime.Benchmark.Spec.depth, help='Pipeline depth.')
+@click.option('--width', type=click.IntRange(min=1), default=runtime.Benchmark.Spec.width, help='Pipeline width.')
+@click.option('--rows', type=click.IntRange(min=1), default=runtime.Benchmark.Spec.rows, help='Dataset rows.')
+@click.option('--columns', type=click.IntRange(min=1), default=runtime.Benchmark.Spec.columns, help='Dataset columns.')
+@click.option('--repeat', type=click.IntRange(min=1), default=5, help='Number of timed iterations per case.')
+@click.option('--warmup', type=click.IntRange(min=0), default=1, help='Number of untimed iterations per case.')
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), help='File to store the results into.')
+@click.option('--baseline', type=click.Path(exists=True, dir_okay=False), help='Results to compare against.')
+@click.option('--tolerance', type=click.FloatRange(min=0), default=0.1, help='Acceptable relative slowdown.')
+@click.pass_obj
+def bench(
+    scope: '_run.Scope',  # pylint: disable=unused-argument
+    runner: typing.Sequence[str],
+    depth: int,
+    width: int,
+    rows: int,
+    columns: int,
+    repeat: int,
+    warmup: int,
+    output: typing.Optional[str],
+    baseline: typing.Optional[str],
+    tolerance: float,
+) -> None:
+    """Benchmark the runners using a synthetic workload."""
+    runners = [(r.reference, r.params) for r in (setup.Runner.resolve(r) for r in runner)] or runtime.Benchmark.RUNNERS
+    spec = runtime.Benchmark.Spec(depth, width, rows, columns)
+    report = runtime.Benchmark(spec, runners, repeat, warmup)()
+    print(report)
+    if output:
+        report.dump(output)
+    if baseline:
+        regressions = report.compare(runtime.Benchmark.Report.load(baseline), tolerance)
+        if regressions:
+            raise click.ClickException('Performance regression:\n' + '\n'.join(regressions))
+
+
+@click.command(name='loadtest')
+@click.option('-T', '--target', multiple=True, type=click.Choice(runtime.LoadTest.TARGETS), help='Load test targets.')
+@click.option('-E', '--encoding', multiple=True, type=str, help='Request payload encodings.')
+@click.option('--requests', type=click.IntRange(min=1), default=runtime.LoadTest.Spec.requests, help='Timed requests.')
+@click.option(
+    '--concurrency', type=click.IntRange(min=1), default=runtime.LoadTest.Spec.concurrency, help='In-flight requests.'
+)
+@click.option('--rate', type=click.FloatRange(min=0, min_open=True), help='Open-loop arrival rate (requests/s).')
+@click.option('--rows', type=click.IntRange(min=1), default=runtime.LoadTest.Spec.rows, help='Rows per request.')
+@click.option('--warmup', type=click.IntRange(min=0), default=10, help='Number of untimed requests per case.')
+@click.option('--processes', type=click.IntRange(min=1), help='Process pool size for each model sandbox.')
+@click.option('--codec', type=click.Choice(['inline', 'thread', 'process']), default='process', help='Codec strategy.')
+@click.option('--output', type=click.Path(dir_okay=False, writable=True), help='File to store the results into.')
+@click.pass_obj
+def loadtest(
+    scope: '_run.Scope',  # pylint: disable=unused-argument
+    target: typing.Sequence[str],
+    encoding: typing.Sequence[str],
+    requests: int,
+    concurrency: int,
+    rate: typing.Optional[float],
+    rows: int,
+    warmup: int,
+    processes: typing.Optional[int],
+    codec: str,
+    output: typing.Optional[str],
+) -> None:
+    """Load test the serving engine and gateway using a synthetic application."""
+    spec = runtime.LoadTest.Spec(requests, concurrency, rate, rows)
+    report = runtime.LoadTest(
+        spec,
+        targets=target or runtime.LoadTest.TARGETS,
+        encodings=encoding or runtime.LoadTest.ENCODINGS,
+        warmup=warmup,
+        processes=processes,
+        codec=codec,
+    )()
+    print(report)
+    if output:
+        report.dump(output)
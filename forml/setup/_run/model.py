@@ -19,6 +19,8 @@
 ForML command line interface.
 """
 import collections
+import contextlib
+import logging
 import typing
 
 import click
@@ -31,8 +33,10 @@ from forml.io import asset, dsl
 if typing.TYPE_CHECKING:
     from .. import _run
 
+LOGGER = logging.getLogger(__name__)
 
-class Scope(collections.namedtuple('Scope', 'parent, runner, registry, feeds, sink')):
+
+class Scope(collections.namedtuple('Scope', 'parent, runner, registry, feeds, sink, profile')):
     """Case class for holding the partial command config."""
 
     parent: '_run.Scope'
@@ -40,6 +44,7 @@ class Scope(collections.namedtuple('Scope', 'parent, runner, registry, feeds, si
     registry: setup.Registry
     feeds: tuple[setup.Feed]
     sink: setup.Sink
+    profile: typing.Optional[str]
 
     def __new__(
         cls,
@@ -48,6 +53,7 @@ class Scope(collections.namedtuple('Scope', 'parent, runner, registry, feeds, si
         registry: typing.Optional[str],
         feed: typing.Optional[typing.Sequence[str]],
         sink: typing.Optional[str],
+        profile: typing.Optional[str] = None,
     ):
         return super().__new__(
             cls,
@@ -56,8 +62,23 @@ class Scope(collections.namedtuple('Scope', 'parent, runner, registry, feeds, si
             setup.Registry.resolve(registry),
             tuple(setup.Feed.resolve(feed)),
             setup.Sink.Mode.resolve(sink),
+            profile,
         )
 
+    @contextlib.contextmanager
+    def profiling(self) -> typing.Iterator[None]:
+        """Context manager for profiling the enclosed runs (if requested).
+
+        Upon exit, the profile report gets logged and the trace written to the requested path.
+        """
+        if not self.profile:
+            yield
+            return
+        with runtime.Profiler() as profiler:
+            yield
+        LOGGER.info('Execution profile:\n%s', profiler.profile)
+        profiler.dump(self.profile)
+
     def launcher(
         self, project: str, release: typing.Optional[str], generation: typing.Optional[str]
     ) -> runtime.Launcher:
@@ -93,6 +114,12 @@ class Scope(collections.namedtuple('Scope', 'parent, runner, registry, feeds, si
 @click.option('-M', '--registry', type=str, help='Model registry reference.')
 @click.option('-I', '--feed', multiple=True, type=str, help='Input feed references.')
 @click.option('-O', '--sink', type=str, help='Output sink reference.')
+@click.option(
+    '-P',
+    '--profile',
+    type=click.Path(dir_okay=False, writable=True),
+    help='Profile the execution writing its Chrome trace into the given file.',
+)
 @click.pass_context
 def group(
     context: core.Context,
@@ -100,9 +127,10 @@ def group(
     registry: typing.Optional[str],
     feed: typing.Optional[typing.Sequence[str]],
     sink: typing.Optional[str],
+    profile: typing.Optional[str],
 ):
     """Model command group (production life cycle)."""
-    context.obj = Scope(context.obj, runner, registry, feed, sink)
+    context.obj = Scope(context.obj, runner, registry, feed, sink, profile)
 
 
 @group.command()
@@ -140,7 +168,8 @@ def train(
     upper: typing.Optional[dsl.Native],
 ) -> None:
     """Train new generation of the given (or default) project release."""
-    scope.launcher(project, release, generation).train_call(lower, upper)
+    with scope.profiling():
+        scope.launcher(project, release, generation).train_call(lower, upper)
 
 
 @group.command()
@@ -149,6 +178,7 @@ def train(
 @click.argument('generation', required=False)
 @click.option('--lower', help='Dataset lower ordinal.')
 @click.option('--upper', help='Dataset upper ordinal.')
+@click.option('--chunksize', type=click.IntRange(min=1), help='Process the dataset in chunks of this many rows.')
 @click.pass_obj
 def apply(
     scope: Scope,
@@ -157,9 +187,11 @@ def apply(
     generation: typing.Optional[str],
     lower: typing.Optional[dsl.Native],
     upper: typing.Optional[dsl.Native],
+    chunksize: typing.Optional[int],
 ) -> None:
     """Apply the given (or default) generation."""
-    scope.launcher(project, release, generation).apply(lower, upper)
+    with scope.profiling():
+        scope.launcher(project, release, generation).apply(lower, upper, chunksize)
 
 
 @group.command(name='eval')
@@ -178,7 +210,8 @@ def evaluate(
     upper: typing.Optional[dsl.Native],
 ) -> None:
     """Evaluate predictions of the given (or default) generation."""
-    scope.launcher(project, release, generation).eval_perftrack(lower, upper)
+    with scope.profiling():
+        scope.launcher(project, release, generation).eval_perftrack(lower, upper)
 
 
 @group.command(name='list')
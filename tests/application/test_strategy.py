@@ -18,12 +18,16 @@
 Strategy unit tests.
 """
 import abc
+import threading
 import typing
 
 import pytest
 
-from forml import application, runtime
+from forml import application
+from forml import project as prjmod
+from forml import runtime
 from forml.io import asset
+from tests import helloworld
 
 
 class Strategy(abc.ABC):
@@ -94,3 +98,25 @@ class TestLatest(Strategy):
     @pytest.fixture(scope='function')
     def instance(valid_instance: asset.Instance) -> asset.Instance:
         return valid_instance
+
+    @pytest.mark.parametrize('refresh', [None, 0])
+    def test_refresh(
+        self,
+        refresh: typing.Optional[float],
+        project_name: asset.Project.Key,
+        project_release: asset.Release.Key,
+        valid_generation: asset.Generation.Key,
+        generation_tag: asset.Tag,
+        project_package: prjmod.Package,
+        context: typing.Any,
+        stats: runtime.Stats,
+    ):
+        """Test the re-resolution of the most recent generation."""
+        content = {project_name: {project_release: (project_package, {valid_generation: (generation_tag, ())})}}
+        registry = helloworld.Registry(content, {}, threading.Lock())
+        directory = asset.Directory(registry)
+        strategy = application.Latest(project_name, project_release, refresh=refresh)
+        assert strategy.select(directory, context, stats).generation.key == valid_generation
+        registry.close(project_name, project_release, valid_generation.next, generation_tag._replace(states=()))
+        expected = valid_generation if refresh is None else valid_generation.next
+        assert strategy.select(directory, context, stats).generation.key == expected
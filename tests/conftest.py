@@ -38,6 +38,26 @@ from . import helloworld
 from .helloworld import application as helloworld_descriptor
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the option for enabling the (opt-in) benchmark tests."""
+    parser.addoption('--benchmark', action='store_true', default=False, help='run the benchmark tests')
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the custom markers."""
+    config.addinivalue_line('markers', 'benchmark: opt-in performance benchmark (enabled using --benchmark)')
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip the benchmark tests unless explicitly enabled."""
+    if config.getoption('--benchmark'):
+        return
+    skip = pytest.mark.skip(reason='benchmark not enabled (use --benchmark)')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
+
+
 class WrappedActor:
     """Actor to-be mockup."""
 
@@ -46,6 +46,13 @@ class Functor(metaclass=abc.ABCMeta):
         assert isinstance(clone, flow.Functor)
         assert functor(actor_state, *args) == output
 
+    def test_lean(self, functor: flow.Functor, actor_state: bytes, args: typing.Sequence):
+        """Test the lean functor mode."""
+        output = functor.preset_state()(actor_state, *args)
+        functor = functor.preset_state()
+        functor.lean = True
+        assert functor(actor_state, *args) == output
+
 
 class TestApply(Functor):
     """Mapper functor unit tests."""
@@ -0,0 +1,168 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+ForML compiler cache unit tests.
+"""
+import pathlib
+import time
+import typing
+
+import numpy
+import pytest
+
+import forml
+from forml import flow
+from forml.flow._code import cache as cachemod
+from forml.io._input import extract
+
+
+class Counter(flow.Actor[int, None, int]):
+    """Actor counting its invocations."""
+
+    CALLS: list[int] = []
+
+    def __init__(self, increment: int = 1):
+        self._increment: int = increment
+
+    def apply(self, features: int) -> int:
+        self.CALLS.append(features)
+        return features + self._increment
+
+    def set_params(self, increment: int = 1) -> None:
+        self._increment = increment
+
+
+class TestCache:
+    """Cache unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def cache(tmp_path: pathlib.Path) -> flow.Cache:
+        """Cache fixture."""
+        return flow.Cache(tmp_path / 'cache')
+
+    def test_invalid(self, tmp_path: pathlib.Path):
+        """Test the size validation."""
+        with pytest.raises(forml.InvalidError, match='Invalid cache size'):
+            flow.Cache(tmp_path, 0)
+
+    def test_store(self, cache: flow.Cache):
+        """Test the entry storing and retrieval."""
+        with pytest.raises(KeyError):
+            _ = cache['foo']
+        assert 'foo' not in cache
+        cache['foo'] = None
+        assert 'foo' in cache
+        assert cache['foo'] is None
+        cache['bar'] = numpy.arange(10)
+        assert len(cache) == 2
+        assert numpy.array_equal(cache['bar'], numpy.arange(10))
+        cache.clear()
+        assert not len(cache)
+
+    def test_key(self, cache: flow.Cache):
+        """Test the key sensitivity."""
+        spec = cache.spec(flow.Apply().functor(Counter.builder()))
+        data = numpy.arange(100)
+        key = cache.key(spec, data)
+        assert spec == cache.spec(flow.Apply().functor(Counter.builder()))
+        assert key == cache.key(spec, data.copy())
+        assert key != cache.key(spec, data + 1)
+        assert key != cache.key(cache.spec(flow.Apply().functor(Counter.builder(increment=2))), data)
+        assert key != cache.key(cache.spec(flow.Train().functor(Counter.builder())), data)
+        assert key != cache.key(spec, b'state', data)
+
+    def test_lineage(self, cache: flow.Cache):
+        """Test the Merkle keys derived from the upstream outputs without hashing their payload."""
+        spec = cache.spec(flow.Apply().functor(Counter.builder()))
+        output = numpy.arange(10)
+        cachemod.LINEAGE.register(output, 'upstream')
+        assert cachemod.LINEAGE.resolve(output) == 'upstream'
+        assert cache.key(spec, output) != cache.key(spec, output.copy())
+        multi = (numpy.arange(3), numpy.arange(3))
+        cachemod.LINEAGE.register(multi, 'multi')
+        assert cachemod.LINEAGE.resolve(multi[0]) != cachemod.LINEAGE.resolve(multi[1])
+
+    def test_evict(self, tmp_path: pathlib.Path):
+        """Test the LRU eviction."""
+        cache = flow.Cache(tmp_path, 3500)
+        payload = bytes(1000)
+        for key in ('foo', 'bar', 'baz'):
+            cache[key] = payload
+            time.sleep(0.02)  # mtime granularity
+        _ = cache['foo']  # touching
+        time.sleep(0.02)
+        cache['qux'] = payload
+        assert 'foo' in cache
+        assert 'bar' not in cache
+        assert len(cache) == 3
+
+
+class TestWrap:
+    """Symbol table wrapping unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def symbols() -> typing.Sequence[flow.Symbol]:
+        """Symbols fixture."""
+        source = flow.Apply().functor(flow.Builder(extract.RowDriver))
+        counter = flow.Apply().functor(Counter.builder())
+        return flow.Symbol(source, ()), flow.Symbol(counter, (source,))
+
+    def test_wrap(self, symbols: typing.Sequence[flow.Symbol], tmp_path: pathlib.Path):
+        """Test the wrapping."""
+        (source, _), (counter, args) = cachemod.wrap(symbols, flow.Cache(tmp_path))
+        assert source is symbols[0].instruction
+        assert isinstance(counter, flow.Functor)
+        assert isinstance(counter.action, cachemod.Cached)
+        assert flow.Apply in counter.action
+        assert counter.builder is symbols[1].instruction.builder
+        assert args == (source,)
+
+    @pytest.mark.parametrize('lean', [False, True])
+    def test_execute(self, tmp_path: pathlib.Path, lean: bool):
+        """Test the cached execution."""
+        Counter.CALLS.clear()
+        cache = flow.Cache(tmp_path)
+
+        def functor() -> flow.Functor:
+            """Cached functor factory."""
+            instruction = flow.Apply().functor(Counter.builder())
+            action = cachemod.Cached(instruction.action, cache, cache.spec(instruction))
+            instruction = flow.Functor(instruction.builder, action)
+            instruction.lean = lean
+            return instruction
+
+        assert functor()(1) == 2
+        assert functor()(1) == 2
+        assert functor()(2) == 3
+        assert Counter.CALLS == [1, 2]
+
+    def test_reduce(self, tmp_path: pathlib.Path):
+        """Test the reduction keeps the preset values within the key."""
+        cache = flow.Cache(tmp_path)
+        functor = flow.Apply().functor(Counter.builder()).preset_params()
+        action = cachemod.Cached(functor.action, cache, cache.spec(functor))
+        actor = Counter()
+        reduced, args = action.reduce(actor, {'increment': 2}, 1)
+        assert isinstance(reduced, cachemod.Cached)
+        assert flow.Apply in reduced
+        assert args == (1,)
+        assert reduced(actor, *args) == 3
+        other, _ = action.reduce(Counter(), {'increment': 3}, 1)
+        assert other(Counter(), 1) == 2  # different key so computed
@@ -0,0 +1,100 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+ForML symbol table optimizer unit tests.
+"""
+import random
+
+from forml import flow
+from forml.flow._code import optimizer
+from forml.io._output import commit
+
+
+class Random(flow.Actor[int, None, int]):
+    """Non-deterministic actor fixture."""
+
+    def apply(self, *features: int) -> int:
+        return sum(features) + random.random()
+
+
+class Echo(flow.Actor[int, None, int]):
+    """Stateless actor fixture."""
+
+    PURE = True
+
+    def __init__(self, offset: int = 0):
+        self._offset: int = offset
+
+    def apply(self, *features: int) -> int:
+        return sum(features) + self._offset
+
+
+def test_merge():
+    """Test the common-subexpression elimination."""
+    source = flow.Apply().functor(Echo.builder())
+    left = flow.Apply().functor(Echo.builder(offset=1))
+    right = flow.Apply().functor(Echo.builder(offset=1))
+    other = flow.Apply().functor(Echo.builder(offset=2))
+    left0, right0 = flow.Getter(0), flow.Getter(0)
+    trained = flow.Train().functor(Echo.builder(offset=1))
+    noise1, noise2 = flow.Apply().functor(Random.builder()), flow.Apply().functor(Random.builder())
+    sink = flow.Apply().functor(Echo.builder())
+    symbols = (
+        flow.Symbol(sink, (left0, right0, other, trained, noise1, noise2)),
+        flow.Symbol(noise1, (source,)),
+        flow.Symbol(noise2, (source,)),
+        flow.Symbol(left0, (left,)),
+        flow.Symbol(right0, (right,)),
+        flow.Symbol(left, (source,)),
+        flow.Symbol(right, (source,)),
+        flow.Symbol(other, (source,)),
+        flow.Symbol(trained, (source,)),
+        flow.Symbol(source, ()),
+    )
+    optimized, report = optimizer.optimize(symbols)
+    assert {frozenset(p) for p in report.merged} == {frozenset((left, right)), frozenset((left0, right0))}
+    assert not report.pruned
+    assert len(optimized) == len(symbols) - 2
+    getter, *args = dict(optimized)[sink][1:]
+    assert dict(optimized)[sink][0] is getter
+    assert args == [other, trained, noise1, noise2]  # the impure actors are not merged
+
+
+def test_prune():
+    """Test the dead branch elimination."""
+    source = flow.Apply().functor(Echo.builder())
+    dead = flow.Apply().functor(Echo.builder(offset=1))
+    getter = flow.Getter(1)
+    output = flow.Apply().functor(flow.Builder(commit.Driver, None))
+    symbols = (
+        flow.Symbol(source, ()),
+        flow.Symbol(dead, (source,)),
+        flow.Symbol(getter, (dead,)),
+        flow.Symbol(output, (source,)),
+    )
+    optimized, report = optimizer.optimize(symbols)
+    assert set(report.pruned) == {dead, getter}
+    assert {i for i, _ in optimized} == {source, output}
+
+    leaf = flow.Apply().functor(Echo.builder(offset=2))
+    optimized, report = optimizer.optimize((*symbols, flow.Symbol(leaf, (source,))))
+    assert set(report.pruned) == {dead, getter}
+    assert leaf in dict(optimized)  # any non-getter leaf is retained
+    optimized, report = optimizer.optimize(symbols[:2] + symbols[3:])
+    assert not report
+    assert len(optimized) == 3
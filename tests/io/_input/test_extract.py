@@ -22,7 +22,8 @@ import typing
 
 import pytest
 
-from forml import project
+import forml
+from forml import io, project
 from forml.io import dsl, layout
 from forml.io._input import extract
 
@@ -80,3 +81,29 @@ class TestSlicer:
             assert right[0] == columns[-1][0]
         else:
             assert len(right[0]) == labels_width
+
+
+class TestDriver:
+    """Driver unit tests."""
+
+    def test_chunks(self, feed_instance: io.Feed, source_query: dsl.Query, testset: layout.RowMajor):
+        """Chunked reading test."""
+        producer = feed_instance.producer(feed_instance.sources, feed_instance.features)
+        driver = extract.TableDriver(producer, extract.Statement.prepare(source_query, None))
+        chunks = list(driver.chunks(2))
+        assert [len(c.data.to_rows()) for c in chunks] == [2, len(testset) - 2]
+        assert all(c.schema == source_query.schema for c in chunks)
+        assert [r for c in chunks for r in driver.apply(c).to_rows().tolist()] == [list(r) for r in testset]
+        with pytest.raises(forml.InvalidError, match='Invalid chunk size'):
+            next(driver.chunks(0))
+        with pytest.raises(forml.MissingError, match='not supported'):
+            next(extract.TableDriver(lambda *_: None, extract.Statement.prepare(source_query, None)).chunks(3))
+
+    def test_batch(self, feed_instance: io.Feed, source_query: dsl.Query, testset: layout.RowMajor):
+        """Streaming (batched) extraction test."""
+        producer = feed_instance.producer(feed_instance.sources, feed_instance.features, batch=2)
+        data = producer(source_query)
+        assert isinstance(data, layout.Columnar)
+        assert data.to_rows().tolist() == [list(r) for r in testset]
+        with pytest.raises(forml.InvalidError, match='Invalid batch size'):
+            feed_instance.producer(feed_instance.sources, feed_instance.features, batch=0)
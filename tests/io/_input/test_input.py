@@ -18,7 +18,9 @@
 """
 Feed utils unit tests.
 """
+import logging
 
+import numpy
 import pytest
 
 import forml
@@ -50,3 +52,16 @@ class TestImporter:
         assert pool.match(source_query) is instance
         with pytest.raises(forml.MissingError):
             pool.match(dsl.Table(source_query.schema))
+
+
+class TestReader:
+    """Reader unit tests."""
+
+    def test_stream(self, feed_type: type[io.Feed], caplog: pytest.LogCaptureFixture):
+        """Test the default (non-incremental) streaming warns about loading the full data."""
+        full = feed_type.Reader.read('testset')
+        with caplog.at_level(logging.WARNING):
+            chunks = list(feed_type.Reader.stream('testset', 2))
+        assert all(len(c) <= 2 for c in chunks)
+        assert numpy.array_equal(numpy.concatenate(chunks), full)
+        assert 'not supporting incremental reading' in caplog.text
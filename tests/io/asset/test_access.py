@@ -71,3 +71,12 @@ class TestState:
         """Test state loading."""
         for node, value in zip(stateful_nodes, generation_states.values()):
             assert state.load(node) == value
+
+    def test_sid(
+        self,
+        state: asset.State,
+        stateful_nodes: typing.Sequence[uuid.UUID],
+        generation_states: typing.Mapping[uuid.UUID, bytes],
+    ):
+        """Test the state id lookup."""
+        assert [state.sid(n) for n in stateful_nodes] == list(generation_states)
@@ -18,11 +18,15 @@
 """
 Internal payload tests.
 """
+import pickle
+import typing
 
 import numpy
+import pandas
 import pytest
 
-from forml.io import layout
+import forml
+from forml.io import dsl, layout
 
 
 class TestDense:
@@ -59,3 +63,125 @@ class TestDense:
         assert numpy.array_equal(layout.Dense.from_columns(columns).to_columns(), table.to_columns())
         if columns:
             assert table.take_columns([0]).to_columns().tolist() == [columns[0]]
+
+
+class TestColumnar:
+    """Columnar layout unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def frame() -> pandas.DataFrame:
+        """Mixed-type frame fixture."""
+        return pandas.DataFrame({'i': [1, 2, 3], 'f': [1.5, 2.5, 3.5], 's': ['a', 'b', 'c']})
+
+    @staticmethod
+    @pytest.fixture()
+    def table(frame: pandas.DataFrame) -> layout.Columnar:
+        """Columnar table fixture."""
+        return layout.Columnar.from_frame(frame)
+
+    def test_columns(self, table: layout.Columnar, frame: pandas.DataFrame):
+        """Column operations tests."""
+        assert [c.dtype for c in table.to_columns()] == frame.dtypes.tolist()
+        assert numpy.shares_memory(table.to_columns()[1], frame['f'].to_numpy())
+        taken = table.take_columns([1, 0])
+        assert taken.to_columns()[0] is table.to_columns()[1]
+        assert taken.to_rows().dtype == object  # int64 not exactly representable as float64
+        assert layout.Columnar.from_columns([[1, 2, 3], [1.5, 2.5, 3.5], ['a', 'b', 'c']]) == table
+
+    def test_rows(self, table: layout.Columnar, frame: pandas.DataFrame):
+        """Row operations tests."""
+        assert table.to_rows().tolist() == frame.values.tolist()
+        assert table.take_rows([2, 0]).to_rows().tolist() == [[3, 3.5, 'c'], [1, 1.5, 'a']]
+        assert layout.Columnar.from_rows(frame.values.tolist()) == table
+        assert table != layout.Dense.from_rows(frame.values)  # no cross-class equality
+        dense = numpy.ones((3, 2))
+        assert layout.Columnar.from_rows(dense).to_rows() is dense
+        assert layout.Columnar.from_rows(['x', 0, None]).to_rows().tolist() == [['x'], [0], [None]]
+        assert layout.Columnar.from_rows([]).to_rows().size == 0
+
+    @pytest.mark.parametrize(
+        'columns, dtype',
+        [
+            ([numpy.array([1, 2], dtype='int32'), numpy.array([0.5, 1.5])], numpy.dtype(float)),
+            ([numpy.array([1, 2], dtype='uint8'), numpy.array([3, 4], dtype='int64')], numpy.dtype('int64')),
+            ([numpy.array([1.5, 2.5], dtype='float32'), numpy.array([0.5, 1.5])], numpy.dtype(float)),
+            ([numpy.array([2**53 + 1, 2]), numpy.array([0.5, 1.5])], numpy.dtype(object)),
+            ([numpy.array([2**64 - 1, 2], dtype='uint64'), numpy.array([3, 4])], numpy.dtype(object)),
+        ],
+    )
+    def test_stacking(self, columns: typing.Sequence[numpy.ndarray], dtype: numpy.dtype):
+        """Test the rows get stacked natively only if lossless."""
+        rows = layout.Columnar(columns).to_rows()
+        assert rows.dtype == dtype
+        assert [r.tolist() for r in rows.T] == [c.tolist() for c in columns]
+
+    def test_frame(self, table: layout.Columnar, frame: pandas.DataFrame):
+        """Frame conversion tests."""
+        assert table.to_frame(frame.columns).equals(frame)
+        assert pickle.loads(pickle.dumps(table)) == table
+
+    def test_schema(self):
+        """Schema driven conversion tests."""
+        schema = dsl.Schema.from_fields(
+            dsl.Field(dsl.Integer(), 'i'),
+            dsl.Field(dsl.Float(), 'f'),
+            dsl.Field(dsl.Timestamp(), 't'),
+            dsl.Field(dsl.String(), 's'),
+        )
+        rows = [(1, 1, '2022-01-01', 'a'), (2, None, '2022-01-02', 'b')]
+        table = layout.Columnar.from_rows(rows, schema)
+        assert [c.dtype.kind for c in table.to_columns()] == ['i', 'f', 'M', 'O']
+        assert table.to_rows()[0].tolist() == [1, 1.0, pandas.Timestamp('2022-01-01'), 'a']
+        frame = pandas.DataFrame(rows, dtype=object)
+        converted = layout.Columnar.from_frame(frame, schema)
+        assert converted.to_frame().equals(table.to_frame())
+        typed = pandas.DataFrame({'i': [1, None], 'f': [1.0, 2.0]})
+        columns = layout.Columnar.from_frame(typed, schema).to_columns()
+        assert columns[0].dtype.kind == 'f' and numpy.shares_memory(columns[1], typed['f'].to_numpy())
+
+    @pytest.mark.parametrize(
+        'kind, values, dtype',
+        [
+            (dsl.Boolean(), ['false', 'true'], numpy.dtype(object)),
+            (dsl.Boolean(), ['0', '1'], numpy.dtype(object)),
+            (dsl.Boolean(), [0, 1, True], numpy.dtype(bool)),
+            (dsl.Boolean(), [0.0, 2.0], numpy.dtype(object)),
+            (dsl.Boolean(), [True, None], numpy.dtype(object)),
+            (dsl.Integer(), [1.7, 2.2], numpy.dtype(object)),
+            (dsl.Integer(), [1.0, 2.0], numpy.dtype(int)),
+            (dsl.Integer(), ['1', '2'], numpy.dtype(object)),
+            (dsl.Integer(), [1.5, None], numpy.dtype(object)),
+            (dsl.Integer(), [1, None], numpy.dtype(float)),
+            (dsl.Integer(), [2**53 + 1, None], numpy.dtype(object)),
+        ],
+    )
+    def test_cast(self, kind: dsl.Any, values: typing.Sequence[typing.Any], dtype: numpy.dtype):
+        """Test the schema driven conversion happens only if lossless."""
+        schema = dsl.Schema.from_fields(dsl.Field(kind, 'c'))
+        column = layout.Columnar.from_columns([values], schema).to_columns()[0]
+        assert column.dtype == dtype
+        if dtype == object:
+            assert column.tolist() == values
+
+    def test_builder(self, table: layout.Columnar):
+        """Incremental builder tests."""
+        builder = layout.Columnar.Builder()
+        for index in range(3):
+            builder.append(table.take_rows([index]))
+        assert len(builder) == 3
+        built = builder.build()
+        assert built == table
+        with pytest.raises(forml.InvalidError, match='already finished'):
+            builder.append(table)
+        with pytest.raises(forml.InvalidError, match='already finished'):
+            builder.build()
+        assert built == table
+        promoted = layout.Columnar.Builder().append(layout.Columnar.from_rows([[1], [2]]))
+        promoted.append(layout.Columnar.from_rows([[0.5]]))
+        assert promoted.build().to_columns()[0].tolist() == [1.0, 2.0, 0.5]
+        with pytest.raises(forml.InvalidError, match='width mismatch'):
+            layout.Columnar.Builder().append(table).append(table.take_columns([0]))
+        schema = dsl.Schema.from_fields(dsl.Field(dsl.Integer(), 'i'), dsl.Field(dsl.String(), 's'))
+        empty = layout.Columnar.Builder(schema).build().to_columns()
+        assert [len(c) for c in empty] == [0, 0] and empty[0].dtype.kind == 'i'
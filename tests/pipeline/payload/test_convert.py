@@ -22,6 +22,7 @@ import numpy
 import pandas
 
 from forml import testing
+from forml.io import layout
 from forml.pipeline import payload
 
 
@@ -38,6 +39,16 @@ class TestToPandas(testing.operator(payload.ToPandas)):  # pylint: disable=inval
         .apply(numpy.array([[1.0, 'a'], [2.0, 'b'], [3.0, 'b']], dtype=object))
         .returns(EXPECTED_DATAFRAME, testing.pandas_equals)
     )
+    apply_columnar = (
+        testing.Case(columns=('foo', 'bar'))
+        .apply(layout.Columnar.from_columns([[1.0, 2.0, 3.0], ['a', 'b', 'b']]))
+        .returns(EXPECTED_DATAFRAME, testing.pandas_equals)
+    )
+    apply_dense = (
+        testing.Case(columns=('foo', 'bar'))
+        .apply(layout.Dense.from_rows([[1.0, 'a'], [2.0, 'b'], [3.0, 'b']]))
+        .returns(EXPECTED_DATAFRAME, testing.pandas_equals)
+    )
     apply_numpy_vector = testing.Case().apply(numpy.array([0, 1, 0])).returns(EXPECTED_SERIES, testing.pandas_equals)
     apply_pylist_table = (
         testing.Case(columns=('foo', 'bar'))
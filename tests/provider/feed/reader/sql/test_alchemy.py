@@ -18,6 +18,8 @@
 SQL alchemy parser tests.
 """
 
+import pathlib
+import pickle
 import types
 import typing
 
@@ -140,3 +142,35 @@ class TestReader:
             .apply(lambda r: pandas.Series([r['surname'], r['name'], int(r['score'])]), axis='columns')
         ).values
         assert numpy.array_equal(result.to_rows(), expected)
+
+    def test_stream(self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+        """Test the chunked read disposing its ad-hoc engine."""
+        url = f'sqlite:///{tmp_path / "test.db"}'
+        pool = alchemy.Pool(url)
+        pandas.DataFrame({'a': range(5)}).to_sql('foo', pool.engine, index=False)
+        pool.dispose()
+        disposed = []
+        monkeypatch.setattr(engine.Engine, 'dispose', lambda self, *_, **__: disposed.append(self))
+        chunks = list(alchemy.Reader.stream(sql.text('SELECT a FROM foo'), 2, url))
+        assert [len(c) for c in chunks] == [2, 2, 1]
+        assert len(disposed) == 1
+
+
+class TestPool:
+    """Alchemy engine pool unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def pool(tmp_path: pathlib.Path) -> alchemy.Pool:
+        """Pool fixture."""
+        return alchemy.Pool(f'sqlite:///{tmp_path / "test.db"}', echo=False)
+
+    def test_engine(self, pool: alchemy.Pool):
+        """Test the engine reuse."""
+        assert pool.engine is pool.engine
+        with pool.engine.connect() as connection:
+            assert connection.execute(sql.text('SELECT 1')).scalar() == 1
+        clone = pickle.loads(pickle.dumps(pool))
+        assert clone.engine is not pool.engine
+        assert clone.engine.url == pool.engine.url
+        pool.dispose()
@@ -18,11 +18,16 @@
 """
 SQL parser tests.
 """
+import functools
+import pathlib
+import pickle
+import sqlite3
 import types
 import typing
 
 import pytest
 
+import forml
 from forml.io import dsl
 from forml.provider.feed.reader.sql import dbapi
 
@@ -61,3 +66,46 @@ class TestParser(Parser):
             )
             expected = 'SELECT "student"."surname" FROM (SELECT "student"."surname", "student"."score" FROM "student")'
             return Case(query, expected)
+
+
+class TestPool:
+    """DB API connection pool unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def pool(tmp_path: pathlib.Path) -> dbapi.Pool:
+        """Pool fixture."""
+        return dbapi.Pool(functools.partial(sqlite3.connect, str(tmp_path / 'test.db')), size=1)
+
+    def test_connect(self, pool: dbapi.Pool):
+        """Test the connection reuse."""
+        with pool.connect() as first:
+            with pool.connect() as second:
+                assert first is not second
+        assert len(pool) == 1  # the overflowing (later released) one got closed
+        with pool.connect() as third:
+            assert third is second
+        with pytest.raises(ValueError, match='Failing'):
+            with pool.connect() as fourth:
+                assert fourth is second
+                raise ValueError('Failing')
+        assert len(pool) == 0  # closed as failed
+        with pool.connect() as fifth:
+            fifth.close()
+        with pool.connect() as sixth:
+            assert sixth is not fifth  # dead one discarded
+        assert len(pickle.loads(pickle.dumps(pool))) == 0
+        pool.close()
+        assert len(pool) == 0
+        with pytest.raises(forml.InvalidError, match='Invalid pool size'):
+            dbapi.Pool(sqlite3.connect, size=-1)
+
+    def test_rollback(self, pool: dbapi.Pool):
+        """Test the pending transactions get rolled back upon the release."""
+        with pool.connect() as first:
+            first.execute('CREATE TABLE foo (bar INTEGER)')
+            first.commit()
+            first.execute('INSERT INTO foo VALUES (1)')  # left uncommitted
+        with pool.connect() as second:
+            assert second is first
+            assert second.execute('SELECT COUNT(*) FROM foo').fetchone() == (0,)
@@ -18,6 +18,7 @@
 Swiss feed unit tests.
 """
 import pathlib
+import pickle
 
 import pandas
 import pytest
@@ -57,3 +58,72 @@ class TestFeed(Feed):
         return monolite.Feed(
             inline={person_table: person_data, student_table: student_data}, csv={school_table: school_csv}
         )
+
+
+class TestArrowFeed(Feed):
+    """Feed unit tests using the Arrow dataset origins."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def student_parquet(tmp_path_factory: pytest.TempPathFactory, student_data: pandas.DataFrame) -> pathlib.Path:
+        """Student data in a Parquet file fixture."""
+        path = tmp_path_factory.mktemp('monolite-parquet') / 'student.parquet'
+        student_data.to_parquet(path, index=False, row_group_size=2)
+        return path
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def school_feather(tmp_path_factory: pytest.TempPathFactory, school_data: pandas.DataFrame) -> pathlib.Path:
+        """School data in a Feather file fixture."""
+        path = tmp_path_factory.mktemp('monolite-feather') / 'school.arrow'
+        school_data.to_feather(path)
+        return path
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def feed(
+        person_table: dsl.Table,
+        person_data: pandas.DataFrame,
+        student_table: dsl.Table,
+        student_parquet: pathlib.Path,
+        school_table: dsl.Table,
+        school_feather: pathlib.Path,
+    ) -> io.Feed:
+        """Feed fixture."""
+        return monolite.Feed(
+            inline={person_table: person_data},
+            parquet={student_table: student_parquet},
+            feather={school_table: {'path': school_feather}},
+        )
+
+
+class TestParquet:
+    """Parquet origin unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def origin(
+        tmp_path_factory: pytest.TempPathFactory, student_table: dsl.Table, student_data: pandas.DataFrame
+    ) -> monolite.Parquet:
+        """Hive-partitioned Parquet origin fixture."""
+        path = tmp_path_factory.mktemp('monolite-hive')
+        student_data.to_parquet(path, index=False, partition_cols=['school'], row_group_size=1)
+        return monolite.Parquet(student_table, path)
+
+    def test_partitions(self, origin: monolite.Parquet, student_table: dsl.Table, student_data: pandas.DataFrame):
+        """Test the column and predicate push-down."""
+        columns = [student_table.surname, student_table.score, student_table.school]
+        everything = origin.partitions(columns, None)
+        assert len(everything) == student_data['school'].nunique()
+        assert len(origin(everything)) == len(student_data)
+        predicate = (student_table.school == 2) & (student_table.score > 2)
+        pruned = origin.partitions(columns, predicate)
+        assert len(pruned) == 1 and len(pruned[0].groups) == 1  # one file and just one of its row groups
+        frame = origin(pruned)
+        assert set(frame.columns) == {'surname', 'score', 'school'}
+        assert frame['surname'].tolist() == student_data[(student_data['school'] == 2) & (student_data['score'] > 2)][
+            'surname'
+        ].tolist()
+        nothing = origin.partitions(columns, student_table.score > 100)
+        assert len(nothing) == 1 and origin(nothing).empty
+        assert pickle.loads(pickle.dumps(origin))(pruned).equals(frame)
@@ -53,6 +53,7 @@ class TestGateway:
         """Test the stats endpoint."""
         response = client.get(rest.Stats.PATH)
         assert response.status_code == 200
+        assert response.text.startswith('# HELP forml_requests_total')
 
     def test_apply(
         self,
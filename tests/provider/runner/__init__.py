@@ -44,6 +44,14 @@ class Runner(abc.ABC):
         runner.apply()
         assert tuple(sink_output.get_nowait()) == generation_prediction
 
+    def test_apply_chunked(
+        self, runner: runtime.Runner, sink_output: multiprocessing.Queue, generation_prediction: layout.Array
+    ):
+        """Test runner chunked apply mode."""
+        runner.apply(chunksize=2)
+        chunks = [tuple(sink_output.get(timeout=10)) for _ in range((len(generation_prediction) + 1) // 2)]
+        assert sum(chunks, ()) == tuple(generation_prediction)
+
     def test_train(self, runner: runtime.Runner):
         """Test runner train mode."""
         runner.train()
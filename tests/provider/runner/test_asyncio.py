@@ -0,0 +1,72 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Asyncio runner tests.
+"""
+import threading
+
+import pytest
+
+from forml import flow, io
+from forml.io import asset
+from forml.io._input import extract
+from forml.provider.runner import asyncio
+
+from . import Runner
+
+
+class Record(flow.Actor[None, None, None]):
+    """Actor recording its execution."""
+
+    EXECUTED = threading.Event()
+
+    def apply(self, *_) -> None:
+        self.EXECUTED.set()
+
+
+class Fail(flow.Actor[None, None, None]):
+    """Actor raising an error."""
+
+    def apply(self, *_) -> None:
+        raise ValueError('Failing actor')
+
+
+class TestRunner(Runner):
+    """Runner tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function', params=[None, 1])
+    def runner(
+        request: pytest.FixtureRequest, valid_instance: asset.Instance, feed_instance: io.Feed, sink_instance: io.Sink
+    ) -> asyncio.Runner:
+        """Runner fixture."""
+        return asyncio.Runner(valid_instance, feed_instance, sink_instance, concurrency=request.param, workers=2)
+
+    def test_failure(self):
+        """Test the cancellation upon failure."""
+        Record.EXECUTED.clear()
+        fail = flow.Apply().functor(Fail.builder())
+        record = flow.Apply().functor(Record.builder())
+        with pytest.raises(ValueError, match='Failing actor'):
+            asyncio.Runner.run([flow.Symbol(fail, ()), flow.Symbol(record, (fail,))])
+        assert not Record.EXECUTED.is_set()
+
+    def test_bound(self):
+        """Test the I/O-bound instruction detection."""
+        assert not asyncio.Runner.bound(flow.Apply().functor(Fail.builder()))
+        assert asyncio.Runner.bound(flow.Apply().functor(flow.Builder(extract.RowDriver)))
@@ -19,10 +19,15 @@
 Dask runner tests.
 """
 
+import multiprocessing
+import pathlib
+import uuid
+
 import pytest
 
-from forml import io
-from forml.io import asset
+import forml
+from forml import flow, io
+from forml.io import asset, layout
 from forml.provider.runner import dask
 
 from . import Runner
@@ -36,3 +41,59 @@ class TestRunner(Runner):
     def runner(request, valid_instance: asset.Instance, feed_instance: io.Feed, sink_instance: io.Sink) -> dask.Runner:
         """Runner fixture."""
         return dask.Runner(valid_instance, feed_instance, sink_instance, scheduler=request.param)
+
+    def test_cache(
+        self, valid_instance: asset.Instance, feed_instance: io.Feed, sink_instance: io.Sink, tmp_path: pathlib.Path
+    ):
+        """Test the incremental training cache."""
+        cache = flow.Cache(tmp_path)
+        runner = dask.Runner(valid_instance, feed_instance, sink_instance, cache=str(tmp_path))
+        runner.train()
+        entries = set(tmp_path.iterdir())
+        assert entries
+        runner.train()
+        assert set(tmp_path.iterdir()) == entries
+        assert len(cache) == len(entries)
+
+    def test_dag(self, valid_instance: asset.Instance):
+        """Test the DAG keys."""
+        source = flow.Getter(1)
+        symbols = [flow.Symbol(source, ()), flow.Symbol(getter := flow.Getter(0), (source,))]
+        dag = dask.Runner.Dag(symbols)
+        assert dag.output == id(getter)
+        dag = dask.Runner.Dag(symbols, prefix='foo')
+        assert dag.output == ('foo', id(getter))
+        assert dag[dag.output] == (getter, ('foo', id(source)))
+        with pytest.raises(forml.InvalidError, match='Address not applicable'):
+            dask.Runner(valid_instance, address='tcp://localhost:8786')
+
+    def test_distributed(
+        self,
+        valid_instance: asset.Instance,
+        feed_instance: io.Feed,
+        sink_instance: io.Sink,
+        sink_output: multiprocessing.Queue,
+        generation_prediction: layout.Array,
+    ):
+        """Test the distributed scheduler reusing the client and the scattered states and builders."""
+        pytest.importorskip('distributed')
+        runner = dask.Runner(valid_instance, feed_instance, sink_instance, scheduler=dask.Runner.DISTRIBUTED)
+        try:
+            runner.apply()
+            client = dask.Runner.client()
+            scattered = dict(dask.Runner._SCATTERED[client])  # pylint: disable=protected-access
+            states = {k for k in scattered if isinstance(k, uuid.UUID)}
+            assert states and len(scattered) > len(states)
+            runner.apply()
+            assert dask.Runner.client() is client
+            rescattered = dask.Runner._SCATTERED[client]  # pylint: disable=protected-access
+            assert scattered.items() <= rescattered.items()  # reusing the same futures
+            assert {k for k in rescattered if isinstance(k, uuid.UUID)} == states
+            assert tuple(sink_output.get(timeout=10)) == tuple(sink_output.get(timeout=10)) == generation_prediction
+        finally:
+            dask.Runner.client().close()
+        runner.apply()  # reconnecting
+        try:
+            assert client not in dask.Runner._SCATTERED  # pylint: disable=protected-access
+        finally:
+            dask.Runner.client().close()
@@ -0,0 +1,72 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Multiprocess runner tests.
+"""
+import os
+import pathlib
+
+import numpy
+import pandas
+import pytest
+
+from forml import io
+from forml.io import asset
+from forml.provider.runner import multiprocess
+
+from . import Runner
+
+
+class TestHandle:
+    """Handle unit tests."""
+
+    @pytest.mark.parametrize(
+        'value, mapped',
+        [
+            ('foo', False),
+            (numpy.arange(10), False),
+            (numpy.arange(100000), True),
+            (pandas.DataFrame({'a': numpy.arange(100000), 'b': 'foo'}), True),
+        ],
+    )
+    def test_exchange(self, value, mapped: bool, tmp_path: pathlib.Path):
+        """Value exchange test."""
+        handle = multiprocess.Handle.dump(value, str(tmp_path))
+        assert bool(handle.path) == mapped
+        loaded = handle.load()
+        handle.release()
+        assert not os.listdir(tmp_path)
+        if isinstance(value, pandas.DataFrame):
+            pandas.testing.assert_frame_equal(loaded, value)
+        elif isinstance(value, numpy.ndarray):
+            loaded[0] = -1  # copy-on-write
+            assert numpy.array_equal(loaded[1:], value[1:])
+        else:
+            assert loaded == value
+
+
+class TestRunner(Runner):
+    """Runner tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def runner(
+        valid_instance: asset.Instance, feed_instance: io.Feed, sink_instance: io.Sink, tmp_path: pathlib.Path
+    ) -> multiprocess.Runner:
+        """Runner fixture."""
+        return multiprocess.Runner(valid_instance, feed_instance, sink_instance, processes=2, staging=str(tmp_path))
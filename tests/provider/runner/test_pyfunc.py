@@ -18,25 +18,342 @@
 """
 Pyfunc runner tests.
 """
+import logging
+import mmap
+import pathlib
+import timeit
+import types
+import typing
 
+import numpy
+import pandas
 import pytest
 
 import forml
-from forml import io, runtime
+from forml import flow, io, runtime
+from forml.flow._code import cache as cachemod
 from forml.io import asset, layout
 from forml.provider.runner import pyfunc
 
 from . import Runner
 
+LOGGER = logging.getLogger(__name__)
+
+
+class Sum(flow.Actor[int, None, int]):
+    """Stateless actor summing its inputs plus one."""
+
+    def apply(self, *features: int) -> int:
+        return sum(features) + 1
+
+
+def deep(depth: int) -> typing.Sequence[flow.Symbol]:
+    """Synthetic linear symbol table.
+
+    Args:
+        depth: Number of chained instructions.
+
+    Returns:
+        Symbol table.
+    """
+    functors = [flow.Apply().functor(Sum.builder()) for _ in range(depth)]
+    return [flow.Symbol(functors[0], ())] + [flow.Symbol(f, (p,)) for p, f in zip(functors, functors[1:])]
+
+
+def wide(width: int) -> typing.Sequence[flow.Symbol]:
+    """Synthetic fan-out/fan-in symbol table.
+
+    Args:
+        width: Number of parallel branches.
+
+    Returns:
+        Symbol table.
+    """
+    head = flow.Apply().functor(Sum.builder())
+    root = flow.Apply().functor(Sum.builder())
+    branches = [flow.Apply().functor(Sum.builder()) for _ in range(width)]
+    tail = flow.Apply().functor(Sum.builder())
+    return [
+        flow.Symbol(head, ()),
+        flow.Symbol(root, (head,)),
+        *(flow.Symbol(b, (root,)) for b in branches),
+        flow.Symbol(tail, tuple(branches)),
+    ]
+
+
+def forked(width: int) -> typing.Sequence[flow.Symbol]:
+    """Synthetic symbol table with the DAG head feeding multiple consumers directly.
+
+    Args:
+        width: Number of the head consumers.
+
+    Returns:
+        Symbol table.
+    """
+    head = flow.Apply().functor(Sum.builder())
+    branches = [flow.Apply().functor(Sum.builder()) for _ in range(width)]
+    tail = flow.Apply().functor(Sum.builder())
+    return [flow.Symbol(head, ()), *(flow.Symbol(b, (head,)) for b in branches), flow.Symbol(tail, tuple(branches))]
+
+
+def skewed(depth: int) -> typing.Sequence[flow.Symbol]:
+    """Synthetic symbol table with a value consumed by both short and long branches (so that its last
+    consumer in the dependency order is not the last one in the execution waves).
+
+    Args:
+        depth: Length of the long branch.
+
+    Returns:
+        Symbol table.
+    """
+    head, root, long, short, tail = (flow.Apply().functor(Sum.builder()) for _ in range(5))
+    chain = [flow.Apply().functor(Sum.builder()) for _ in range(depth)]
+    return [
+        flow.Symbol(head, ()),
+        flow.Symbol(root, (head,)),
+        flow.Symbol(chain[0], (root,)),
+        *(flow.Symbol(c, (p,)) for p, c in zip(chain, chain[1:])),
+        flow.Symbol(long, (chain[-1], root)),
+        flow.Symbol(short, (root,)),
+        flow.Symbol(tail, (long, short)),
+    ]
+
+
+class TestProgram:
+    """Program backend tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function', params=[(deep, 100, 100), (wide, 100, 301), (forked, 3, 7), (skewed, 5, 14)])
+    def symbols(request: pytest.FixtureRequest) -> tuple[typing.Sequence[flow.Symbol], int]:
+        """Symbols fixture with the expected outcome for input of 0."""
+        shape, size, expected = request.param
+        return shape(size), expected
+
+    def test_call(self, symbols: tuple[typing.Sequence[flow.Symbol], int]):
+        """Test the program yields the same result as the expression."""
+        symbols, expected = symbols
+        assert pyfunc.Program(symbols)(0) == pyfunc.Expression(symbols)(0) == expected
+
+    def test_parallel(self, symbols: tuple[typing.Sequence[flow.Symbol], int]):
+        """Test the parallel program yields the same result as the sequential one."""
+        symbols, expected = symbols
+        program = pyfunc.Parallel(symbols, workers=4)
+        assert program(0) == program(0) == expected
+        program.shutdown()
+        assert program(0) == expected  # recreating the pool
+        program.shutdown()
+
+    def test_release(self, symbols: tuple[typing.Sequence[flow.Symbol], int]):
+        """Test each of the intermediate slots gets released exactly once after its last consumer."""
+        symbols, _ = symbols
+        program = pyfunc.Program(symbols)
+        released = [s for p in program._steps for s in p.release]
+        assert sorted(released) == list(range(len(program._steps)))
+        for index, step in enumerate(program._steps, start=1):
+            assert all(s not in n.args for s in step.release for n in program._steps[index:])
+
+    def test_cache(self, symbols: tuple[typing.Sequence[flow.Symbol], int], tmp_path: pathlib.Path):
+        """Test the backends executing the cached functors."""
+        symbols, expected = symbols
+        cache = flow.Cache(tmp_path)
+        symbols = cachemod.wrap(symbols, cache)
+        assert pyfunc.Expression(symbols)(0) == expected
+        stored = len(cache)
+        assert stored > 0
+        assert pyfunc.Program(symbols)(0) == expected
+        assert len(cache) == stored
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize('shape, size', [(deep, 100), (wide, 100)])
+    def test_benchmark(
+        self,
+        shape: typing.Callable[[int], typing.Sequence[flow.Symbol]],
+        size: int,
+        record_property: typing.Callable[[str, typing.Any], None],
+    ):
+        """Benchmark the program against the expression backend (reporting the timing only)."""
+        symbols = shape(size)
+        timing = {
+            b.__name__: min(timeit.repeat(lambda t=b(symbols, lean=True): t(0), number=100, repeat=5)) / 100
+            for b in (pyfunc.Expression, pyfunc.Program)
+        }
+        record_property('timing', timing)
+        LOGGER.info(
+            'Backend timing (%s of %d): %s',
+            shape.__name__,
+            size,
+            ', '.join(f'{k}={v * 1e6:.1f}us/call' for k, v in timing.items()),
+        )
+
+    def test_lean(self, symbols: tuple[typing.Sequence[flow.Symbol], int], caplog: pytest.LogCaptureFixture):
+        """Test the lean mode skips any of the per-call instruction logging."""
+        symbols, expected = symbols
+        caplog.set_level(logging.INFO, logger='forml.flow')
+        assert flow.Instruction.quiet()
+        caplog.set_level(logging.DEBUG, logger='forml.flow')
+        assert not flow.Instruction.quiet()
+        for backend in (pyfunc.Expression, pyfunc.Program):
+            for lean in (False, True):
+                term = backend(symbols, lean=lean)
+                caplog.clear()
+                assert term(0) == expected
+                assert bool(caplog.records) is not lean
+
+    @pytest.mark.benchmark
+    def test_overhead(self, record_property: typing.Callable[[str, typing.Any], None]):
+        """Benchmark the per-node instruction overhead of the lean versus the regular mode."""
+        size = 100
+        symbols = deep(size)
+        timing = {
+            'lean' if lean else 'regular': min(
+                timeit.repeat(lambda t=pyfunc.Expression(symbols, lean=lean): t(0), number=100, repeat=5)
+            )
+            / (100 * size)
+            for lean in (False, True)
+        }
+        record_property('timing', timing)
+        LOGGER.info('Instruction overhead per node: %s', ', '.join(f'{k}={v * 1e9:.0f}ns' for k, v in timing.items()))
+
+
+class TestMemo:
+    """Memo wrapper tests."""
+
+    class Term(pyfunc.Term):
+        """Fake term doubling the input rows and recording them."""
+
+        def __init__(self):
+            self.calls: list[list[int]] = []
+
+        def __call__(self, entry: layout.Entry) -> layout.Outcome:
+            rows = [r[0] for r in entry.data.to_rows()]
+            self.calls.append(rows)
+            return layout.Outcome('out', [r * 2 for r in rows])
+
+    @staticmethod
+    def entry(*values: int) -> layout.Entry:
+        """Helper for creating the input entry."""
+        return layout.Entry('in', layout.Dense.from_rows([[v] for v in values]))
+
+    def test_call(self):
+        """Test the memoization."""
+        term = self.Term()
+        memo = pyfunc.Memo(term, 3)
+        assert memo(self.entry(1, 2, 1)) == layout.Outcome('out', [2, 4, 2])
+        assert memo(self.entry(2, 3, 1)) == layout.Outcome('out', [4, 6, 2])
+        assert term.calls == [[1, 2], [3]]
+        assert memo(self.entry(4, 2)) == layout.Outcome('out', [8, 4])  # evicting the LRU 1
+        assert memo(self.entry(1)) == layout.Outcome('out', [2])
+        assert term.calls == [[1, 2], [3], [4], [1]]
+
+    @pytest.mark.parametrize(
+        'container, expected',
+        [
+            (numpy.asarray, numpy.asarray([2, 4, 2])),
+            (lambda r: numpy.asarray(r).reshape(-1, 1), numpy.asarray([[2], [4], [2]])),
+            (lambda r: pandas.DataFrame({'out': r}), pandas.DataFrame({'out': [2, 4, 2]})),
+            (pandas.Series, pandas.Series([2, 4, 2])),
+        ],
+        ids=['vector', 'matrix', 'frame', 'series'],
+    )
+    def test_container(self, container: typing.Callable[[list[int]], typing.Any], expected: typing.Any):
+        """Test the memoized outcome retains the native container type."""
+        term = self.Term()
+        memo = pyfunc.Memo(lambda e: layout.Outcome('out', container(term(e).data)), 3)
+        cold = memo(self.entry(1, 2))
+        assert type(cold.data) is type(expected)
+        warm = memo(self.entry(1, 2, 1))
+        assert type(warm.data) is type(expected)
+        if isinstance(expected, numpy.ndarray):
+            assert warm.data.dtype == expected.dtype
+            assert numpy.array_equal(warm.data, expected)
+        else:
+            assert warm.data.equals(expected)
+        assert term.calls == [[1, 2]]
+
+    def test_invalid(self):
+        """Test the invalid setup and outcome."""
+        with pytest.raises(forml.InvalidError, match='Invalid memo size'):
+            pyfunc.Memo(self.Term(), 0)
+        with pytest.raises(forml.UnexpectedError, match='not row-independent'):
+            pyfunc.Memo(lambda e: layout.Outcome('out', []), 3)(self.entry(1))
+
+
+class TestSharing:
+    """Sharing helper tests."""
+
+    def test_call(self):
+        """Test the arrays relocation."""
+        large, small = numpy.arange(1000, dtype=float), numpy.arange(10, dtype=float)
+        nested = types.SimpleNamespace(array=large.copy())
+        root = types.SimpleNamespace(
+            array=large.copy(), small=small, items=[large.copy()], mapping={'array': large.copy()}, nested=(nested,)
+        )
+        assert pyfunc.Sharing(threshold=large.nbytes)(root) == 4 * large.nbytes
+        for array in root.array, root.items[0], root.mapping['array'], nested.array:
+            assert isinstance(array.base, mmap.mmap)
+            assert not array.flags.writeable
+            assert numpy.array_equal(array, large)
+        assert root.small is small
+        assert pyfunc.Sharing(threshold=large.nbytes)(root) == 0  # already relocated
+        masked = numpy.ma.masked_array(large.copy(), mask=large > 500)
+        subclassed = types.SimpleNamespace(masked=masked)
+        assert pyfunc.Sharing(threshold=large.nbytes)(subclassed) == 0
+        assert subclassed.masked is masked
+
 
 class TestRunner(Runner):
     """Runner tests."""
 
     @staticmethod
-    @pytest.fixture(scope='function')
-    def runner(valid_instance: asset.Instance, feed_instance: io.Feed, sink_instance: io.Sink) -> pyfunc.Runner:
+    @pytest.fixture(scope='function', params=['expression', 'program', 'parallel'])
+    def runner(
+        request: pytest.FixtureRequest, valid_instance: asset.Instance, feed_instance: io.Feed, sink_instance: io.Sink
+    ) -> pyfunc.Runner:
         """Runner fixture."""
-        return pyfunc.Runner(valid_instance, feed_instance, sink_instance)
+        return pyfunc.Runner(valid_instance, feed_instance, sink_instance, backend=request.param)
+
+    def test_backend(self, valid_instance: asset.Instance, feed_instance: io.Feed, sink_instance: io.Sink):
+        """Test invalid backend."""
+        with pytest.raises(forml.InvalidError, match='Unknown backend'):
+            pyfunc.Runner(valid_instance, feed_instance, sink_instance, backend='foobar')
+
+    def test_workers(
+        self,
+        valid_instance: asset.Instance,
+        feed_instance: io.Feed,
+        sink_instance: io.Sink,
+        testset_entry: layout.Entry,
+        generation_prediction: layout.Array,
+    ):
+        """Test the parallel backend thread pool setup."""
+        runner = pyfunc.Runner(valid_instance, feed_instance, sink_instance, backend='parallel', workers=2)
+        assert tuple(runner.call(testset_entry).data) == generation_prediction
+        runner.shutdown()
+
+    def test_share(
+        self,
+        valid_instance: asset.Instance,
+        feed_instance: io.Feed,
+        sink_instance: io.Sink,
+        testset_entry: layout.Entry,
+        generation_prediction: layout.Array,
+    ):
+        """Test the shared mode."""
+        runner = pyfunc.Runner(valid_instance, feed_instance, sink_instance, share=True)
+        assert tuple(runner.call(testset_entry).data) == generation_prediction
+
+    def test_memo(
+        self,
+        valid_instance: asset.Instance,
+        feed_instance: io.Feed,
+        sink_instance: io.Sink,
+        testset_entry: layout.Entry,
+        generation_prediction: layout.Array,
+    ):
+        """Test the memoized mode."""
+        runner = pyfunc.Runner(valid_instance, feed_instance, sink_instance, memo=10)
+        for _ in range(2):
+            assert tuple(runner.call(testset_entry).data) == generation_prediction
 
     def test_train(self, runner: runtime.Runner):
         """Overridden train test."""
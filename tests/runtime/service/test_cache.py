@@ -0,0 +1,113 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Service runtime cache tests.
+"""
+import typing
+
+import pytest
+
+import forml
+from forml.io import asset, layout
+from forml.runtime._service import cache
+
+
+class TestCache:
+    """Response cache unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def response() -> layout.Response:
+        """Response fixture."""
+        return layout.Response(b'foo', layout.Encoding('application/json'))
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def key(valid_instance: asset.Instance) -> typing.Callable[..., cache.Cache.Key]:
+        """Fixture of a helper for creating the cache key."""
+
+        def create(
+            application: str, request: layout.Request, instance: asset.Instance = valid_instance
+        ) -> cache.Cache.Key:
+            return cache.Cache.Key.from_request(application, instance, request)
+
+        return create
+
+    def test_key(
+        self,
+        key: typing.Callable[..., cache.Cache.Key],
+        application: str,
+        testset_request: layout.Request,
+    ):
+        """Cache key test."""
+        original = key(application, testset_request)
+        assert original == key(application, testset_request)
+        assert original != key('foobar', testset_request)
+        assert original != key(application, testset_request._replace(payload=b'bar'))
+        assert original != key(application, testset_request._replace(params={'foo': 'bar'}))
+        assert original != key(application, testset_request, instance=object())  # different model instance
+
+    def test_size(
+        self,
+        key: typing.Callable[..., cache.Cache.Key],
+        testset_request: layout.Request,
+        response: layout.Response,
+    ):
+        """Test the size bounded eviction."""
+        lru = cache.Cache(2)
+        keys = [key(a, testset_request) for a in ('foo', 'bar', 'baz')]
+        lru.put(keys[0], response)
+        lru.put(keys[1], response)
+        assert lru.get(keys[0]) is response  # refreshing 0 so that 1 is the LRU
+        lru.put(keys[2], response)
+        assert len(lru) == 2
+        assert lru.get(keys[1]) is None
+        assert lru.get(keys[0]) is lru.get(keys[2]) is response
+
+    def test_ttl(
+        self,
+        key: typing.Callable[..., cache.Cache.Key],
+        testset_request: layout.Request,
+        response: layout.Response,
+    ):
+        """Test the entry expiration."""
+        expiring = cache.Cache(2, ttl=-1)
+        expiring.put(key('foo', testset_request), response)
+        assert expiring.get(key('foo', testset_request)) is None
+        assert not expiring
+
+    def test_invalidate(
+        self,
+        key: typing.Callable[..., cache.Cache.Key],
+        testset_request: layout.Request,
+        project_name: asset.Project.Key,
+        response: layout.Response,
+    ):
+        """Test the lineage invalidation."""
+        cached = key('foo', testset_request)
+        lru = cache.Cache(2)
+        lru.put(cached, response)
+        lru.invalidate('foobar')
+        assert lru.get(cached) is response
+        lru.invalidate(project_name)
+        assert lru.get(cached) is None
+
+    def test_invalid(self):
+        """Invalid size test."""
+        with pytest.raises(forml.InvalidError, match='Invalid cache size'):
+            cache.Cache(0)
@@ -19,6 +19,9 @@ Service runtime dispatch tests.
 """
 import json
 import pickle
+import types
+import typing
+from concurrent import futures
 
 import pytest
 
@@ -26,7 +29,8 @@ import forml
 from forml import application as appmod
 from forml import io
 from forml.io import asset, layout
-from forml.runtime._service import dispatch
+from forml.runtime import _perf
+from forml.runtime._service import dispatch, prediction
 
 
 class TestDealer:
@@ -51,26 +55,135 @@ class TestDealer:
         outcome = await dealer(valid_instance, testset_entry)
         assert tuple(outcome.data) == generation_prediction
 
+    class Instance(typing.NamedTuple):
+        """Fake instance of the given project lineage."""
+
+        lineage: str
+        generation_key: int
+
+        @property
+        def generation(self) -> types.SimpleNamespace:
+            """Fake generation level."""
+            return types.SimpleNamespace(project=types.SimpleNamespace(key=self.lineage))
+
+        @property
+        def project(self) -> types.SimpleNamespace:
+            """Fake project components."""
+            return types.SimpleNamespace(source=types.SimpleNamespace(extract=types.SimpleNamespace(apply=None)))
+
+    class Executor:
+        """Fake executor returning the instance it represents."""
+
+        FOOTPRINT = 100
+
+        def __init__(self, instance: 'TestDealer.Instance', *_, **__):
+            self.name: str = repr(instance)
+            self.instance: TestDealer.Instance = instance
+            self.ready: bool = False
+            self.failed: bool = False
+            self.pending: int = 0
+            self.footprint: int = self.FOOTPRINT
+            self.stopped: futures.Future = futures.Future()
+
+        def start(self) -> None:
+            """Fake start."""
+
+        def stop(self) -> None:
+            """Fake stop."""
+            self.stopped.set_result(True)
+
+        def apply(self, *_) -> futures.Future:
+            """Fake apply."""
+            result = futures.Future()
+            result.set_result(self.instance)
+            return result
+
+    @pytest.mark.parametrize(
+        'policy',
+        [{'capacity': 1}, {'idle': 0}, {'memory': Executor.FOOTPRINT * 3 // 2}],
+        ids=['capacity', 'idle', 'memory'],
+    )
+    async def test_warmup(
+        self, policy: typing.Mapping[str, typing.Any], feed_instance: io.Feed, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the background warm-up and the eviction policies."""
+        executors: dict[TestDealer.Instance, TestDealer.Executor] = {}
+
+        def executor(instance: TestDealer.Instance, *args, **kwargs) -> TestDealer.Executor:
+            return executors.setdefault(instance, self.Executor(instance, *args, **kwargs))
+
+        monkeypatch.setattr(prediction, 'Executor', executor)
+        monkeypatch.setattr(io.Importer, 'match', lambda *_: None)
+        dealer = dispatch.Dealer(io.Importer(feed_instance), **policy)
+        switched = []
+        dealer.subscribe(switched.append)
+        old, new = self.Instance('foo', 1), self.Instance('foo', 2)
+        assert await dealer(old, None) == old  # cold start
+        executors[old].ready = True
+        assert await dealer(new, None) == old  # warming up the new while routing to the old
+        assert await dealer(new, None) == old
+        assert not executors[old].stopped.done()
+        executors[new].ready = True
+        assert await dealer(new, None) == new  # switched over
+        assert switched == ['foo', 'foo']
+        assert executors[old].stopped.result(timeout=1)
+        assert not executors[new].stopped.done()
+        dealer.shutdown()
+        assert executors[new].stopped.result(timeout=1)
+
+    async def test_failure(self, feed_instance: io.Feed, monkeypatch: pytest.MonkeyPatch):
+        """Test the failed warm-up gets evicted and respawned."""
+        spawned: list[TestDealer.Executor] = []
+
+        def executor(instance: TestDealer.Instance, *args, **kwargs) -> TestDealer.Executor:
+            spawned.append(self.Executor(instance, *args, **kwargs))
+            return spawned[-1]
+
+        monkeypatch.setattr(prediction, 'Executor', executor)
+        monkeypatch.setattr(io.Importer, 'match', lambda *_: None)
+        dealer = dispatch.Dealer(io.Importer(feed_instance))
+        old, new = self.Instance('foo', 1), self.Instance('foo', 2)
+        assert await dealer(old, None) == old
+        spawned[0].ready = True
+        assert await dealer(new, None) == old
+        spawned[1].failed = True
+        assert await dealer(new, None) == old  # still routing to the old while respawning the new
+        assert spawned[1].stopped.result(timeout=1)
+        assert len(spawned) == 3 and spawned[2].instance == new
+        spawned[2].ready = True
+        assert await dealer(new, None) == new
+        dealer.shutdown()
+
+    def test_capacity(self, feed_instance: io.Feed):
+        """Test the invalid capacity."""
+        with pytest.raises(forml.InvalidError, match='Invalid capacity'):
+            dispatch.Dealer(io.Importer(feed_instance), capacity=0)
+
 
 class TestWrapper:
     """Wrapper unit tests."""
 
     @staticmethod
-    @pytest.fixture(scope='function')
-    async def wrapper(inventory: asset.Inventory, registry: asset.Registry) -> dispatch.Wrapper:
+    @pytest.fixture(scope='function', params=['process', 'thread', 'inline'])
+    async def wrapper(
+        request: pytest.FixtureRequest, inventory: asset.Inventory, registry: asset.Registry
+    ) -> dispatch.Wrapper:
         """Wrapper fixture."""
-        wrapper = dispatch.Wrapper(inventory, registry, max_workers=3)
+        wrapper = dispatch.Wrapper(inventory, registry, max_workers=3, codec=request.param)
         yield wrapper
         wrapper.shutdown()
 
     @staticmethod
     @pytest.fixture(scope='function')
     def query(
-        descriptor: appmod.Descriptor, valid_instance: asset.Instance, testset_request: layout.Request
+        application: str,
+        descriptor: appmod.Descriptor,
+        valid_instance: asset.Instance,
+        testset_request: layout.Request,
     ) -> dispatch.Wrapper.Query:
         """Query fixture."""
         return dispatch.Wrapper.Query(
-            descriptor, valid_instance, testset_request.accept, descriptor.receive(testset_request)
+            application, descriptor, valid_instance, testset_request.accept, descriptor.receive(testset_request)
         )
 
     async def test_extract(
@@ -83,8 +196,10 @@ class TestWrapper:
     ):
         """Extract test."""
         query = await wrapper.extract(application, testset_request, None)
+        assert query.application == application
         assert query.descriptor.name == application
-        assert query.decoded.entry == testset_entry
+        assert query.decoded.entry.schema == testset_entry.schema
+        assert query.decoded.entry.data.to_rows().tolist() == testset_entry.data.to_rows().tolist()
         assert valid_instance == query.instance
 
     async def test_invalid(
@@ -107,6 +222,19 @@ class TestWrapper:
         response = await wrapper.respond(query, testset_outcome)
         assert tuple(v for r in json.loads(response.payload) for v in r.values()) == generation_prediction
 
+    def test_observe(self, inventory: asset.Inventory, registry: asset.Registry, query: dispatch.Wrapper.Query):
+        """Encoding latency collection test."""
+        collector = _perf.Collector()
+        wrapper = dispatch.Wrapper(inventory, registry, collector=collector, codec='inline')
+        wrapper.observe(query._replace(application='foobar'), 0.1)
+        wrapper.shutdown()
+        assert collector.snapshot().applications['foobar'].latency['encode'].count == 1
+
+    def test_codec(self, inventory: asset.Inventory, registry: asset.Registry):
+        """Invalid codec test."""
+        with pytest.raises(forml.InvalidError, match='Unknown codec strategy'):
+            dispatch.Wrapper(inventory, registry, codec='foobar')
+
     @staticmethod
     @pytest.fixture(scope='function')
     def frozen(registry: asset.Registry) -> dispatch.Wrapper.Frozen:
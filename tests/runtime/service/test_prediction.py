@@ -18,14 +18,55 @@
 Service runtime worker tests.
 """
 import multiprocessing
+import operator
+import pickle
+import types
+from concurrent import futures
 
+import numpy
 import pytest
 
+import forml
 from forml import io
 from forml.io import asset, layout
 from forml.runtime._service import prediction
 
 
+class TestShared:
+    """Shared payload unit tests."""
+
+    def test_offload(self):
+        """Test the offloading eligibility."""
+        small = layout.Dense.from_rows(numpy.ones((2, 2)))
+        assert prediction.Shared.offload(small) is small
+        text = layout.Dense.from_rows([['a'] * 2] * prediction.Shared.THRESHOLD)
+        assert prediction.Shared.offload(text) is text
+        large = layout.Dense.from_rows(numpy.arange(prediction.Shared.THRESHOLD, dtype=float).reshape(-1, 4))
+        shared = prediction.Shared.offload(large)
+        assert isinstance(shared, prediction.Shared)
+        assert numpy.array_equal(shared.to_rows(), large.to_rows())
+        attached = pickle.loads(pickle.dumps(shared))
+        assert len(pickle.dumps(shared)) < 1024
+        assert numpy.array_equal(attached.to_rows(), large.to_rows())
+        del attached
+        shared.release()
+
+
+class TestTask:
+    """Task unit tests."""
+
+    def test_encode(self, testset_entry: layout.Entry):
+        """Test the encoding failure wrapping."""
+
+        def encode(_):
+            raise ValueError('foobar')
+
+        runner = types.SimpleNamespace(call=lambda e: e)
+        assert prediction.Task(1, testset_entry, lambda e: 'ok')(runner).outcome == 'ok'
+        with pytest.raises(forml.FailedError, match='Encoding failed'):
+            prediction.Task(1, testset_entry, encode)(runner)
+
+
 class TestPool:
     """Worker pool unit tests."""
 
@@ -33,27 +74,31 @@ class TestPool:
     @pytest.fixture(scope='function')
     def tasks() -> multiprocessing.Queue:
         """Tasks queue fixture."""
-        with multiprocessing.Manager() as manager:
-            yield manager.Queue()
+        return multiprocessing.get_context('spawn').Queue()
 
     @staticmethod
     @pytest.fixture(scope='function')
     def results() -> multiprocessing.Queue:
         """Results queue fixture."""
-        with multiprocessing.Manager() as manager:
-            yield manager.Queue()
+        return multiprocessing.get_context('spawn').Queue()
 
     @staticmethod
-    @pytest.fixture(scope='function')
+    @pytest.fixture(scope='function', params=[False, True], ids=['private', 'shared'])
     def pool(
+        request: pytest.FixtureRequest,
         valid_instance: asset.Instance,
         feed_instance: io.Feed,
         tasks: multiprocessing.Queue,
         results: multiprocessing.Queue,
     ) -> prediction.Pool:
         """Pool fixture."""
-        with multiprocessing.Manager() as manager:
-            yield prediction.Pool(valid_instance, feed_instance, tasks, results, stopped=manager.Event(), processes=3)
+        stopped = multiprocessing.get_context('spawn').Event()
+        pool = prediction.Pool(
+            valid_instance, feed_instance, tasks, results, stopped=stopped, processes=3, share=request.param
+        )
+        yield pool
+        if pool.is_alive():
+            pool.stop()
 
     @staticmethod
     @pytest.fixture(scope='session')
@@ -73,12 +118,14 @@ class TestPool:
         assert tasks.empty()
         assert results.empty()
         assert not pool.is_alive()
+        assert not pool.ready and not pool.footprint
         pool.start()
         assert pool.is_alive()
         tasks.put(input_task)
-        result: prediction.Result = results.get()
+        result: prediction.Result = results.get(timeout=60)
         assert result.id == input_task.id
         assert tuple(result.outcome.data) == generation_prediction
+        assert pool.ready and pool.footprint > 0
         pool.stop()
         assert not pool.is_alive()
 
@@ -93,7 +140,10 @@ class TestExecutor:
         feed_instance: io.Feed,
     ) -> prediction.Executor:
         """Executor fixture."""
-        return prediction.Executor(valid_instance, feed_instance, processes=3)
+        executor = prediction.Executor(valid_instance, feed_instance, processes=3)
+        yield executor
+        if executor.is_alive():
+            executor.stop()
 
     def test_apply(
         self, executor: prediction.Executor, testset_entry: layout.Entry, generation_prediction: layout.Array
@@ -105,3 +155,106 @@ class TestExecutor:
         outcome = executor.apply(testset_entry)
         assert tuple(outcome.result().data) == generation_prediction
         executor.stop()
+
+    def test_failed(self, executor: prediction.Executor, monkeypatch: pytest.MonkeyPatch):
+        """Test the failure detection."""
+
+        def start() -> None:
+            raise OSError('Spawning failed')
+
+        assert not executor.failed
+        monkeypatch.setattr(executor._pool, 'start', start)
+        with pytest.raises(OSError, match='Spawning failed'):
+            executor.start()
+        assert executor.failed and not executor.ready
+        executor.stop()
+        assert not executor.failed
+
+    def test_batching(
+        self,
+        valid_instance: asset.Instance,
+        feed_instance: io.Feed,
+        testset_entry: layout.Entry,
+        generation_prediction: layout.Array,
+    ):
+        """Apply with micro-batching enabled (and the parallel backend) unit test."""
+        executor = prediction.Executor(
+            valid_instance, feed_instance, processes=1, batch_size=1000, batch_delay=0, backend='parallel', workers=2
+        )
+        executor.start()
+        outcome = executor.apply(testset_entry)
+        assert tuple(outcome.result().data) == generation_prediction
+        executor.stop()
+
+    def test_concurrent(
+        self,
+        valid_instance: asset.Instance,
+        feed_instance: io.Feed,
+        testset_entry: layout.Entry,
+        generation_prediction: layout.Array,
+    ):
+        """Test the batched submissions racing the ones bypassing the batcher all get resolved."""
+        executor = prediction.Executor(valid_instance, feed_instance, processes=2, batch_size=1000, batch_delay=0)
+        executor.start()
+        try:
+            with futures.ThreadPoolExecutor(8) as pool:
+                outcomes = list(
+                    pool.map(
+                        lambda i: executor.apply(testset_entry, operator.attrgetter('data') if i % 2 else None),
+                        range(200),
+                    )
+                )
+            for index, outcome in enumerate(outcomes):
+                result = outcome.result(timeout=30)
+                assert tuple(result if index % 2 else result.data) == generation_prediction
+            assert executor.pending == 0
+        finally:
+            executor.stop()
+
+
+class TestBatcher:
+    """Batcher unit tests."""
+
+    class Submitter:
+        """Fake submitter applying an identity to the entry rows."""
+
+        def __init__(self):
+            self.calls: list[layout.Entry] = []
+
+        def __call__(self, entry: layout.Entry) -> futures.Future[layout.Outcome]:
+            self.calls.append(entry)
+            outcome = futures.Future()
+            outcome.set_result(layout.Outcome(entry.schema, entry.data.to_rows().tolist()))
+            return outcome
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def submitter() -> 'TestBatcher.Submitter':
+        """Submitter fixture."""
+        return TestBatcher.Submitter()
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def batcher(submitter: 'TestBatcher.Submitter') -> prediction.Batcher:
+        """Batcher fixture."""
+        batcher = prediction.Batcher(submitter, size=4, delay=10)
+        batcher.start()
+        yield batcher
+        batcher.stop()
+
+    def test_coalesce(
+        self, batcher: prediction.Batcher, submitter: 'TestBatcher.Submitter', testset_entry: layout.Entry
+    ):
+        """Test the entries get coalesced into a single submission and scattered back."""
+        first = layout.Entry(testset_entry.schema, layout.Dense.from_rows([[1, 'a'], [2, 'b']]))
+        second = layout.Entry(testset_entry.schema, layout.Dense.from_rows([[3, 'c'], [4, 'd']]))
+        outcomes = [batcher(first), batcher(second)]
+        assert [o.result(timeout=5).data for o in outcomes] == [[[1, 'a'], [2, 'b']], [[3, 'c'], [4, 'd']]]
+        assert len(submitter.calls) == 1
+
+    def test_flush(self, batcher: prediction.Batcher, submitter: 'TestBatcher.Submitter', testset_entry: layout.Entry):
+        """Test the pending entries get flushed upon stopping."""
+        outcome = batcher(testset_entry)
+        batcher.stop()
+        assert len(outcome.result(timeout=5).data) == len(testset_entry.data.to_rows())
+        assert len(submitter.calls) == 1
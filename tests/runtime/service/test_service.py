@@ -31,10 +31,13 @@ class TestEngine:
     """Engine unit tests."""
 
     @staticmethod
-    @pytest.fixture(scope='function')
-    async def engine(inventory: asset.Inventory, registry: asset.Registry, feed_instance: io.Feed) -> _service.Engine:
+    @pytest.fixture(scope='function', params=[('process', False), ('inline', True), ('thread', False)])
+    async def engine(
+        request: pytest.FixtureRequest, inventory: asset.Inventory, registry: asset.Registry, feed_instance: io.Feed
+    ) -> _service.Engine:
         """Engine fixture."""
-        engine = _service.Engine(inventory, registry, io.Importer(feed_instance), processes=3)
+        codec, fuse = request.param
+        engine = _service.Engine(inventory, registry, io.Importer(feed_instance), processes=3, codec=codec, fuse=fuse)
         yield engine
         engine.shutdown()
 
@@ -48,6 +51,32 @@ class TestEngine:
         """Apply unit test."""
         response = await engine.apply(application, testset_request)
         assert tuple(v for r in json.loads(response.payload) for v in r.values()) == generation_prediction
+        stats = await engine.stats()
+        metrics = stats.applications[application]
+        assert metrics.requests == 1
+        assert metrics.errors == metrics.pending == 0
+        assert set(metrics.latency) == {'decode', 'select', 'predict', 'encode'}
+        assert all(h.count == 1 for h in metrics.latency.values())
+        assert len(stats.instances) == 1
+
+    async def test_cache(
+        self,
+        inventory: asset.Inventory,
+        registry: asset.Registry,
+        feed_instance: io.Feed,
+        application: str,
+        testset_request: layout.Request,
+    ):
+        """Response caching test."""
+        engine = _service.Engine(inventory, registry, io.Importer(feed_instance), processes=3, cache_size=1)
+        try:
+            response = await engine.apply(application, testset_request)
+            assert await engine.apply(application, testset_request) is response
+            metrics = (await engine.stats()).applications[application]
+            assert metrics.requests == 2
+            assert metrics.latency['predict'].count == 1
+        finally:
+            engine.shutdown()
 
     async def test_invalid(
         self,
@@ -0,0 +1,64 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Runtime benchmark unit tests.
+"""
+import pathlib
+
+import pytest
+
+import forml
+from forml import runtime
+
+
+class TestBenchmark:
+    """Benchmark unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def report() -> runtime.Benchmark.Report:
+        """Benchmark report fixture."""
+        spec = runtime.Benchmark.Spec(depth=2, width=3, rows=100, columns=2)
+        return runtime.Benchmark(spec, [('pyfunc', {}), ('dask', {'scheduler': 'threaded'})], repeat=2, warmup=0)()
+
+    def test_report(self, report: runtime.Benchmark.Report):
+        """Test the benchmark results."""
+        assert [r.case for r in report.results] == [
+            'pyfunc:apply',  # pyfunc:train not supported
+            'dask[scheduler=threaded]:train',
+            'dask[scheduler=threaded]:apply',
+        ]
+        for result in report.results:
+            assert len(result.latencies) == 2
+            assert result.percentile(99) >= result.percentile(50) > 0
+            assert result.throughput > 0
+            assert result.memory > 0
+        assert all(r.case in str(report) for r in report.results)
+
+    def test_compare(self, report: runtime.Benchmark.Report, tmp_path: pathlib.Path):
+        """Test the report storing and comparing."""
+        path = tmp_path / 'report.json'
+        report.dump(path)
+        baseline = runtime.Benchmark.Report.load(path)
+        assert baseline == report
+        assert not report.compare(baseline)
+        faster = baseline._replace(results=tuple(r._replace(latencies=(r.latencies[0] / 2,)) for r in report.results))
+        assert len(report.compare(faster)) == len(report.results)
+        assert not report.compare(faster, tolerance=100)
+        with pytest.raises(forml.InvalidError, match='Incomparable'):
+            report.compare(faster._replace(spec=runtime.Benchmark.Spec()))
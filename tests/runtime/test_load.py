@@ -0,0 +1,96 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Runtime load test unit tests.
+"""
+import json
+import pathlib
+import types
+
+import pytest
+
+import forml
+from forml import runtime
+from forml.runtime import _bench, _load
+
+
+class TestInventory:
+    """Load test inventory unit tests."""
+
+    def test_readonly(self):
+        """Test the inventory is read-only."""
+        inventory = _load.Inventory()
+        assert not list(inventory.list())
+        with pytest.raises(forml.MissingError):
+            inventory.get('foo')
+        with pytest.raises(forml.InvalidError, match='Read-only inventory'):
+            inventory.put(None)
+
+
+class TestLoadTest:
+    """Load test unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='session')
+    def report() -> runtime.LoadTest.Report:
+        """Load test report fixture."""
+        pytest.importorskip('uvicorn')
+        spec = runtime.LoadTest.Spec(requests=20, concurrency=2, rate=200, rows=3)
+        workload = runtime.Benchmark.Spec(depth=1, rows=100, columns=2)
+        return runtime.LoadTest(spec, workload, encodings=['text/csv'], warmup=2, processes=1, codec='thread')()
+
+    def test_report(self, report: runtime.LoadTest.Report, tmp_path: pathlib.Path):
+        """Test the load test results."""
+        assert [r.case for r in report.results] == ['engine:text/csv', 'rest:text/csv']
+        for result in report.results:
+            assert len(result.latencies) == 20
+            assert not result.errors
+            assert result.percentile(99) >= result.percentile(50) > 0
+            assert result.throughput > 0
+            assert set(result.stages) == set(runtime.LoadTest.STAGES)
+        assert all(r.case in str(report) for r in report.results)
+        path = tmp_path / 'report.json'
+        report.dump(path)
+        with path.open(encoding='utf-8') as file:
+            assert len(json.load(file)['results']) == 2
+
+    def test_invalid(self):
+        """Test the invalid specs."""
+        with pytest.raises(forml.InvalidError, match='Invalid load spec'):
+            runtime.LoadTest(runtime.LoadTest.Spec(rate=0))
+        with pytest.raises(forml.InvalidError, match='Invalid load test targets'):
+            runtime.LoadTest(targets=['grpc'])
+
+    def test_cleanup(self, monkeypatch: pytest.MonkeyPatch):
+        """Test the generated project gets removed after the run."""
+        monkeypatch.setattr(_bench.Benchmark, 'feed', classmethod(lambda c, s: None))
+        monkeypatch.setattr(runtime.Virtual, '__call__', lambda *_, **__: types.SimpleNamespace(train=lambda: None))
+        paths = []
+        artifact = runtime.LoadTest.artifact
+
+        def generate(workload: runtime.Benchmark.Spec, path: pathlib.Path):
+            paths.append(path)
+            return artifact(workload, path)
+
+        monkeypatch.setattr(runtime.LoadTest, 'artifact', staticmethod(generate))
+        loadtest = runtime.LoadTest()
+        with pytest.raises(RuntimeError, match='Interrupted'):
+            with loadtest._project():  # pylint: disable=protected-access
+                assert (paths[0] / runtime.LoadTest.PACKAGE / 'pipeline.py').exists()
+                raise RuntimeError('Interrupted')
+        assert not paths[0].exists()
@@ -0,0 +1,137 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Runtime performance reporting tests.
+"""
+import json
+import pathlib
+import pickle
+
+import numpy
+import pandas
+import pytest
+
+import forml
+from forml import flow, io, runtime
+from forml.io import asset
+from forml.provider.runner import dask
+from forml.runtime import _perf
+
+
+class TestCollector:
+    """Collector unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function')
+    def collector() -> _perf.Collector:
+        """Collector fixture."""
+        return _perf.Collector()
+
+    def test_snapshot(self, collector: _perf.Collector, valid_instance: asset.Instance):
+        """Snapshot test."""
+        collector.request('foo')
+        collector.enqueue('foo', valid_instance)
+        collector.observe('predict', 0.003, 'foo', valid_instance)
+        collector.observe('predict', 100, 'foo', valid_instance)
+        stats = collector.snapshot()
+        assert stats.applications['foo'].pending == stats.instances[repr(valid_instance)].pending == 1
+        histogram = stats.applications['foo'].latency['predict']
+        assert histogram.count == 2
+        assert histogram.sum == 100.003
+        assert histogram.buckets[3] == histogram.buckets[-1] == 1
+        collector.dequeue('foo', valid_instance)
+        collector.error('foo', valid_instance)
+        assert collector.snapshot() is stats  # cached
+        stats = collector.snapshot(fresh=True)
+        assert stats.applications['foo'] == stats.instances[repr(valid_instance)]
+        assert stats.applications['foo'].errors == 1
+        assert stats.applications['foo'].pending == 0
+        assert pickle.loads(pickle.dumps(stats)) == stats
+
+
+class TestStats:
+    """Stats unit tests."""
+
+    def test_prometheus(self):
+        """Prometheus format test."""
+        histogram = _perf.Stats.Histogram((1, 0, 2) + (0,) * (len(_perf.Stats.Histogram.BOUNDS) - 3), 0.01)
+        stats = _perf.Stats({'foo': _perf.Stats.Metrics(3, 1, 0, {'predict': histogram})})
+        text = stats.to_prometheus()
+        assert 'forml_requests_total{application="foo"} 3' in text
+        assert 'forml_errors_total{application="foo"} 1' in text
+        assert 'forml_latency_seconds_bucket{application="foo",stage="predict",le="0.001"} 1' in text
+        assert 'forml_latency_seconds_bucket{application="foo",stage="predict",le="+Inf"} 3' in text
+        assert 'forml_latency_seconds_count{application="foo",stage="predict"} 3' in text
+        assert _perf.Stats().to_prometheus().startswith('# HELP')
+
+
+class TestProfiler:
+    """Profiler unit tests."""
+
+    @staticmethod
+    @pytest.fixture(scope='function', params=('threaded', 'multiprocessing'))
+    def runner(
+        request: pytest.FixtureRequest, valid_instance: asset.Instance, feed_instance: io.Feed, sink_instance: io.Sink
+    ) -> runtime.Runner:
+        """Runner fixture."""
+        return dask.Runner(valid_instance, feed_instance, sink_instance, scheduler=request.param)
+
+    def test_profile(self, runner: runtime.Runner, tmp_path: pathlib.Path):
+        """Test the profile collection."""
+        runner.apply()
+        assert _perf.Profiler.current() is None
+        profiler = _perf.Profiler()
+        with profiler:
+            assert _perf.Profiler.current() is profiler
+            runner.apply()
+        assert _perf.Profiler.current() is None
+        profile = profiler.profile
+        assert profile.samples
+        assert all(s.wall >= 0 and s.input >= 0 for s in profile.samples)
+        assert sum(m.calls for m in profile.instructions.values()) == len(profile.samples)
+        assert 'calls' in str(profile)
+        path = tmp_path / 'trace.json'
+        profiler.dump(path)
+        trace = json.loads(path.read_text())
+        assert len(trace['traceEvents']) == len(profile.samples)
+        assert {e['ph'] for e in trace['traceEvents']} == {'X'}
+
+    def test_record(self):
+        """Test the samples spooling."""
+        sample = flow.Instrument.Sample('foo', 0, 1, 1, 0, 0, 0, 0, 0)
+        with _perf.Profiler() as profiler:
+            profiler.record(sample)
+            handle = profiler._handle
+            profiler.record(sample)
+            assert profiler._handle is handle  # kept open
+            pickle.loads(pickle.dumps(profiler)).record(sample)
+        assert handle.closed
+        assert len(profiler.profile.samples) == 3
+
+    def test_reentry(self):
+        """Test the reentry protection."""
+        with _perf.Profiler() as profiler:
+            with pytest.raises(forml.UnexpectedError, match='already active'):
+                profiler.__enter__()
+
+    def test_sizeof(self):
+        """Test the payload size estimation."""
+        assert _perf.Profiler.sizeof(numpy.zeros(10)) == 80
+        assert _perf.Profiler.sizeof(b'abc') == 3
+        assert _perf.Profiler.sizeof(pandas.DataFrame({'a': numpy.zeros(10)})) >= 80
+        assert _perf.Profiler.sizeof([b'abc'] * 1000) >= 3000